@@ -1,23 +1,131 @@
+import threading
+from typing import Any, Callable, Dict, Optional
+
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
 from sqlalchemy.exc import SQLAlchemyError
 from app.config import settings
 
 Base = declarative_base()
 
-def get_engine(database_url: str = settings.DATABASE_URL):
+def engine_options(database_url: str) -> Dict[str, Any]:
+    """Build create_engine kwargs from Settings for the given URL."""
+    options: Dict[str, Any] = {
+        "echo": settings.DB_ECHO,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+    # SQLite uses a single-file/in-memory pool where sizing doesn't apply
+    if make_url(database_url).get_backend_name() != "sqlite":
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+        )
+    return options
+
+def get_engine(database_url: Optional[str] = None):
+    database_url = database_url or settings.DATABASE_URL
     try:
-        return create_engine(database_url, echo=True)
+        return create_engine(database_url, **engine_options(database_url))
     except SQLAlchemyError as e:    # pragma: no cover
         print(f"Error creating engine: {e}")
         raise
 
-engine = get_engine()
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def get_async_url(database_url: str) -> str:
+    """Map a sync DATABASE_URL onto its asyncio driver (asyncpg / aiosqlite)."""
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend == "postgresql":
+        url = url.set(drivername="postgresql+asyncpg")
+    elif backend == "sqlite":
+        url = url.set(drivername="sqlite+aiosqlite")
+    return url.render_as_string(hide_password=False)
+
+def get_async_engine(database_url: Optional[str] = None):
+    async_url = get_async_url(database_url or settings.DATABASE_URL)
+    try:
+        return create_async_engine(async_url, **engine_options(async_url))
+    except SQLAlchemyError as e:    # pragma: no cover
+        print(f"Error creating async engine: {e}")
+        raise
+
+def pool_status(db_engine: Engine) -> Dict[str, Any]:
+    """Snapshot of connection pool usage, for sizing against worker counts."""
+    pool = db_engine.pool
+    status: Dict[str, Any] = {"pool": type(pool).__name__}
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        stat = getattr(pool, name, None)
+        status[name] = stat() if callable(stat) else None
+    return status
+
+# ---------------------------------------------------------
+# Shared engines / session factories, built on first use (or in the app
+# lifespan) so importing the app never loads a DB driver or touches the DB
+# ---------------------------------------------------------
+_shared: Dict[str, Any] = {}
+_shared_lock = threading.RLock()  # builders nest (sessionmaker -> engine)
+
+def _get_shared(name: str, build: Callable[[], Any]) -> Any:
+    value = _shared.get(name)
+    if value is None:
+        with _shared_lock:
+            value = _shared.get(name)
+            if value is None:
+                value = _shared[name] = build()
+    return value
+
+def default_engine() -> Engine:
+    return _get_shared("engine", get_engine)
+
+def get_sessionmaker() -> sessionmaker:
+    return _get_shared(
+        "SessionLocal",
+        lambda: sessionmaker(autocommit=False, autoflush=False, bind=default_engine()),
+    )
+
+# Async path, kept alongside the sync one so both can be compared under load
+def default_async_engine() -> AsyncEngine:
+    return _get_shared("async_engine", get_async_engine)
+
+def get_async_sessionmaker() -> async_sessionmaker:
+    return _get_shared(
+        "AsyncSessionLocal",
+        lambda: async_sessionmaker(
+            bind=default_async_engine(), class_=AsyncSession, autoflush=False, expire_on_commit=False
+        ),
+    )
+
+def new_session() -> Session:
+    """Session from the shared factory; pass as a session_factory to workers."""
+    return get_sessionmaker()()
+
+def init_engines() -> None:
+    """Build the shared engines up front (called from the app lifespan)."""
+    get_sessionmaker()
+    get_async_sessionmaker()
+
+def __getattr__(name: str) -> Any:
+    """Keep `from app.database import engine / SessionLocal / ...` working, lazily."""
+    lazy = {
+        "engine": default_engine,
+        "SessionLocal": get_sessionmaker,
+        "async_engine": default_async_engine,
+        "AsyncSessionLocal": get_async_sessionmaker,
+    }
+    if name in lazy:
+        return lazy[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def get_db():   
-    db = SessionLocal() # pragma: no cover
+    db = new_session() # pragma: no cover
     try:    # pragma: no cover
         yield db    
     finally:
         db.close() # pragma: no cover
+
+async def get_async_db():
+    async with get_async_sessionmaker()() as db:   # pragma: no cover
+        yield db    # pragma: no cover
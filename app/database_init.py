@@ -1,11 +1,18 @@
 # app/database_init.py
-from app.database import Base, engine
-from app.models import User
+from app.database import Base, default_engine
+import app.models  # noqa: F401  registers every table on Base.metadata
 
 def init_db():
     print("Creating all tables...")
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=default_engine())
+    # PostgreSQL: monthly partitions for calculations (no-op elsewhere)
+    from app.operations.calculation_partitions import ensure_partitions
+    ensure_partitions(default_engine())
 
 def drop_db():
     print("Dropping all tables...") # pragma: no cover
-    Base.metadata.drop_all(bind=engine) # pragma: no cover
+    Base.metadata.drop_all(bind=default_engine()) # pragma: no cover
+
+if __name__ == "__main__":  # pragma: no cover
+    # python -m app.database_init (run once per deploy, not on import)
+    init_db()
@@ -1,9 +1,9 @@
 # app/dependencies.py
-from app.database import SessionLocal
+from app.database import new_session
 
 # Standard dependency for FastAPI routes
 def get_db():
-    db = SessionLocal()
+    db = new_session()
     try:
         yield db
     finally:
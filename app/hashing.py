@@ -0,0 +1,114 @@
+# app/hashing.py
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property
+from typing import Any, Callable, Dict, Iterable, List
+
+from app.config import settings
+from app.metrics import current_request, metrics
+
+
+def bcrypt_safe(password: str) -> str:
+    """
+    bcrypt supports only 72 UTF-8 bytes. Trim long or non-ASCII inputs
+    to avoid ValueError: "password longer than 72 bytes".
+    """
+    encoded = password.encode("utf-8", errors="ignore")[:72]
+    return encoded.decode("utf-8", errors="ignore")
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a bounded thread pool (bcrypt releases the GIL) so that
+    hashing never blocks the request thread or the event loop.
+    Tracks queue depth and per-hash latency to make saturation visible.
+    """
+
+    def __init__(self, max_workers: int, rounds: int):
+        self.max_workers = max_workers
+        self.rounds = rounds
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._count = 0
+        self._total_seconds = 0.0
+        self._max_seconds = 0.0
+
+    @cached_property
+    def context(self):
+        """passlib (and the bcrypt backend) load on first use, not at import."""
+        from passlib.context import CryptContext
+        return CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=self.rounds)
+
+    # ---------------------------------------------------------
+    # Internal: every job goes through _submit -> _run
+    # ---------------------------------------------------------
+    def _run(self, stats, fn: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self._running -= 1
+                self._count += 1
+                self._total_seconds += elapsed
+                self._max_seconds = max(self._max_seconds, elapsed)
+            metrics.record_hashing(elapsed, stats)
+
+    def _submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        with self._lock:
+            self._queued += 1
+        # the pool doesn't carry contextvars over, so hand the request's stats along
+        return self._executor.submit(self._run, current_request(), fn, *args)
+
+    # ---------------------------------------------------------
+    # Blocking API (sync routes already run in FastAPI's threadpool)
+    # ---------------------------------------------------------
+    def hash(self, password: str) -> str:
+        return self._submit(self.context.hash, bcrypt_safe(password)).result()
+
+    def verify(self, password: str, password_hash: str) -> bool:
+        return self._submit(self.context.verify, bcrypt_safe(password), password_hash).result()
+
+    def hash_many(self, passwords: Iterable[str]) -> List[str]:
+        """Hash a batch across all workers at once; results keep input order."""
+        futures = [self._submit(self.context.hash, bcrypt_safe(p)) for p in passwords]
+        return [future.result() for future in futures]
+
+    # ---------------------------------------------------------
+    # Awaitable API (async routes)
+    # ---------------------------------------------------------
+    async def hash_async(self, password: str) -> str:
+        return await asyncio.wrap_future(self._submit(self.context.hash, bcrypt_safe(password)))
+
+    async def verify_async(self, password: str, password_hash: str) -> bool:
+        return await asyncio.wrap_future(
+            self._submit(self.context.verify, bcrypt_safe(password), password_hash)
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth and latency counters."""
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "queue_depth": self._queued,
+                "running": self._running,
+                "completed": self._count,
+                "mean_seconds": self._total_seconds / self._count if self._count else 0.0,
+                "max_seconds": self._max_seconds,
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.HASH_WORKERS, rounds=settings.BCRYPT_ROUNDS
+)
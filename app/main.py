@@ -1,12 +1,98 @@
 # app/main.py
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from app.routes.user_routes import router as user_router
+from fastapi.responses import ORJSONResponse, PlainTextResponse
+from app.config import settings
+from app.database import default_engine, init_engines, pool_status
+from app.hashing import password_hasher
+from app.metrics import InstrumentedRoute, MetricsMiddleware, metrics
+from app.operations.calculation_backfill import backfill_worker
+from app.operations.calculation_cache import calculation_cache
+from app.operations.calculation_executor import calculation_executor
+from app.operations.calculation_jobs import job_runner
+from app.operations.calculation_partitions import ensure_partitions, partition_maintenance, uses_partitions
+from app.operations.user_cache import user_cache
+from app.routes.user_routes import router as user_router, async_router as async_user_router
+from app.routes.calculation_routes import router as calculation_router
+from app.routes.job_routes import router as job_router
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Engines are built lazily; do it here so the first request doesn't pay
+    init_engines()
+    if settings.DB_CREATE_TABLES:
+        from app.database_init import init_db
+        init_db()
+    # Monthly partitions must exist before the first insert; afterwards keep
+    # creating upcoming ones and apply retention in the background
+    if uses_partitions(default_engine()):
+        ensure_partitions(default_engine())
+    if uses_partitions(default_engine()) or settings.CALC_RETENTION_MONTHS:
+        partition_maintenance.start()
+    # Deferred results are filled in the background while the app runs
+    if settings.LAZY_RESULTS:
+        backfill_worker.start()
+    # Background calculation jobs
+    job_runner.start()
+    yield
+    await job_runner.stop()
+    await backfill_worker.stop()
+    await partition_maintenance.stop()
+    calculation_executor.shutdown()
 
-app = FastAPI(title="Secure User API", version="0.1.0")
+# orjson instead of json.dumps for every response_model-serialized endpoint
+app = FastAPI(
+    title="Secure User API",
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+# Per-route latency, DB, framework and bcrypt time, served at /metrics
+app.router.route_class = InstrumentedRoute
+app.add_middleware(MetricsMiddleware)
 
 @app.get("/health")
 def health():
     return "OK"     # pragma: no cover
 
-# Include the user router
+@app.get("/health/db")
+def health_db():
+    """Report connection pool checked-in/checked-out counts."""
+    return pool_status(default_engine())
+
+@app.get("/health/hashing")
+def health_hashing():
+    """Report bcrypt worker pool queue depth and per-hash latency."""
+    return password_hasher.stats()
+
+@app.get("/health/cache")
+def health_cache():
+    """Report calculation cache hit/miss/eviction counters."""
+    return calculation_cache.stats()
+
+@app.get("/health/users")
+def health_users():
+    """Report user lookup cache hit ratio, 404 (negative) hits and coalesced misses."""
+    return user_cache.stats()
+
+@app.get("/health/backfill")
+def health_backfill():
+    """Report deferred-result backfill lag and throughput."""
+    return backfill_worker.stats()
+
+@app.get("/metrics", include_in_schema=False)
+def prometheus_metrics():
+    """Prometheus text exposition of the request, DB and bcrypt instruments."""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+@app.get("/health/partitions")
+def health_partitions():
+    """Report partition maintenance: partitions created, months/rows archived."""
+    return partition_maintenance.stats()
+
+# Include the user and calculation routers
 app.include_router(user_router)
+app.include_router(async_user_router)
+app.include_router(calculation_router)
+app.include_router(job_router)
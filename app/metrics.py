@@ -0,0 +1,333 @@
+# app/metrics.py
+"""
+Request-level performance instrumentation, exposed in Prometheus text format.
+
+- MetricsMiddleware (pure ASGI) times every request and labels it by route
+  template, method and status.
+- SQLAlchemy cursor events count queries and their time, globally and for
+  the current request, and optionally log slow queries.
+- Routes built with InstrumentedRoute report the time FastAPI spends around
+  the endpoint (request parsing and Pydantic validation, dependency setup,
+  response_model serialization) as the request's "framework" time.
+- PasswordHasher reports bcrypt time through record_hashing().
+
+Per-request totals live in a ContextVar, which follows the request into
+FastAPI's threadpool and into async DB calls.
+"""
+import asyncio
+import bisect
+import functools
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+
+slow_query_logger = logging.getLogger("app.slow_query")
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+Labels = Tuple[str, ...]
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{n}="{v}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Histogram:
+    """Cumulative-bucket histogram per label set (Prometheus semantics)."""
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        self._series: Dict[Labels, List[float]] = {}  # bucket counts..., sum, count
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [0] * (len(self.buckets) + 2)
+            if index < len(self.buckets):
+                series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} histogram"
+        with self._lock:
+            series = {k: list(v) for k, v in self._series.items()}
+        for label_values, counts in sorted(series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                le = _format_labels(self.labels, label_values, f'le="{bound}"')
+                yield f"{self.name}_bucket{le} {cumulative}"
+            inf = _format_labels(self.labels, label_values, 'le="+Inf"')
+            yield f"{self.name}_bucket{inf} {counts[-1]}"
+            yield f"{self.name}_sum{_format_labels(self.labels, label_values)} {_format_value(counts[-2])}"
+            yield f"{self.name}_count{_format_labels(self.labels, label_values)} {counts[-1]}"
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+
+class Counter:
+    """Monotonic counter per label set."""
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._values: Dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, *label_values: str) -> None:
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} counter"
+        with self._lock:
+            values = dict(self._values)
+        for label_values, value in sorted(values.items()):
+            yield f"{self.name}{_format_labels(self.labels, label_values)} {_format_value(value)}"
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class RequestStats:
+    """Totals accumulated while one request is being served."""
+    __slots__ = ("db_queries", "db_seconds", "handler_seconds", "endpoint_seconds", "hashing_seconds")
+
+    def __init__(self):
+        self.db_queries = 0
+        self.db_seconds = 0.0
+        self.handler_seconds = 0.0  # whole FastAPI route handler
+        self.endpoint_seconds = 0.0  # the endpoint function alone
+        self.hashing_seconds = 0.0
+
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def current_request() -> Optional[RequestStats]:
+    return _current.get()
+
+
+class Metrics:
+    """All instruments plus the Prometheus renderer."""
+
+    def __init__(self, enabled: bool = True, slow_query_ms: Optional[float] = None):
+        self.enabled = enabled
+        self.slow_query_ms = slow_query_ms
+        route = ("method", "route")
+        self.request_seconds = Histogram(
+            "app_request_duration_seconds", "Request latency by route.", (*route, "status"))
+        self.request_db_queries = Histogram(
+            "app_request_db_queries", "DB queries issued per request.", route, QUERY_COUNT_BUCKETS)
+        self.request_db_seconds = Counter(
+            "app_request_db_seconds_total", "Time spent in DB queries, by route.", route)
+        self.request_framework_seconds = Counter(
+            "app_request_framework_seconds_total",
+            "Time spent around the endpoint (request validation, dependency setup, "
+            "response serialization), by route.", route)
+        self.request_hashing_seconds = Counter(
+            "app_request_hashing_seconds_total", "Time spent in bcrypt, by route.", route)
+        self.db_query_seconds = Histogram("app_db_query_duration_seconds", "Latency of each DB query.")
+        self.hashing_seconds = Histogram("app_bcrypt_duration_seconds", "Latency of each bcrypt hash/verify.")
+        self.slow_queries = Counter("app_db_slow_queries_total", "Queries over the slow-query threshold.")
+
+    @property
+    def instruments(self):
+        return (
+            self.request_seconds, self.request_db_queries, self.request_db_seconds,
+            self.request_framework_seconds, self.request_hashing_seconds,
+            self.db_query_seconds, self.hashing_seconds, self.slow_queries,
+        )
+
+    def render(self) -> str:
+        return "\n".join(line for instrument in self.instruments for line in instrument.render()) + "\n"
+
+    def clear(self) -> None:
+        for instrument in self.instruments:
+            instrument.clear()
+
+    # ---------------------------------------------------------
+    # Recording hooks
+    # ---------------------------------------------------------
+    def record_query(self, seconds: float, statement: str) -> None:
+        if not self.enabled:
+            return
+        self.db_query_seconds.observe(seconds)
+        stats = _current.get()
+        if stats is not None:
+            stats.db_queries += 1
+            stats.db_seconds += seconds
+        if self.slow_query_ms is not None and seconds * 1000 >= self.slow_query_ms:
+            self.slow_queries.inc()
+            slow_query_logger.warning("slow query (%.1f ms): %s", seconds * 1000, " ".join(statement.split())[:1000])
+
+    def record_hashing(self, seconds: float, stats: Optional[RequestStats]) -> None:
+        if not self.enabled:
+            return
+        self.hashing_seconds.observe(seconds)
+        if stats is not None:
+            stats.hashing_seconds += seconds
+
+    def record_request(self, method: str, route: str, status: int, seconds: float, stats: RequestStats) -> None:
+        self.request_seconds.observe(seconds, method, route, str(status))
+        self.request_db_queries.observe(stats.db_queries, method, route)
+        self.request_db_seconds.inc(stats.db_seconds, method, route)
+        self.request_framework_seconds.inc(max(0.0, stats.handler_seconds - stats.endpoint_seconds), method, route)
+        self.request_hashing_seconds.inc(stats.hashing_seconds, method, route)
+
+
+metrics = Metrics(
+    enabled=settings.METRICS_ENABLED,
+    slow_query_ms=settings.SLOW_QUERY_MS if settings.SLOW_QUERY_LOG else None,
+)
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware: per-request timing and the per-request stats scope."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not metrics.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        stats = RequestStats()
+        token = _current.set(stats)
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            _current.reset(token)
+            # route template, not the raw path, to keep label cardinality bounded
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            metrics.record_request(scope["method"], route, status, elapsed, stats)
+
+
+# ---------------------------------------------------------
+# SQLAlchemy: every engine (sync, async, test) reports through these.
+# The start time lives on the execution context, so a statement that
+# raises leaves nothing behind on the pooled connection.
+# ---------------------------------------------------------
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._metrics_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, "_metrics_start", None)
+    if start is not None:
+        metrics.record_query(time.perf_counter() - start, statement)
+
+
+def set_enabled(enabled: bool) -> None:
+    """Turn instrumentation on or off; off also detaches the cursor listeners."""
+    metrics.enabled = enabled
+    for name, listener in (
+        ("before_cursor_execute", _before_cursor_execute),
+        ("after_cursor_execute", _after_cursor_execute),
+    ):
+        attached = event.contains(Engine, name, listener)
+        if enabled and not attached:
+            event.listen(Engine, name, listener)
+        elif not enabled and attached:
+            event.remove(Engine, name, listener)
+
+
+set_enabled(metrics.enabled)
+
+
+# ---------------------------------------------------------
+# FastAPI: time spent around the endpoint function
+# ---------------------------------------------------------
+def _timed_endpoint(endpoint: Callable) -> Callable:
+    """Wrap an endpoint (keeping its signature) to record its own run time."""
+    if getattr(endpoint, "_metrics_timed", False):
+        return endpoint  # include_router rebuilds routes from the wrapped endpoint
+    if asyncio.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def timed(*args, **kwargs):
+            stats = _current.get()
+            start = time.perf_counter()
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                if stats is not None:
+                    stats.endpoint_seconds += time.perf_counter() - start
+    else:
+        @functools.wraps(endpoint)
+        def timed(*args, **kwargs):
+            stats = _current.get()
+            start = time.perf_counter()
+            try:
+                return endpoint(*args, **kwargs)
+            finally:
+                if stats is not None:
+                    stats.endpoint_seconds += time.perf_counter() - start
+    timed._metrics_timed = True
+    return timed
+
+
+class InstrumentedRoute(APIRoute):
+    """
+    APIRoute that splits the route handler's time into the endpoint itself
+    and everything FastAPI does around it: parameter/body parsing and
+    Pydantic validation, dependency setup and response_model serialization.
+    Use as `APIRouter(route_class=InstrumentedRoute)`.
+    """
+
+    def __init__(self, path: str, endpoint: Callable, **kwargs: Any):
+        super().__init__(path, _timed_endpoint(endpoint), **kwargs)
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def timed_handler(request):
+            stats = _current.get()
+            if stats is None:
+                return await handler(request)
+            start = time.perf_counter()
+            try:
+                return await handler(request)
+            finally:
+                stats.handler_seconds += time.perf_counter() - start
+        return timed_handler
@@ -1,5 +1,7 @@
 # app/models/__init__.py
 from app.models.user import User
 from app.models.calculation import Calculation
+from app.models.calculation_stats import CalculationStats
+from app.models.calculation_job import CalculationJob
 
-__all__ = ["User", "Calculation"]
+__all__ = ["User", "Calculation", "CalculationStats", "CalculationJob"]
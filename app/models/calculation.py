@@ -5,16 +5,36 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Column, String, Float, DateTime, ForeignKey
+from sqlalchemy import Column, String, Float, DateTime, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from app.database import Base
+from app.operations.calculation_factory import CalculationFactory
 
 
 class Calculation(Base):
     __tablename__ = "calculations"
 
+    # On PostgreSQL the table is range-partitioned by created_at month (see
+    # app.operations.calculation_partitions), so the primary key has to
+    # include created_at; the ORM still identifies rows by id alone.
+    # Elsewhere (SQLite) it is one table with a created_at index.
+    __table_args__ = (
+        # Supports keyset pagination of a user's history on (user_id, created_at, id)
+        Index("ix_calculations_user_created_id", "user_id", "created_at", "id"),
+        # Time-range scans (recent history, retention)
+        Index("ix_calculations_created_at", "created_at"),
+        # Partial index over rows still waiting for a deferred result (LAZY_RESULTS)
+        Index(
+            "ix_calculations_pending_result",
+            "created_at",
+            postgresql_where=text("result IS NULL AND result_error IS NULL"),
+            sqlite_where=text("result IS NULL AND result_error IS NULL"),
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
     # Allow SQLAlchemy to skip strict typing checks
     __allow_unmapped__ = True
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -23,17 +43,25 @@ class Calculation(Base):
     a = Column(Float, nullable=False)
     b = Column(Float, nullable=False)
 
-    # operation type: "add", "sub", "multiply", "divide"
+    # operation type: "add", "sub", "multiply", "divide", "expression"
     type = Column(String(20), nullable=False)
 
-    # we choose to store result in the DB (could also be computed on demand)
+    # formula over a and b, only set when type == "expression"
+    expression = Column(String(500), nullable=True)
+
+    # stored result; NULL until computed when LAZY_RESULTS defers it
     result = Column(Float, nullable=True)
 
+    # set instead of result when a deferred computation fails
+    result_error = Column(String(255), nullable=True)
+
     # optional link to a user (foreign key into users.id)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
 
-    # timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # timestamps (also the partition key on PostgreSQL)
+    created_at = Column(DateTime, primary_key=True, default=datetime.utcnow, nullable=False)
+
+    __mapper_args__ = {"primary_key": [id]}
 
     # relationship back to User (optional but nice)
     user: Optional["User"] = relationship("User", back_populates="calculations")
@@ -43,18 +71,7 @@ class Calculation(Base):
     # --------------------------------------
     def compute_result(self) -> float:
         """Compute the result based on (a, b, type). Raises on invalid type or bad input."""
-        if self.type == "add":
-            return self.a + self.b
-        elif self.type == "sub":
-            return self.a - self.b
-        elif self.type == "multiply":
-            return self.a * self.b
-        elif self.type == "divide":
-            if self.b == 0:
-                raise ValueError("Division by zero is not allowed")
-            return self.a / self.b
-        else:
-            raise ValueError(f"Unsupported calculation type: {self.type}")
+        return CalculationFactory.create(self.type, self.expression).compute(self.a, self.b)
 
     def __repr__(self) -> str:  # for debugging/logging
         return (
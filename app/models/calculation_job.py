@@ -0,0 +1,49 @@
+# app/models/calculation_job.py
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import Column, String, Integer, DateTime, Text, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.database import Base
+
+
+class CalculationJob(Base):
+    """
+    A large calculation batch processed in the background.
+    The input and progress live here so a restarted worker can resume the
+    job from the last committed chunk.
+    """
+    __tablename__ = "calculation_jobs"
+    __table_args__ = (Index("ix_calculation_jobs_status_created", "status", "created_at"),)
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
+
+    # "queued", "running", "completed" or "failed"
+    status = Column(String(20), nullable=False, default="queued")
+
+    # columnar input as JSON: {"a": [...], "b": [...], "type": [...], "expression": [...]}
+    payload = Column(Text, nullable=False)
+    chunk_size = Column(Integer, nullable=False)
+
+    # progress
+    total = Column(Integer, nullable=False)
+    processed = Column(Integer, nullable=False, default=0)
+    inserted = Column(Integer, nullable=False, default=0)
+    failed = Column(Integer, nullable=False, default=0)
+    errors = Column(Text, nullable=True)  # JSON list of {"index", "error"}, capped
+    error = Column(Text, nullable=True)   # set when the whole job fails
+
+    # lease held by the worker currently processing the job
+    lease_owner = Column(String(64), nullable=True)
+    lease_expires_at = Column(DateTime, nullable=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<CalculationJob(id={self.id}, status={self.status}, {self.processed}/{self.total})>"
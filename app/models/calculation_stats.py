@@ -0,0 +1,203 @@
+# app/models/calculation_stats.py
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from sqlalchemy import Column, String, Float, Integer, DateTime, case, delete, event, func, select, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from sqlalchemy import inspect as sa_inspect
+
+from app.database import Base
+from app.models.calculation import Calculation
+
+StatsKey = Tuple[Any, str]
+
+
+class CalculationStats(Base):
+    """
+    Per-(user, type) summary of calculations, kept up to date on every
+    insert/delete so dashboards never have to GROUP BY the calculations table.
+    Intentionally has no FK to users: rows are maintained after the flush
+    that deletes a user's calculations.
+    """
+    __tablename__ = "calculation_stats"
+
+    user_id = Column(UUID(as_uuid=True), primary_key=True)
+    type = Column(String(20), primary_key=True)
+
+    # number of rows, and of rows that have a result (result may be NULL)
+    count = Column(Integer, nullable=False, default=0)
+    result_count = Column(Integer, nullable=False, default=0)
+
+    sum_result = Column(Float, nullable=True)
+    min_result = Column(Float, nullable=True)
+    max_result = Column(Float, nullable=True)
+    last_activity = Column(DateTime, nullable=True)
+
+    @property
+    def mean_result(self) -> Optional[float]:
+        if not self.result_count or self.sum_result is None:
+            return None
+        return self.sum_result / self.result_count
+
+    # ---------------------------------------------------------
+    # Incremental maintenance
+    # ---------------------------------------------------------
+    @staticmethod
+    def _aggregate(rows: Iterable[Mapping[str, Any]], count_rows: bool = True) -> List[Dict[str, Any]]:
+        groups: Dict[StatsKey, Dict[str, Any]] = {}
+        for row in rows:
+            if row.get("user_id") is None:
+                continue
+            key = (row["user_id"], row["type"])
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = {
+                    "user_id": key[0], "type": key[1], "count": 0, "result_count": 0,
+                    "sum_result": None, "min_result": None, "max_result": None,
+                    "last_activity": None,
+                }
+            if count_rows:
+                group["count"] += 1
+            result = row.get("result")
+            if result is not None:
+                group["result_count"] += 1
+                group["sum_result"] = (group["sum_result"] or 0.0) + result
+                group["min_result"] = result if group["min_result"] is None else min(group["min_result"], result)
+                group["max_result"] = result if group["max_result"] is None else max(group["max_result"], result)
+            created_at = row.get("created_at")
+            if created_at is not None and (group["last_activity"] is None or created_at > group["last_activity"]):
+                group["last_activity"] = created_at
+        return list(groups.values())
+
+    @classmethod
+    def apply_inserts(cls, conn: Connection, rows: Iterable[Mapping[str, Any]]) -> None:
+        """Fold newly inserted calculation rows into the summary with one upsert."""
+        cls._upsert(conn, cls._aggregate(rows))
+
+    @classmethod
+    def apply_results(cls, conn: Connection, rows: Iterable[Mapping[str, Any]]) -> None:
+        """Fold deferred results (previously NULL) of existing rows into the summary."""
+        cls._upsert(conn, cls._aggregate(
+            ({**row, "created_at": None} for row in rows if row.get("result") is not None),
+            count_rows=False,
+        ))
+
+    @classmethod
+    def _upsert(cls, conn: Connection, values: List[Dict[str, Any]]) -> None:
+        if not values:
+            return
+
+        dialect_insert = postgresql.insert if conn.dialect.name == "postgresql" else sqlite.insert
+        stmt = dialect_insert(cls.__table__)
+        table, new = cls.__table__.c, stmt.excluded
+
+        def pick(op, column):
+            # take the incoming value when there is no current one or it wins the comparison
+            return case((column.is_(None) | op(new[column.name], column), new[column.name]), else_=column)
+
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.user_id, table.type],
+            set_={
+                "count": table.count + new.count,
+                "result_count": table.result_count + new.result_count,
+                "sum_result": func.coalesce(table.sum_result, 0.0) + func.coalesce(new.sum_result, 0.0),
+                "min_result": pick(lambda x, y: x < y, table.min_result),
+                "max_result": pick(lambda x, y: x > y, table.max_result),
+                "last_activity": pick(lambda x, y: x > y, table.last_activity),
+            },
+        )
+        conn.execute(stmt, values)
+
+    @classmethod
+    def refresh(cls, conn: Connection, keys: Optional[Set[StatsKey]] = None) -> None:
+        """
+        Recompute the given (user_id, type) groups from calculations, or every
+        group when keys is None. Used after deletes/updates, where min/max
+        can't be maintained incrementally, and by the rebuild command.
+        """
+        if keys is not None:
+            keys = {key for key in keys if key[0] is not None}
+            if not keys:
+                return
+
+        calc = Calculation.__table__.c
+        recompute = (
+            select(
+                calc.user_id,
+                calc.type,
+                func.count().label("count"),
+                func.count(calc.result).label("result_count"),
+                func.sum(calc.result).label("sum_result"),
+                func.min(calc.result).label("min_result"),
+                func.max(calc.result).label("max_result"),
+                func.max(calc.created_at).label("last_activity"),
+            )
+            .where(calc.user_id.is_not(None))
+            .group_by(calc.user_id, calc.type)
+        )
+        clear = delete(cls.__table__)
+        if keys is not None:
+            recompute = recompute.where(tuple_(calc.user_id, calc.type).in_(keys))
+            clear = clear.where(tuple_(cls.user_id, cls.type).in_(keys))
+
+        values = [dict(row._mapping) for row in conn.execute(recompute)]
+        conn.execute(clear)
+        if values:
+            conn.execute(cls.__table__.insert(), values)
+
+    def __repr__(self) -> str:
+        return f"<CalculationStats(user_id={self.user_id}, type={self.type}, count={self.count})>"
+
+
+def _row(calc: Calculation) -> Dict[str, Any]:
+    return {"user_id": calc.user_id, "type": calc.type, "result": calc.result, "created_at": calc.created_at}
+
+
+def _is_result_fill(calc: Calculation) -> bool:
+    """True if the only change is a deferred result being filled in."""
+    state = sa_inspect(calc)
+    changed = {attr.key for attr in state.attrs if attr.history.has_changes()}
+    return changed <= {"result", "result_error"} and not any(
+        old is not None for old in state.attrs.result.history.deleted or []
+    )
+
+
+def _old_keys(calc: Calculation) -> Set[StatsKey]:
+    """(user_id, type) keys a modified calculation belonged to before this flush."""
+    state = sa_inspect(calc)
+    user_hist, type_hist = state.attrs.user_id.history, state.attrs.type.history
+    users = (user_hist.deleted or []) + (user_hist.unchanged or []) or [calc.user_id]
+    types = (type_hist.deleted or []) + (type_hist.unchanged or []) or [calc.type]
+    return {(u, t) for u in users for t in types}
+
+
+@event.listens_for(Session, "after_flush")
+def _maintain_calculation_stats(session: Session, flush_context) -> None:
+    """Keep calculation_stats in step with ORM inserts, updates and deletes."""
+    inserted = [obj for obj in session.new if isinstance(obj, Calculation)]
+    filled: List[Calculation] = []
+    stale: Set[StatsKey] = set()
+    for obj in session.deleted:
+        if isinstance(obj, Calculation):
+            stale.add((obj.user_id, obj.type))
+    for obj in session.dirty:
+        if isinstance(obj, Calculation) and session.is_modified(obj, include_collections=False):
+            if _is_result_fill(obj):
+                filled.append(obj)
+            else:
+                stale |= _old_keys(obj)
+                stale.add((obj.user_id, obj.type))
+
+    if not inserted and not filled and not stale:
+        return
+    conn = session.connection()
+    if inserted:
+        CalculationStats.apply_inserts(conn, [_row(obj) for obj in inserted])
+    if filled:
+        CalculationStats.apply_results(conn, [_row(obj) for obj in filled])
+    if stale:
+        CalculationStats.refresh(conn, stale)
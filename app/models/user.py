@@ -3,17 +3,14 @@ from datetime import datetime
 import uuid
 from typing import Dict, Any
 
-from sqlalchemy import Column, String, DateTime, Boolean
+from sqlalchemy import Column, String, DateTime, Boolean, select
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import validates, relationship
 
-from passlib.context import CryptContext
-
 from app.database import Base
+from app.hashing import password_hasher
 from app.schemas.base import UserCreate
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 
 class User(Base):
     __tablename__ = "users"
@@ -43,23 +40,26 @@ class User(Base):
     @staticmethod
     def hash_password(password: str) -> str:
         """
-        Securely hash a password. bcrypt supports only 72 UTF-8 bytes.
-        This implementation safely trims long or non-ASCII inputs
-        to avoid ValueError: "password longer than 72 bytes".
+        Securely hash a password on the bcrypt worker pool.
+        Long or non-ASCII inputs are trimmed to bcrypt's 72-byte limit.
         """
-        encoded = password.encode("utf-8", errors="ignore")[:72]
-        safe_pw = encoded.decode("utf-8", errors="ignore")
-        return pwd_context.hash(safe_pw)
+        return password_hasher.hash(password)
 
     def verify_password(self, plain_password: str) -> bool:
         """Verify plaintext password against the stored hash."""
-        encoded = plain_password.encode("utf-8", errors="ignore")[:72]
-        safe_pw = encoded.decode("utf-8", errors="ignore")
-        return pwd_context.verify(safe_pw, self.password_hash)
+        return password_hasher.verify(plain_password, self.password_hash)
+
+    async def verify_password_async(self, plain_password: str) -> bool:
+        """Awaitable verify_password for async login paths."""
+        return await password_hasher.verify_async(plain_password, self.password_hash)
 
     # ---------------------------------------------------------
     # Registration helper
     # ---------------------------------------------------------
+    @classmethod
+    def _conflict_filter(cls, validated: UserCreate):
+        return (cls.email == validated.email) | (cls.username == validated.username)
+
     @classmethod
     def register(cls, db, user_data: Dict[str, Any]) -> "User":
         """
@@ -69,9 +69,7 @@ class User(Base):
         validated = UserCreate.model_validate(user_data)
 
         # uniqueness check
-        existing = db.query(cls).filter(
-            (cls.email == validated.email) | (cls.username == validated.username)
-        ).first()
+        existing = db.query(cls).filter(cls._conflict_filter(validated)).first()
         if existing:
             raise ValueError("Username or email already exists.")
 
@@ -87,5 +85,26 @@ class User(Base):
         db.flush()  # generate id before commit
         return new_user
 
+    @classmethod
+    async def register_async(cls, db, user_data: Dict[str, Any]) -> "User":
+        """Async register(): same checks, hashing awaited on the worker pool."""
+        validated = UserCreate.model_validate(user_data)
+
+        result = await db.execute(select(cls).where(cls._conflict_filter(validated)))
+        if result.scalars().first():
+            raise ValueError("Username or email already exists.")
+
+        new_user = cls(
+            first_name=validated.first_name,
+            last_name=validated.last_name,
+            email=validated.email,
+            username=validated.username,
+            password_hash=await password_hasher.hash_async(validated.password),
+        )
+
+        db.add(new_user)
+        await db.flush()
+        return new_user
+
     def __repr__(self):
         return f"<User(username={self.username}, email={self.email})>"
@@ -1,2 +1,3 @@
-from .calculation_factory import CalculationFactory
+from .calculation_factory import CalculationFactory, BatchResult
 from .calculation_ops import AddOperation, SubOperation, MultiplyOperation, DivideOperation
+from .expression import Expression, ExpressionCompiler
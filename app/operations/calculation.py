@@ -0,0 +1,174 @@
+# app/operations/calculation.py
+import base64
+from contextlib import closing
+from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.models.calculation import Calculation
+from app.operations.calculation_factory import CalculationFactory
+from app.operations.calculation_cache import calculation_cache
+from app.schemas.calculation import CalculationCreate, CalculationPage, CalculationRead
+
+# Rows fetched per round trip when streaming a user's history
+STREAM_BATCH_SIZE = 1000
+
+# CalculationRead fields in response order, for column-only reads
+READ_COLUMNS = (
+    Calculation.a, Calculation.b, Calculation.type, Calculation.expression,
+    Calculation.user_id, Calculation.id, Calculation.result, Calculation.created_at,
+)
+
+def compute_calculation(data: CalculationCreate) -> float:
+    """Return the (memoized) result without touching the database."""
+    return calculation_cache.compute(data.type, data.a, data.b, data.expression)
+
+def create_calculation(db: Session, data: CalculationCreate) -> CalculationRead:
+    calc = Calculation(
+        a=data.a,
+        b=data.b,
+        type=data.type,
+        expression=data.expression,
+        # with LAZY_RESULTS the result is filled on first read or by the backfill worker
+        result=None if settings.LAZY_RESULTS else compute_calculation(data),
+        user_id=data.user_id,
+    )
+    db.add(calc)
+    db.commit()
+    db.refresh(calc)
+    return CalculationRead.model_validate(calc)
+
+def fill_missing_results(calcs: Sequence[Calculation]) -> List[Calculation]:
+    """
+    Compute deferred results (result IS NULL) for the given rows in one
+    vectorized pass and set them on the objects; failures go to
+    result_error. Returns the rows that changed. Does not commit.
+    """
+    pending = [c for c in calcs if c.result is None and c.result_error is None]
+    if not pending:
+        return []
+    computed = CalculationFactory.compute_rows(
+        [c.a for c in pending],
+        [c.b for c in pending],
+        [c.type for c in pending],
+        [c.expression for c in pending],
+    )
+    for calc, result, error in zip(pending, computed.results, computed.errors):
+        calc.result, calc.result_error = result, error
+    return pending
+
+def _fill_and_commit(db: Session, calcs: Sequence[Calculation]) -> None:
+    """Lazy-on-read: persist any results computed for these rows."""
+    if fill_missing_results(calcs):
+        db.commit()
+
+def get_calculation(db: Session, calc_id: UUID) -> Optional[CalculationRead]:
+    calc = db.get(Calculation, calc_id)
+    if not calc:
+        return None
+    _fill_and_commit(db, [calc])
+    return CalculationRead.model_validate(calc)
+
+def delete_calculation(db: Session, calc_id: UUID) -> bool:
+    calc = db.get(Calculation, calc_id)
+    if not calc:
+        return False
+    db.delete(calc)
+    db.commit()
+    return True
+
+# ---------------------------------------------------------
+# Keyset (cursor) pagination on (user_id, created_at, id)
+# ---------------------------------------------------------
+def encode_cursor(created_at: datetime, calc_id: UUID) -> str:
+    raw = f"{created_at.isoformat()}|{calc_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    try:
+        created_at, calc_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(calc_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+def iter_calculations(
+    db: Session,
+    user_id: UUID,
+    after: Optional[Tuple[datetime, UUID]] = None,
+    batch_size: int = STREAM_BATCH_SIZE,
+) -> Iterator[Calculation]:
+    """
+    Stream a user's calculations newest first, starting after the given
+    (created_at, id) key. Rows are fetched batch_size at a time via
+    yield_per, so memory stays bounded regardless of history size.
+    """
+    result = db.execute(_history_query(select(Calculation), user_id, after, batch_size))
+    try:
+        yield from result.scalars()
+    finally:
+        result.close()
+
+def _history_query(stmt, user_id: UUID, after: Optional[Tuple[datetime, UUID]], batch_size: int):
+    stmt = (
+        stmt.where(Calculation.user_id == user_id)
+        .order_by(Calculation.created_at.desc(), Calculation.id.desc())
+    )
+    if after is not None:
+        stmt = stmt.where(tuple_(Calculation.created_at, Calculation.id) < tuple_(*after))
+    return stmt.execution_options(yield_per=batch_size)
+
+def list_calculations(
+    db: Session,
+    user_id: UUID,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+) -> CalculationPage:
+    after = decode_cursor(cursor) if cursor else None
+    with closing(iter_calculations(db, user_id, after, batch_size=limit + 1)) as rows:
+        page = list(islice(rows, limit + 1))
+
+    next_cursor = None
+    if len(page) > limit:
+        page = page[:limit]
+        next_cursor = encode_cursor(page[-1].created_at, page[-1].id)
+    _fill_and_commit(db, page)
+
+    return CalculationPage(
+        items=[CalculationRead.model_validate(calc) for calc in page],
+        next_cursor=next_cursor,
+    )
+
+def list_calculation_rows(
+    db: Session,
+    user_id: UUID,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Same page as list_calculations, as plain JSON-ready dicts from a
+    column-only query: no ORM objects or Pydantic models are built unless
+    some rows still need a deferred result.
+    """
+    after = decode_cursor(cursor) if cursor else None
+    stmt = _history_query(select(*READ_COLUMNS), user_id, after, limit + 1).limit(limit + 1)
+    items = [row._asdict() for row in db.execute(stmt)]
+
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        next_cursor = encode_cursor(items[-1]["created_at"], items[-1]["id"])
+
+    missing = [row["id"] for row in items if row["result"] is None]
+    if missing:
+        calcs = db.scalars(select(Calculation).where(Calculation.id.in_(missing))).all()
+        _fill_and_commit(db, calcs)
+        results = {calc.id: calc.result for calc in calcs}
+        for row in items:
+            if row["result"] is None:
+                row["result"] = results.get(row["id"])
+
+    return {"items": items, "next_cursor": next_cursor}
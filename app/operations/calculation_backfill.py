@@ -0,0 +1,182 @@
+# app/operations/calculation_backfill.py
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import Float, String, bindparam, func, select, update, values, column
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.config import settings
+from app.database import new_session
+from app.models.calculation import Calculation
+from app.models.calculation_stats import CalculationStats
+from app.operations.calculation_factory import CalculationFactory
+
+logger = logging.getLogger(__name__)
+
+PENDING = Calculation.result.is_(None) & Calculation.result_error.is_(None)
+
+
+def _write_results(db: Session, rows: List[Dict[str, Any]]) -> None:
+    """
+    One UPDATE for the whole batch: UPDATE ... FROM (VALUES ...) on
+    PostgreSQL, an executemany UPDATE by primary key elsewhere (SQLite
+    can't alias VALUES columns).
+    """
+    table = Calculation.__table__
+    if db.get_bind().dialect.name == "postgresql":
+        batch = values(
+            column("id", UUID(as_uuid=True)),
+            column("result", Float),
+            column("result_error", String(255)),
+            name="batch",
+        ).data([(row["id"], row["result"], row["result_error"]) for row in rows])
+        db.execute(
+            update(table)
+            .where(table.c.id == batch.c.id)
+            .values(result=batch.c.result, result_error=batch.c.result_error)
+        )
+    else:
+        db.connection().execute(
+            update(table)
+            .where(table.c.id == bindparam("row_id"))
+            .values(result=bindparam("result"), result_error=bindparam("result_error")),
+            [{"row_id": row["id"], "result": row["result"], "result_error": row["result_error"]}
+             for row in rows],
+        )
+
+
+def backfill_batch(db: Session, batch_size: int) -> int:
+    """
+    Compute and store results for up to batch_size pending rows (oldest
+    first) in one vectorized pass. Concurrent workers on PostgreSQL skip
+    each other's locked rows. Returns the number of rows filled.
+    """
+    pending = db.execute(
+        select(
+            Calculation.id, Calculation.a, Calculation.b, Calculation.type,
+            Calculation.expression, Calculation.user_id,
+        )
+        .where(PENDING)
+        .order_by(Calculation.created_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    ).all()
+    if not pending:
+        db.rollback()
+        return 0
+
+    # compute_rows never raises for bad rows, so a row that can't be computed
+    # is marked with its error instead of failing this batch on every pass
+    computed = CalculationFactory.compute_rows(
+        [row.a for row in pending],
+        [row.b for row in pending],
+        [row.type for row in pending],
+        [row.expression for row in pending],
+    )
+    rows = [
+        {"id": row.id, "user_id": row.user_id, "type": row.type, "result": result, "result_error": error}
+        for row, result, error in zip(pending, computed.results, computed.errors)
+    ]
+    _write_results(db, rows)
+    # Core UPDATE bypasses the ORM flush hook, so fold results into the summary here
+    CalculationStats.apply_results(db.connection(), rows)
+    db.commit()
+    return len(rows)
+
+
+class BackfillWorker:
+    """
+    Fills deferred (NULL) results in the background, batch by batch.
+    Reports lag (pending rows, age of the oldest) and throughput.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session], batch_size: int, interval: float):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self.rows_filled = 0
+        self.batches = 0
+        self.busy_seconds = 0.0
+        self.last_run: Optional[datetime] = None
+
+    def run_once(self) -> int:
+        """Run a single batch; returns rows filled."""
+        start = time.perf_counter()
+        with self.session_factory() as db:
+            filled = backfill_batch(db, self.batch_size)
+        with self._lock:
+            self.busy_seconds += time.perf_counter() - start
+            self.rows_filled += filled
+            self.batches += 1 if filled else 0
+            self.last_run = datetime.utcnow()
+        return filled
+
+    def drain(self) -> int:
+        """Run batches until nothing is pending; returns rows filled."""
+        total = 0
+        while True:
+            filled = self.run_once()
+            total += filled
+            if filled < self.batch_size:
+                return total
+
+    async def run_forever(self) -> None:
+        while True:
+            try:
+                filled = await run_in_threadpool(self.run_once)
+            except Exception:  # pragma: no cover - keep the worker alive across DB hiccups
+                logger.exception("Backfill batch failed")
+                filled = 0
+            # keep going while there is a full batch of work, otherwise idle
+            if filled < self.batch_size:
+                await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self.run_forever())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def lag(self) -> Dict[str, Any]:
+        with self.session_factory() as db:
+            pending, oldest = db.execute(
+                select(func.count(), func.min(Calculation.created_at)).where(PENDING)
+            ).one()
+        return {
+            "pending_rows": pending,
+            "oldest_pending_seconds": (datetime.utcnow() - oldest).total_seconds() if oldest else 0.0,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = {
+                "running": self._task is not None and not self._task.done(),
+                "rows_filled": self.rows_filled,
+                "batches": self.batches,
+                "rows_per_second": self.rows_filled / self.busy_seconds if self.busy_seconds else 0.0,
+                "last_run": self.last_run.isoformat() if self.last_run else None,
+            }
+        stats.update(self.lag())
+        return stats
+
+
+backfill_worker = BackfillWorker(
+    session_factory=new_session,
+    batch_size=settings.BACKFILL_BATCH_SIZE,
+    interval=settings.BACKFILL_INTERVAL,
+)
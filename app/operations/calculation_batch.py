@@ -0,0 +1,258 @@
+# app/operations/calculation_batch.py
+"""
+Columnar in-memory representation of many calculations.
+
+A CalculationBatch holds one NumPy column per field instead of one Pydantic
+model and one ORM object per row: float64 a/b/result, a uint8 code per row
+into a small table of type names, an int32 code into a table of distinct
+expressions, packed 16-byte UUID columns and a datetime64 created_at.
+Validation, compute, persistence (bulk_insert_batch) and serialization all
+work on whole columns; CalculationRead converters are for small result sets.
+"""
+import os
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+from uuid import UUID
+
+import numpy as np
+
+from app.operations.calculation_executor import calculation_executor
+from app.schemas.calculation import (
+    CalculationRead,
+    _check_expression,
+    _invalid_type_error,
+    is_valid_type,
+)
+
+UUID_DTYPE = np.dtype((np.void, 16))
+NIL_UUID = bytes(16)
+MAX_TYPE_CODES = np.iinfo(np.uint8).max + 1
+
+
+def _pack_uuids(values: Iterable[Optional[UUID]], n: int) -> np.ndarray:
+    """Pack UUIDs into a 16-byte column; None becomes the nil UUID."""
+    packed = b"".join(NIL_UUID if v is None else v.bytes for v in values)
+    return np.frombuffer(packed, dtype=UUID_DTYPE).copy() if n else np.empty(0, UUID_DTYPE)
+
+
+def _unpack_uuid(value: np.void) -> Optional[UUID]:
+    raw = value.tobytes()
+    return None if raw == NIL_UUID else UUID(bytes=raw)
+
+
+def _random_uuid4s(n: int) -> np.ndarray:
+    """n random version-4 UUIDs generated in one call."""
+    raw = np.frombuffer(os.urandom(16 * n), dtype=np.uint8).reshape(n, 16).copy()
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80
+    return raw.view(UUID_DTYPE).reshape(n)
+
+
+class CalculationBatch:
+    """
+    Many calculations stored as columns; row i is (a[i], b[i], type_names[type_code[i]], ...).
+    `result[i]` is only meaningful where `has_result[i]` is True; ids and
+    created_at are unset (nil / NaT) until assign_ids() or persistence.
+    """
+
+    __slots__ = (
+        "a", "b", "type_code", "type_names", "expression_code", "expression_table",
+        "result", "has_result", "id", "user_id", "created_at",
+    )
+
+    def __init__(
+        self,
+        a: np.ndarray,
+        b: np.ndarray,
+        type_code: np.ndarray,
+        type_names: List[str],
+        expression_code: np.ndarray,
+        expression_table: List[str],
+        result: np.ndarray,
+        has_result: np.ndarray,
+        id: np.ndarray,
+        user_id: np.ndarray,
+        created_at: np.ndarray,
+    ):
+        self.a = a
+        self.b = b
+        self.type_code = type_code
+        self.type_names = type_names
+        self.expression_code = expression_code
+        self.expression_table = expression_table
+        self.result = result
+        self.has_result = has_result
+        self.id = id
+        self.user_id = user_id
+        self.created_at = created_at
+
+    # ---------------------------------------------------------
+    # Construction
+    # ---------------------------------------------------------
+    @classmethod
+    def from_columns(
+        cls,
+        a: Sequence[float],
+        b: Sequence[float],
+        types: Sequence[str],
+        expressions: Optional[Sequence[Optional[str]]] = None,
+        user_id: Optional[UUID] = None,
+    ) -> "CalculationBatch":
+        """
+        Build and validate a batch from plain columns. Types are normalized
+        and checked once per distinct value and each distinct expression is
+        compiled once; per-row domain errors (e.g. divide by zero) surface
+        from compute(), as they do for /calculations/batch.
+        """
+        n = len(a)
+        if not (n == len(b) == len(types)):
+            raise ValueError("a, b and type must have the same length")
+        if expressions is not None and len(expressions) != n:
+            raise ValueError("expression must have the same length as type")
+
+        type_names, type_code = np.unique(
+            np.char.lower(np.char.strip(np.asarray(types, dtype=str))), return_inverse=True
+        )
+        type_names = type_names.tolist()
+        if not all(is_valid_type(t) for t in type_names):
+            raise _invalid_type_error()
+        if len(type_names) > MAX_TYPE_CODES:
+            raise ValueError(f"A batch supports at most {MAX_TYPE_CODES} distinct types")
+
+        if expressions is None:
+            expression_table, expression_code = [], np.full(n, -1, dtype=np.int32)
+        else:
+            expression_table, expression_code = np.unique(
+                np.asarray(["" if e is None else e for e in expressions], dtype=str),
+                return_inverse=True,
+            )
+            expression_table = expression_table.tolist()
+            expression_code = expression_code.astype(np.int32)
+            if expression_table and expression_table[0] == "":  # "" sorts first
+                expression_table.pop(0)
+                expression_code -= 1
+        if "expression" in type_names:
+            is_expression = type_code == type_names.index("expression")
+            used = np.unique(expression_code[is_expression])
+            if used.size and used[0] == -1:
+                _check_expression(None)
+            for code in used.tolist():
+                _check_expression(expression_table[code])
+
+        owner = _pack_uuids([user_id], 1)[0] if user_id else np.void(NIL_UUID)
+        return cls(
+            a=np.asarray(a, dtype=np.float64),
+            b=np.asarray(b, dtype=np.float64),
+            type_code=type_code.astype(np.uint8),
+            type_names=type_names,
+            expression_code=expression_code,
+            expression_table=expression_table,
+            result=np.full(n, np.nan),
+            has_result=np.zeros(n, dtype=bool),
+            id=np.zeros(n, dtype=UUID_DTYPE),
+            user_id=np.full(n, owner, dtype=UUID_DTYPE),
+            created_at=np.full(n, np.datetime64("NaT"), dtype="datetime64[us]"),
+        )
+
+    @classmethod
+    def from_reads(cls, reads: Sequence[CalculationRead]) -> "CalculationBatch":
+        """Convert a small list of CalculationRead (or ORM rows) to columns."""
+        batch = cls.from_columns(
+            [r.a for r in reads],
+            [r.b for r in reads],
+            [r.type for r in reads],
+            [r.expression for r in reads],
+        )
+        n = len(reads)
+        batch.result = np.array([np.nan if r.result is None else r.result for r in reads], dtype=np.float64)
+        batch.has_result = np.array([r.result is not None for r in reads], dtype=bool)
+        batch.id = _pack_uuids((r.id for r in reads), n)
+        batch.user_id = _pack_uuids((r.user_id for r in reads), n)
+        batch.created_at = np.array([r.created_at for r in reads], dtype="datetime64[us]")
+        return batch
+
+    # ---------------------------------------------------------
+    # Column access
+    # ---------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self.a)
+
+    def __getitem__(self, index) -> "CalculationBatch":
+        """Slice or mask rows; the code tables are shared, not copied."""
+        return CalculationBatch(
+            a=self.a[index],
+            b=self.b[index],
+            type_code=self.type_code[index],
+            type_names=self.type_names,
+            expression_code=self.expression_code[index],
+            expression_table=self.expression_table,
+            result=self.result[index],
+            has_result=self.has_result[index],
+            id=self.id[index],
+            user_id=self.user_id[index],
+            created_at=self.created_at[index],
+        )
+
+    @property
+    def types(self) -> np.ndarray:
+        """Decoded type name per row."""
+        return np.asarray(self.type_names, dtype=str)[self.type_code] if len(self) else np.empty(0, str)
+
+    @property
+    def expressions(self) -> Optional[List[Optional[str]]]:
+        """Decoded expression per row, or None if the batch has no expressions."""
+        if not self.expression_table:
+            return None
+        table = [*self.expression_table, None]  # code -1 picks the trailing None
+        return [table[code] for code in self.expression_code.tolist()]
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the columns (code tables excluded)."""
+        return sum(getattr(self, name).nbytes for name in (
+            "a", "b", "type_code", "expression_code", "result", "has_result",
+            "id", "user_id", "created_at",
+        ))
+
+    # ---------------------------------------------------------
+    # Compute / persistence helpers
+    # ---------------------------------------------------------
+    def compute(self) -> np.ndarray:
+        """
+        Fill `result` for every row in one vectorized (possibly multi-process)
+        pass. Returns the error mask; failed rows keep has_result False.
+        """
+        computed = calculation_executor.compute_batch(self.a, self.b, self.types, self.expressions)
+        self.result = computed.results
+        self.has_result = ~computed.errors
+        return computed.errors
+
+    def assign_ids(self, now: Optional[datetime] = None) -> None:
+        """Fill unset ids (fresh uuid4s) and created_at in place."""
+        missing = self.id == np.void(NIL_UUID)
+        if missing.any():
+            self.id[missing] = _random_uuid4s(int(missing.sum()))
+        self.created_at[np.isnat(self.created_at)] = np.datetime64(now or datetime.utcnow(), "us")
+
+    def columns(self) -> Dict[str, List[Any]]:
+        """Plain-Python columns keyed like the calculations table, for serialization and inserts."""
+        return {
+            "id": [_unpack_uuid(v) for v in self.id],
+            "a": self.a.tolist(),
+            "b": self.b.tolist(),
+            "type": self.types.tolist(),
+            "expression": self.expressions or [None] * len(self),
+            "result": np.where(self.has_result, self.result, None).tolist(),
+            "user_id": [_unpack_uuid(v) for v in self.user_id],
+            "created_at": [None if np.isnat(t) else t.item() for t in self.created_at],
+        }
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """Row dicts built lazily from columns()."""
+        columns = self.columns()
+        for values in zip(*columns.values()):
+            yield dict(zip(columns, values))
+
+    def to_reads(self) -> List[CalculationRead]:
+        """Convert to CalculationRead models; intended for small result sets."""
+        return [CalculationRead.model_validate(row) for row in self.records()]
@@ -0,0 +1,167 @@
+# app/operations/calculation_bulk.py
+import csv
+import io
+import logging
+import time
+import uuid
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Mapping, NamedTuple, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.models.calculation import Calculation
+from app.models.calculation_stats import CalculationStats
+
+if TYPE_CHECKING:
+    from app.operations.calculation_batch import CalculationBatch
+
+logger = logging.getLogger(__name__)
+
+# Column order used for both executemany and COPY
+COPY_COLUMNS = ("id", "a", "b", "type", "expression", "result", "user_id", "created_at")
+
+
+class BulkInsertResult(NamedTuple):
+    """Summary of a bulk insert, used to track write throughput."""
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+
+def _prepare_rows(rows: Iterable[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Fill in id and created_at client-side so no per-row flush is needed
+    to get server/ORM defaults back.
+    """
+    now = datetime.utcnow()
+    return [
+        {
+            "id": row.get("id") or uuid.uuid4(),
+            "a": row["a"],
+            "b": row["b"],
+            "type": row["type"],
+            "expression": row.get("expression"),
+            "result": row.get("result"),
+            "user_id": row.get("user_id"),
+            "created_at": row.get("created_at") or now,
+        }
+        for row in rows
+    ]
+
+
+def _copy_value(value: Any) -> str:
+    """None becomes an empty (NULL) CSV field."""
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _copy_buffer(rows: List[Dict[str, Any]]) -> io.StringIO:
+    """Render rows as CSV for COPY ... FROM STDIN."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow(_copy_value(row[col]) for col in COPY_COLUMNS)
+    buffer.seek(0)
+    return buffer
+
+
+def _uses_copy(db: Session) -> bool:
+    """COPY FROM STDIN is only available through the psycopg2 driver."""
+    dialect = db.get_bind().dialect
+    return dialect.name == "postgresql" and dialect.driver == "psycopg2"
+
+
+def bulk_insert_calculations(
+    db: Session, rows: Iterable[Mapping[str, Any]], commit: bool = True
+) -> BulkInsertResult:
+    """
+    Persist many calculation rows in a single round trip and commit (unless
+    commit=False, to join a larger transaction), folding them into
+    calculation_stats in the same transaction.
+    Each row needs a, b, type and optionally expression, result, user_id,
+    id, created_at.
+    PostgreSQL (psycopg2) uses COPY FROM STDIN; everything else uses an
+    executemany INSERT.
+    """
+    start = time.perf_counter()
+    prepared = _prepare_rows(rows)
+    if prepared:
+        _write(db, lambda: prepared, lambda: _copy_buffer(prepared), commit)
+    return _finish(len(prepared), start)
+
+
+def bulk_insert_batch(db: Session, batch: "CalculationBatch", commit: bool = True) -> BulkInsertResult:
+    """
+    Persist a columnar CalculationBatch like bulk_insert_calculations, without
+    building a model per row: ids and created_at are filled column-wise and
+    COPY streams straight from the columns. Rows are inserted as they are;
+    drop failed rows first (e.g. batch[~errors]).
+    """
+    start = time.perf_counter()
+    if len(batch):
+        batch.assign_ids()
+        columns = batch.columns()
+
+        def rows() -> List[Dict[str, Any]]:
+            return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+        def copy_buffer() -> io.StringIO:
+            buffer = io.StringIO()
+            csv.writer(buffer).writerows(
+                [_copy_value(v) for v in row] for row in zip(*(columns[c] for c in COPY_COLUMNS))
+            )
+            buffer.seek(0)
+            return buffer
+
+        # the summary only needs these columns, streamed rather than materialized
+        stats_columns = ("user_id", "type", "result", "created_at")
+        stats_rows = (dict(zip(stats_columns, values)) for values in zip(*(columns[c] for c in stats_columns)))
+        _write(db, rows, copy_buffer, commit, stats_rows)
+    return _finish(len(batch), start)
+
+
+def _write(
+    db: Session,
+    rows: Callable[[], List[Dict[str, Any]]],
+    copy_buffer: Callable[[], io.StringIO],
+    commit: bool,
+    stats_rows: Optional[Iterable[Mapping[str, Any]]] = None,
+) -> None:
+    """
+    Insert through COPY or executemany; rows() and copy_buffer() are only
+    built for the path taken. stats_rows defaults to rows().
+    """
+    if _uses_copy(db):
+        cursor = db.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {Calculation.__tablename__} ({', '.join(COPY_COLUMNS)}) "
+                "FROM STDIN WITH (FORMAT csv)",
+                copy_buffer(),
+            )
+        finally:
+            cursor.close()
+    else:
+        inserted = rows()
+        db.execute(insert(Calculation), inserted)
+        stats_rows = inserted if stats_rows is None else stats_rows
+    # bulk inserts bypass the ORM flush hook, so update the summary here
+    CalculationStats.apply_inserts(db.connection(), rows() if stats_rows is None else stats_rows)
+    if commit:
+        db.commit()
+
+
+def _finish(rows: int, start: float) -> BulkInsertResult:
+    result = BulkInsertResult(rows=rows, seconds=time.perf_counter() - start)
+    logger.info(
+        "Inserted %d calculations in %.3fs (%.0f rows/s)",
+        result.rows, result.seconds, result.rows_per_second,
+    )
+    return result
@@ -0,0 +1,169 @@
+# app/operations/calculation_cache.py
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from app.config import settings
+from app.operations.calculation_factory import CalculationFactory
+from app.operations.registry import operation_registry
+
+CacheKey = Tuple[int, str, float, float, Optional[str]]
+
+
+class LRUCache:
+    """Bounded, thread-safe LRU with an optional per-entry TTL (seconds)."""
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    _MISSING = object()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key, self._MISSING)
+            if entry is self._MISSING:
+                self.misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at and expires_at < time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl else 0.0
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class LocalSharedBackend:
+    """
+    In-process stand-in for a shared cache such as Redis.
+    Implements the subset of the redis-py API used by CalculationCache
+    (get / set with ex=), so a real client can be swapped in unchanged.
+    """
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at and expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: str, value: str, ex: Optional[int] = None) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + ex if ex else 0.0, value)
+
+
+class CalculationCache:
+    """
+    Memoizes CalculationFactory results for (type, a, b, expression) under
+    the current operation registry version.
+    Lookup order: local LRU -> optional shared backend -> compute.
+    Errors (e.g. divide by zero) are never cached.
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None, backend: Any = None):
+        self.local = LRUCache(maxsize=maxsize, ttl=ttl)
+        self.ttl = ttl
+        self.backend = backend
+        self.shared_hits = 0
+
+    @staticmethod
+    def make_key(calc_type: str, a: float, b: float, expression: Optional[str] = None) -> CacheKey:
+        # registry version first: (un)registering an operation must not serve stale results
+        return (operation_registry.version, calc_type.lower(), float(a), float(b), expression)
+
+    @staticmethod
+    def _backend_key(key: CacheKey) -> str:
+        return "calc:v{}:{}:{!r}:{!r}:{}".format(*key[:4], key[4] or "")
+
+    def compute(self, calc_type: str, a: float, b: float, expression: Optional[str] = None) -> float:
+        key = self.make_key(calc_type, a, b, expression)
+        result = self.local.get(key)
+        if result is not None:
+            return result
+
+        if self.backend is not None:
+            shared = self.backend.get(self._backend_key(key))
+            if shared is not None:
+                self.shared_hits += 1
+                result = float(shared)
+                self.local.set(key, result)
+                return result
+
+        result = CalculationFactory.create(key[1], expression).compute(key[2], key[3])
+        self.local.set(key, result)
+        if self.backend is not None:
+            ttl = int(self.ttl) if self.ttl else None
+            self.backend.set(self._backend_key(key), repr(result), ex=ttl)
+        return result
+
+    def clear(self) -> None:
+        self.local.clear()
+        self.shared_hits = 0
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self.local.stats()
+        stats["shared_hits"] = self.shared_hits
+        stats["shared_backend"] = type(self.backend).__name__ if self.backend is not None else None
+        return stats
+
+
+def _shared_backend():
+    if not settings.CALC_CACHE_REDIS_URL:
+        return None
+    import redis  # optional dependency, only needed when a shared cache is configured
+    return redis.Redis.from_url(settings.CALC_CACHE_REDIS_URL, decode_responses=True)
+
+
+calculation_cache = CalculationCache(
+    maxsize=settings.CALC_CACHE_SIZE,
+    ttl=settings.CALC_CACHE_TTL or None,
+    backend=_shared_backend(),
+)
@@ -0,0 +1,137 @@
+# app/operations/calculation_executor.py
+"""
+Multi-core execution of large calculation batches.
+
+Large batches are split into contiguous shards and computed on a process
+pool. Columns travel through shared memory: workers attach to the input
+and output buffers by name and write their shard in place, so nothing but
+a few names and offsets is pickled, and results come back already in order.
+Small batches (or EXECUTOR_WORKERS=1) stay in-process.
+
+Workers are started with "spawn" (safe next to the app's threads); they see
+built-in and entry-point operations, not ones registered at runtime.
+"""
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.config import settings
+from app.operations.calculation_factory import BatchResult, CalculationFactory
+
+# (name, dtype) of each shared column, in the order passed to workers
+_COLUMNS = (("a", np.float64), ("b", np.float64), ("code", np.int32),
+            ("results", np.float64), ("errors", np.bool_))
+
+
+def _attach(name: str, dtype, n: int) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray((n,), dtype=dtype, buffer=shm.buf)
+
+
+def _compute_shard(names: Sequence[str], n: int, keys: Sequence[Tuple[str, Optional[str]]],
+                   start: int, stop: int) -> None:
+    """Worker: compute rows [start, stop) and write results/errors in place."""
+    attached: List[Tuple[shared_memory.SharedMemory, np.ndarray]] = []
+    try:
+        for name, (_, dtype) in zip(names, _COLUMNS):
+            attached.append(_attach(name, dtype, n))
+        _compute_rows(keys, *(arr[start:stop] for _, arr in attached))
+    finally:
+        # the shard's views died with _compute_rows; close whatever was attached
+        for shm, _ in attached:
+            shm.close()
+
+
+def _compute_rows(keys, a, b, code, results, errors) -> None:
+    for key_code in np.unique(code):
+        calc_type, expression = keys[key_code]
+        rows = code == key_code
+        results[rows], errors[rows] = CalculationFactory.create(calc_type, expression).compute_batch(
+            a[rows], b[rows]
+        )
+
+
+class CalculationExecutor:
+    """Runs CalculationFactory.compute_batch across a process pool for large batches."""
+
+    def __init__(self, workers: int, min_rows: int, shard_rows: Optional[int] = None):
+        self.workers = workers or os.cpu_count() or 1
+        self.min_rows = min_rows
+        self.shard_rows = shard_rows
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._pool
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+                self._pool = None
+
+    def _shards(self, n: int) -> List[Tuple[int, int]]:
+        size = self.shard_rows or -(-n // self.workers)
+        return [(start, min(start + size, n)) for start in range(0, n, size)]
+
+    def compute_batch(
+        self,
+        a: Sequence[float],
+        b: Sequence[float],
+        types: Sequence[str],
+        expressions: Optional[Sequence[Optional[str]]] = None,
+    ) -> BatchResult:
+        """Same contract as CalculationFactory.compute_batch."""
+        n = len(a)
+        if self.workers <= 1 or n < self.min_rows:
+            return CalculationFactory.compute_batch(a, b, types, expressions)
+        if not (n == len(b) == len(types)) or (expressions is not None and len(expressions) != n):
+            raise ValueError("a, b, type and expression must have the same length")
+
+        # encode (type, expression) as small-int codes; validate every key up front
+        type_arr = np.char.lower(np.asarray(types, dtype=str))
+        expr_arr = np.asarray(["" if e is None else e for e in (expressions or [None] * n)], dtype=str)
+        pairs, code = np.unique(np.char.add(np.char.add(type_arr, "\x1f"), expr_arr), return_inverse=True)
+        keys = []
+        for pair in pairs.tolist():
+            calc_type, _, expression = pair.partition("\x1f")
+            CalculationFactory.create(calc_type, expression or None)
+            keys.append((calc_type, expression or None))
+
+        blocks = []
+        try:
+            for (_, dtype), source in zip(_COLUMNS, (a, b, code, None, None)):
+                shm = shared_memory.SharedMemory(create=True, size=max(1, n * np.dtype(dtype).itemsize))
+                blocks.append(shm)
+                if source is not None:
+                    np.ndarray((n,), dtype=dtype, buffer=shm.buf)[:] = source
+
+            names = [shm.name for shm in blocks]
+            pool = self._get_pool()
+            futures = [pool.submit(_compute_shard, names, n, keys, start, stop)
+                       for start, stop in self._shards(n)]
+            for future in futures:
+                future.result()
+
+            results = np.ndarray((n,), dtype=np.float64, buffer=blocks[3].buf).copy()
+            errors = np.ndarray((n,), dtype=np.bool_, buffer=blocks[4].buf).copy()
+            return BatchResult(results, errors)
+        finally:
+            for shm in blocks:
+                shm.close()
+                shm.unlink()
+
+
+calculation_executor = CalculationExecutor(
+    workers=settings.EXECUTOR_WORKERS, min_rows=settings.EXECUTOR_MIN_ROWS
+)
@@ -0,0 +1,92 @@
+# app/operations/calculation_export.py
+import csv
+import io
+import json
+import zlib
+from typing import Any, Dict, Iterable, Iterator, List
+from uuid import UUID
+
+from sqlalchemy.orm import Session, object_session
+from app.models.calculation import Calculation
+from app.operations.calculation import fill_missing_results, iter_calculations
+
+EXPORT_COLUMNS = ("id", "a", "b", "type", "expression", "result", "user_id", "created_at")
+
+# Rows serialized per yielded chunk; bounds memory and per-chunk overhead
+EXPORT_CHUNK_ROWS = 1000
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+def _row(calc: Calculation) -> Dict[str, Any]:
+    return {
+        "id": str(calc.id),
+        "a": calc.a,
+        "b": calc.b,
+        "type": calc.type,
+        "expression": calc.expression,
+        "result": calc.result,
+        "user_id": str(calc.user_id) if calc.user_id else None,
+        "created_at": calc.created_at.isoformat(),
+    }
+
+def _rows(chunk: List[Calculation]) -> List[Dict[str, Any]]:
+    """
+    Serialize a chunk. Deferred results are computed for the export only:
+    the modified objects are expunged so they are neither persisted nor
+    kept alive by the session (the backfill worker persists results).
+    """
+    filled = fill_missing_results(chunk)
+    rows = [_row(calc) for calc in chunk]
+    for calc in filled:
+        object_session(calc).expunge(calc)
+    return rows
+
+def _chunks(calcs: Iterable[Calculation], size: int) -> Iterator[List[Dict[str, Any]]]:
+    chunk: List[Calculation] = []
+    for calc in calcs:
+        chunk.append(calc)
+        if len(chunk) >= size:
+            yield _rows(chunk)
+            chunk = []
+    if chunk:
+        yield _rows(chunk)
+
+def _ndjson(calcs: Iterable[Calculation]) -> Iterator[bytes]:
+    for chunk in _chunks(calcs, EXPORT_CHUNK_ROWS):
+        yield "".join(json.dumps(row) + "\n" for row in chunk).encode()
+
+def _csv(calcs: Iterable[Calculation]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    for chunk in _chunks(calcs, EXPORT_CHUNK_ROWS):
+        for row in chunk:
+            writer.writerow("" if row[col] is None else row[col] for col in EXPORT_COLUMNS)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():  # header only (no rows)
+        yield buffer.getvalue().encode()
+
+def _gzip(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+def export_calculations(
+    db: Session, user_id: UUID, fmt: str = "ndjson", compress: bool = False
+) -> Iterator[bytes]:
+    """
+    Stream all of a user's calculations as NDJSON or CSV bytes (optionally
+    gzipped). Rows come from a server-side cursor, so memory use does not
+    grow with history size. Closes the session when done.
+    """
+    try:
+        calcs = iter_calculations(db, user_id, batch_size=EXPORT_CHUNK_ROWS)
+        chunks = _csv(calcs) if fmt == "csv" else _ndjson(calcs)
+        yield from (_gzip(chunks) if compress else chunks)
+    finally:
+        db.close()
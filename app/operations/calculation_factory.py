@@ -1,27 +1,155 @@
-from app.operations.calculation_ops import (
-    AddOperation,
-    SubOperation,
-    MultiplyOperation,
-    DivideOperation,
-)
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+import app.operations.calculation_ops  # noqa: F401  registers the built-in operations
+from app.operations.expression import ExpressionCompiler
+from app.operations.registry import operation_registry
+
+
+class BatchResult(NamedTuple):
+    """Columnar output of CalculationFactory.compute_batch."""
+    results: np.ndarray  # float64, NaN where errors is True
+    errors: np.ndarray   # bool mask, True for rows that failed (e.g. divide by zero)
+
+
+class RowResults(NamedTuple):
+    """Per-row output of CalculationFactory.compute_rows."""
+    results: List[Optional[float]]  # None where errors[i] is set
+    errors: List[Optional[str]]     # why the row failed, None if it succeeded
+
+
+# For a masked row whose operation doesn't say why when computed on its own
+UNDEFINED_RESULT = "Result is undefined for these operands"
+
 
 class CalculationFactory:
     """Factory to return the correct operation class based on type."""
 
-    operation_map = {
-        "add": AddOperation,
-        "sub": SubOperation,
-        "multiply": MultiplyOperation,
-        "divide": DivideOperation,
-    }
+    # Live view of the operation registry (built-ins plus plugins)
+    operation_map = operation_registry
+
+    # Compiles "expression" calculations from the registered operations (cached)
+    expressions = ExpressionCompiler(operation_registry)
 
     @classmethod
-    def create(cls, calc_type: str):
+    def create(cls, calc_type: str, expression: Optional[str] = None):
         """
         Returns the correct operation CLASS.
         Tests expect only (type) -> class, not instantiation.
+        For type "expression" a compiled Expression is returned instead; it
+        has the same compute/compute_batch interface with (a, b) bound as
+        variables.
         """
+        if calc_type.lower() == "expression":
+            if not expression:
+                raise ValueError("An expression is required for type 'expression'")
+            return cls.expressions.compile(expression)
         op_class = cls.operation_map.get(calc_type.lower())
         if not op_class:
             raise ValueError(f"Invalid calculation type: {calc_type}")
         return op_class
+
+    @classmethod
+    def compute_batch(
+        cls,
+        a: Sequence[float],
+        b: Sequence[float],
+        types: Sequence[str],
+        expressions: Optional[Sequence[Optional[str]]] = None,
+    ) -> BatchResult:
+        """
+        Compute many calculations given as columns (a[i], b[i], types[i]).
+        Rows are grouped by operation (and by expression text for type
+        "expression") and each group is evaluated in one vectorized NumPy
+        pass. Per-row failures are reported in the error mask; an unknown
+        type or bad expression still raises ValueError for the whole batch.
+        """
+        a_arr = np.asarray(a, dtype=np.float64)
+        b_arr = np.asarray(b, dtype=np.float64)
+        type_arr = np.char.lower(np.asarray(types, dtype=str))
+        if not (len(a_arr) == len(b_arr) == len(type_arr)):
+            raise ValueError("a, b and type must have the same length")
+        if expressions is not None and len(expressions) != len(type_arr):
+            raise ValueError("expression must have the same length as type")
+
+        results = np.empty(len(a_arr), dtype=np.float64)
+        errors = np.zeros(len(a_arr), dtype=bool)
+        if len(a_arr) == 0:
+            return BatchResult(results, errors)
+
+        group_keys = type_arr
+        if expressions is not None:
+            expr_arr = np.asarray(["" if e is None else e for e in expressions], dtype=str)
+            group_keys = np.char.add(np.char.add(type_arr, "\x1f"), expr_arr)
+
+        group_values, group_index = np.unique(group_keys, return_inverse=True)
+        for code, key in enumerate(group_values):
+            calc_type, _, expression = str(key).partition("\x1f")
+            op = cls.create(calc_type, expression or None)
+            rows = group_index == code
+            results[rows], errors[rows] = op.compute_batch(a_arr[rows], b_arr[rows])
+
+        return BatchResult(results, errors)
+
+    @classmethod
+    def compute_rows(
+        cls,
+        a: Sequence[float],
+        b: Sequence[float],
+        types: Sequence[str],
+        expressions: Optional[Sequence[Optional[str]]] = None,
+    ) -> RowResults:
+        """
+        compute_batch for callers that store or report each row on its own.
+        Never raises for bad rows: a ValueError for a whole (type,
+        expression) group (e.g. an operation unregistered since the rows
+        were stored) fails just that group, and each failed row carries its
+        reason, recovered from the scalar compute() of the masked rows.
+        """
+        expressions = expressions if expressions is not None else [None] * len(types)
+        try:
+            return cls._rows(cls.compute_batch(a, b, types, expressions), a, b, types, expressions)
+        except ValueError:
+            pass
+
+        groups: Dict[Tuple[str, Optional[str]], List[int]] = {}
+        for i, key in enumerate(zip(types, expressions)):
+            groups.setdefault(key, []).append(i)
+        results: List[Optional[float]] = [None] * len(types)
+        errors: List[Optional[str]] = [None] * len(types)
+        for (calc_type, expression), indices in groups.items():
+            group_a = [a[i] for i in indices]
+            group_b = [b[i] for i in indices]
+            group_types = [calc_type] * len(indices)
+            group_expressions = [expression] * len(indices)
+            try:
+                computed = cls._rows(
+                    cls.compute_batch(group_a, group_b, group_types, group_expressions),
+                    group_a, group_b, group_types, group_expressions,
+                )
+            except ValueError as e:
+                for i in indices:
+                    errors[i] = str(e)
+                continue
+            for i, result, error in zip(indices, computed.results, computed.errors):
+                results[i], errors[i] = result, error
+        return RowResults(results, errors)
+
+    @classmethod
+    def _rows(cls, computed: BatchResult, a, b, types, expressions) -> RowResults:
+        results: List[Optional[float]] = computed.results.tolist()
+        errors: List[Optional[str]] = [None] * len(results)
+        for i in np.flatnonzero(computed.errors).tolist():
+            results[i] = None
+            errors[i] = cls.row_error(a[i], b[i], types[i], expressions[i])
+        return RowResults(results, errors)
+
+    @classmethod
+    def row_error(cls, a: float, b: float, calc_type: str, expression: Optional[str] = None) -> str:
+        """Why a row masked by compute_batch failed, from the scalar compute()."""
+        try:
+            cls.create(calc_type, expression).compute(a, b)
+        except (ValueError, ArithmeticError) as e:
+            return str(e) or UNDEFINED_RESULT
+        return UNDEFINED_RESULT
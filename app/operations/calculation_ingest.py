@@ -0,0 +1,170 @@
+# app/operations/calculation_ingest.py
+import csv
+import json
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.config import settings
+from app.operations.calculation_bulk import bulk_insert_calculations
+from app.operations.calculation_factory import CalculationFactory
+from app.schemas.calculation import IngestError, IngestSummary, calculation_create_list
+
+# Records validated, computed and inserted together
+INGEST_CHUNK_SIZE = 5000
+
+# Cap on per-line errors echoed back; the failed count is always exact
+MAX_REPORTED_ERRORS = 1000
+
+CSV_FIELDS = ("a", "b", "type", "user_id", "expression")
+
+Record = Tuple[int, Dict[str, Any]]
+
+
+async def iter_lines(stream: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, str]]:
+    """Split a byte stream into (line_number, text) without buffering the whole body."""
+    pending = b""
+    line_no = 0
+    async for chunk in stream:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            line_no += 1
+            yield line_no, line.decode("utf-8", errors="replace").rstrip("\r")
+    if pending:
+        yield line_no + 1, pending.decode("utf-8", errors="replace").rstrip("\r")
+
+
+def _parse_ndjson(line: str) -> Dict[str, Any]:
+    record = json.loads(line)
+    if not isinstance(record, dict):
+        raise ValueError("Expected a JSON object")
+    return record
+
+
+def _parse_csv(line: str, header: List[str]) -> Dict[str, Any]:
+    values = next(csv.reader([line]))
+    if len(values) != len(header):
+        raise ValueError(f"Expected {len(header)} columns, got {len(values)}")
+    return {key: (value or None) for key, value in zip(header, values)}
+
+
+def _validation_message(err: Dict[str, Any]) -> str:
+    field = ".".join(str(part) for part in err["loc"][1:])
+    return f"{field}: {err['msg']}" if field else err["msg"]
+
+
+def ingest_chunk(db: Session, records: List[Record]) -> Tuple[int, List[IngestError]]:
+    """
+    Validate a chunk with one TypeAdapter call, compute it in one vectorized
+    pass (skipped with LAZY_RESULTS) and write it with one bulk insert.
+    Returns (inserted, errors).
+    """
+    errors: List[IngestError] = []
+    try:
+        validated = calculation_create_list.validate_python([rec for _, rec in records])
+    except ValidationError as e:
+        bad = {}
+        for err in e.errors():
+            bad.setdefault(err["loc"][0], _validation_message(err))
+        errors = [IngestError(line=records[i][0], error=msg) for i, msg in sorted(bad.items())]
+        records = [rec for i, rec in enumerate(records) if i not in bad]
+        validated = calculation_create_list.validate_python([rec for _, rec in records])
+
+    if not validated:
+        return 0, errors
+
+    if settings.LAZY_RESULTS:
+        # results are deferred to first read / the backfill worker
+        rows = [
+            {"a": calc.a, "b": calc.b, "type": calc.type, "expression": calc.expression,
+             "user_id": calc.user_id}
+            for calc in validated
+        ]
+        return bulk_insert_calculations(db, rows).rows, errors
+
+    # a group that can't be computed at all fails only its own lines
+    computed = CalculationFactory.compute_rows(
+        [calc.a for calc in validated],
+        [calc.b for calc in validated],
+        [calc.type for calc in validated],
+        [calc.expression for calc in validated],
+    )
+    rows = []
+    for (line_no, _), calc, result, error in zip(records, validated, computed.results, computed.errors):
+        if error is not None:
+            errors.append(IngestError(line=line_no, error=error))
+            continue
+        rows.append({
+            "a": calc.a, "b": calc.b, "type": calc.type, "expression": calc.expression,
+            "result": result, "user_id": calc.user_id,
+        })
+
+    inserted = bulk_insert_calculations(db, rows).rows
+    return inserted, errors
+
+
+async def ingest_calculations(
+    db: Session,
+    stream: AsyncIterator[bytes],
+    fmt: str = "ndjson",
+    chunk_size: Optional[int] = None,
+) -> IngestSummary:
+    """
+    Parse an NDJSON or CSV upload incrementally and persist it chunk by chunk.
+    Bad lines are reported individually; they never fail the whole upload.
+    """
+    chunk_size = chunk_size or INGEST_CHUNK_SIZE
+    start = time.perf_counter()
+    received = inserted = failed = 0
+    errors: List[IngestError] = []
+    header: Optional[List[str]] = None
+    chunk: List[Record] = []
+
+    def record_errors(new_errors: List[IngestError]) -> None:
+        nonlocal failed
+        failed += len(new_errors)
+        errors.extend(new_errors[: max(0, MAX_REPORTED_ERRORS - len(errors))])
+
+    async def flush() -> None:
+        nonlocal inserted
+        if chunk:
+            chunk_inserted, chunk_errors = await run_in_threadpool(ingest_chunk, db, list(chunk))
+            inserted += chunk_inserted
+            record_errors(chunk_errors)
+            chunk.clear()
+
+    async for line_no, line in iter_lines(stream):
+        if not line.strip():
+            continue
+        if fmt == "csv" and header is None:
+            header = [col.strip() for col in next(csv.reader([line]))]
+            missing = set(CSV_FIELDS[:3]) - set(header)
+            if missing:
+                raise ValueError(f"CSV header missing columns: {', '.join(sorted(missing))}")
+            continue
+
+        received += 1
+        try:
+            record = _parse_csv(line, header) if fmt == "csv" else _parse_ndjson(line)
+        except ValueError as e:  # includes json.JSONDecodeError
+            record_errors([IngestError(line=line_no, error=str(e))])
+            continue
+
+        chunk.append((line_no, record))
+        if len(chunk) >= chunk_size:
+            await flush()
+    await flush()
+
+    seconds = time.perf_counter() - start
+    return IngestSummary(
+        received=received,
+        inserted=inserted,
+        failed=failed,
+        errors=sorted(errors, key=lambda err: err.line),
+        seconds=seconds,
+        rows_per_second=inserted / seconds if seconds > 0 else 0.0,
+    )
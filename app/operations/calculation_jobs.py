@@ -0,0 +1,270 @@
+# app/operations/calculation_jobs.py
+import asyncio
+import json
+import logging
+import os
+import threading
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.config import settings
+from app.database import new_session
+from app.models.calculation_job import CalculationJob
+from app.operations.calculation_batch import CalculationBatch
+from app.operations.calculation_bulk import bulk_insert_batch
+from app.operations.calculation_factory import CalculationFactory
+from app.schemas.job import JobCreate, JobRead, JobRowError
+
+logger = logging.getLogger(__name__)
+
+# Per-row errors kept on the job; the failed count is always exact
+MAX_JOB_ERRORS = 100
+
+
+def _claimable(now: datetime):
+    """Queued jobs, or running jobs whose worker stopped renewing its lease."""
+    return or_(
+        CalculationJob.status == "queued",
+        and_(CalculationJob.status == "running", CalculationJob.lease_expires_at < now),
+    )
+
+
+def submit_job(db: Session, data: JobCreate) -> JobRead:
+    job = CalculationJob(
+        user_id=data.user_id,
+        status="queued",
+        payload=json.dumps(
+            {"a": data.a, "b": data.b, "type": data.type, "expression": data.expression}
+        ),
+        chunk_size=settings.JOB_CHUNK_SIZE,
+        total=len(data.a),
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    return job_read(job)
+
+
+def job_read(job: CalculationJob) -> JobRead:
+    end = job.finished_at or datetime.utcnow()
+    elapsed = (end - job.started_at).total_seconds() if job.started_at else 0.0
+    return JobRead(
+        id=job.id,
+        status=job.status,
+        total=job.total,
+        processed=job.processed,
+        inserted=job.inserted,
+        failed=job.failed,
+        progress=job.processed / job.total if job.total else 1.0,
+        rows_per_second=job.processed / elapsed if elapsed > 0 else 0.0,
+        errors=[JobRowError(**err) for err in json.loads(job.errors or "[]")],
+        error=job.error,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+    )
+
+
+def get_job(db: Session, job_id: UUID) -> Optional[JobRead]:
+    job = db.get(CalculationJob, job_id)
+    return job_read(job) if job else None
+
+
+def claim_job(db: Session, owner: str, lease_seconds: float) -> Optional[UUID]:
+    """Take the oldest claimable job under a lease; None if there is none."""
+    now = datetime.utcnow()
+    job_id = db.execute(
+        select(CalculationJob.id)
+        .where(_claimable(now))
+        .order_by(CalculationJob.created_at)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    ).scalar()
+    if job_id is None:
+        db.rollback()
+        return None
+
+    claimed = db.execute(
+        update(CalculationJob)
+        .where(CalculationJob.id == job_id, _claimable(now))
+        .values(
+            status="running",
+            lease_owner=owner,
+            lease_expires_at=now + timedelta(seconds=lease_seconds),
+            started_at=func.coalesce(CalculationJob.started_at, now),
+        )
+    ).rowcount
+    db.commit()
+    return job_id if claimed else None
+
+
+def run_job(db: Session, job_id: UUID, owner: str, lease_seconds: float) -> bool:
+    """
+    Process a claimed job chunk by chunk from its last committed offset.
+    Each chunk's rows and the job's progress commit together, so a crash
+    never double-inserts; losing the lease stops this worker (returns False).
+    """
+    job = db.get(CalculationJob, job_id)
+    payload = json.loads(job.payload)
+    expressions = payload.get("expression")
+    errors: List[Dict[str, Any]] = json.loads(job.errors or "[]")
+
+    while job.processed < job.total:
+        start, stop = job.processed, min(job.processed + job.chunk_size, job.total)
+        batch = CalculationBatch.from_columns(
+            payload["a"][start:stop],
+            payload["b"][start:stop],
+            payload["type"][start:stop],
+            expressions[start:stop] if expressions else None,
+            user_id=job.user_id,
+        )
+        failed_rows = np.flatnonzero(batch.compute())
+        for i in failed_rows[: max(0, MAX_JOB_ERRORS - len(errors))].tolist():
+            row = start + i
+            error = CalculationFactory.row_error(
+                payload["a"][row], payload["b"][row], payload["type"][row], expressions[row] if expressions else None
+            )
+            errors.append({"index": row, "error": error})
+        failed = len(failed_rows)
+
+        inserted = bulk_insert_batch(db, batch[batch.has_result], commit=False).rows
+        renewed = db.execute(
+            update(CalculationJob)
+            .where(CalculationJob.id == job_id, CalculationJob.lease_owner == owner)
+            .values(
+                processed=stop,
+                inserted=CalculationJob.inserted + inserted,
+                failed=CalculationJob.failed + failed,
+                errors=json.dumps(errors),
+                lease_expires_at=datetime.utcnow() + timedelta(seconds=lease_seconds),
+            )
+        ).rowcount
+        if not renewed:  # another worker took over after our lease expired
+            db.rollback()
+            return False
+        db.commit()
+        db.refresh(job)
+
+    # guarded like the progress writes: a worker that lost its lease must not
+    # mark the job completed under the new owner
+    completed = db.execute(
+        update(CalculationJob)
+        .where(CalculationJob.id == job_id, CalculationJob.lease_owner == owner)
+        .values(status="completed", finished_at=datetime.utcnow(), lease_owner=None, lease_expires_at=None)
+    ).rowcount
+    if not completed:
+        db.rollback()
+        return False
+    db.commit()
+    return True
+
+
+def fail_job(db: Session, job_id: UUID, message: str, owner: Optional[str] = None) -> None:
+    """Mark a job failed; with owner, only while that worker still holds the lease."""
+    db.rollback()
+    stmt = update(CalculationJob).where(CalculationJob.id == job_id)
+    if owner is not None:
+        stmt = stmt.where(CalculationJob.lease_owner == owner)
+    db.execute(stmt.values(status="failed", error=message, finished_at=datetime.utcnow(), lease_owner=None))
+    db.commit()
+
+
+class JobRunner:
+    """
+    Pool of local asyncio workers that claim jobs from calculation_jobs and
+    run them on the threadpool. No external broker: the table is the queue.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        workers: int,
+        poll_interval: float,
+        lease_seconds: float,
+    ):
+        self.session_factory = session_factory
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.owner_prefix = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._tasks: List[asyncio.Task] = []
+        self._lock = threading.Lock()
+        self.jobs_completed = 0
+        self.jobs_failed = 0
+
+    def run_next(self, owner: Optional[str] = None) -> Optional[UUID]:
+        """Claim and fully process one job; returns its id, or None if idle."""
+        owner = owner or f"{self.owner_prefix}-sync"
+        with self.session_factory() as db:
+            job_id = claim_job(db, owner, self.lease_seconds)
+            if job_id is None:
+                return None
+            try:
+                completed = run_job(db, job_id, owner, self.lease_seconds)
+            except Exception as e:
+                logger.exception("Calculation job %s failed", job_id)
+                fail_job(db, job_id, str(e), owner)
+                with self._lock:
+                    self.jobs_failed += 1
+                return job_id
+        if completed:
+            with self._lock:
+                self.jobs_completed += 1
+        return job_id
+
+    def run_pending(self) -> int:
+        """Process jobs until the queue is empty; returns how many ran."""
+        count = 0
+        while self.run_next() is not None:
+            count += 1
+        return count
+
+    async def _worker(self, index: int) -> None:
+        owner = f"{self.owner_prefix}-{index}"
+        while True:
+            try:
+                job_id = await run_in_threadpool(self.run_next, owner)
+            except Exception:  # pragma: no cover - keep polling across DB hiccups
+                logger.exception("Job worker %s crashed while claiming", owner)
+                job_id = None
+            if job_id is None:
+                await asyncio.sleep(self.poll_interval)
+
+    def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._tasks = [t for t in self._tasks if not t.done()]
+        for index in range(len(self._tasks), self.workers):
+            self._tasks.append(loop.create_task(self._worker(index)))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": len([t for t in self._tasks if not t.done()]),
+                "jobs_completed": self.jobs_completed,
+                "jobs_failed": self.jobs_failed,
+            }
+
+
+job_runner = JobRunner(
+    session_factory=new_session,
+    workers=settings.JOB_WORKERS,
+    poll_interval=settings.JOB_POLL_INTERVAL,
+    lease_seconds=settings.JOB_LEASE_SECONDS,
+)
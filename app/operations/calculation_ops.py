@@ -1,24 +1,64 @@
-class AddOperation:
+import numpy as np
+
+from app.operations.registry import Operation, operation_registry
+
+
+@operation_registry.register("add")
+class AddOperation(Operation):
     @staticmethod
     def compute(a, b):
         return a + b
 
+    @staticmethod
+    def compute_batch(a, b):
+        """Vectorized add. Returns (results, error_mask)."""
+        return np.add(a, b), np.zeros(len(a), dtype=bool)
+
 
-class SubOperation:
+@operation_registry.register("sub")
+class SubOperation(Operation):
     @staticmethod
     def compute(a, b):
         return a - b
 
+    @staticmethod
+    def compute_batch(a, b):
+        """Vectorized subtract. Returns (results, error_mask)."""
+        return np.subtract(a, b), np.zeros(len(a), dtype=bool)
+
 
-class MultiplyOperation:
+@operation_registry.register("multiply")
+class MultiplyOperation(Operation):
     @staticmethod
     def compute(a, b):
         return a * b
 
+    @staticmethod
+    def compute_batch(a, b):
+        """Vectorized multiply. Returns (results, error_mask)."""
+        return np.multiply(a, b), np.zeros(len(a), dtype=bool)
 
-class DivideOperation:
+
+@operation_registry.register("divide")
+class DivideOperation(Operation):
     @staticmethod
-    def compute(a, b):
+    def check_domain(a, b):
         if b == 0:
             raise ValueError("Cannot divide by zero")
+
+    @staticmethod
+    def compute(a, b):
+        DivideOperation.check_domain(a, b)
         return a / b
+
+    @staticmethod
+    def compute_batch(a, b):
+        """
+        Vectorized divide. Rows with b == 0 are flagged in the error
+        mask (result NaN) instead of raising for the whole batch.
+        """
+        errors = b == 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            results = np.divide(a, b)
+        results[errors] = np.nan
+        return results, errors
@@ -0,0 +1,297 @@
+# app/operations/calculation_partitions.py
+"""
+Time partitioning and retention for the calculations table.
+
+On PostgreSQL `calculations` is declared `PARTITION BY RANGE (created_at)`
+with one partition per month (calculations_y2026m10, ...) plus a DEFAULT
+partition for anything outside them. ensure_partitions() keeps the current
+month and PARTITION_MONTHS_AHEAD months ahead in place, so inserts and
+recent-history queries only touch small, recent partitions.
+
+apply_retention() archives months older than CALC_RETENTION_MONTHS to
+gzipped CSV files (one per month) and removes them from the live table: on
+PostgreSQL the partition is detached, archived and dropped; on SQLite (one
+table plus a created_at index) the month's rows are archived and deleted by
+range. calculation_stats is a running summary and is not rewound.
+
+New databases get the partitioned table from init_db(); an existing
+unpartitioned PostgreSQL table must be migrated (renamed, recreated, copied)
+before these helpers apply.
+
+    python -m app.operations.calculation_partitions   # one maintenance pass
+"""
+import asyncio
+import csv
+import gzip
+import logging
+import os
+import re
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from sqlalchemy import column, func, select, table, text
+from sqlalchemy.engine import Connection, Engine
+from starlette.concurrency import run_in_threadpool
+
+from app.config import settings
+from app.database import default_engine
+from app.models.calculation import Calculation
+from app.operations.calculation_bulk import _copy_value
+
+logger = logging.getLogger(__name__)
+
+PARENT = Calculation.__tablename__
+DEFAULT_PARTITION = f"{PARENT}_default"
+ARCHIVE_COLUMNS = tuple(c.name for c in Calculation.__table__.columns)
+ARCHIVE_BATCH_ROWS = 10000
+
+_PARTITION_RE = re.compile(rf"^{PARENT}_y(\d{{4}})m(\d{{2}})$")
+
+
+class ArchivedMonth(NamedTuple):
+    """One month moved out of the live table."""
+    month: datetime
+    rows: int
+    path: str
+
+
+# ---------------------------------------------------------
+# Month arithmetic / naming
+# ---------------------------------------------------------
+def month_start(value: datetime) -> datetime:
+    return datetime(value.year, value.month, 1)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: datetime) -> str:
+    return f"{PARENT}_y{month.year:04d}m{month.month:02d}"
+
+
+def partition_month(name: str) -> Optional[datetime]:
+    """Month covered by a monthly partition name; None for anything else."""
+    match = _PARTITION_RE.match(name)
+    return datetime(int(match.group(1)), int(match.group(2)), 1) if match else None
+
+
+def partition_ddl(month: datetime) -> str:
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(month)} PARTITION OF {PARENT} "
+        f"FOR VALUES FROM ('{month.isoformat(sep=' ')}') TO ('{add_months(month, 1).isoformat(sep=' ')}')"
+    )
+
+
+def uses_partitions(engine: Engine) -> bool:
+    return engine.dialect.name == "postgresql"
+
+
+def list_partitions(conn: Connection) -> List[str]:
+    """Names of the partitions currently attached to calculations (PostgreSQL)."""
+    return list(conn.execute(text(
+        "SELECT child.relname FROM pg_inherits "
+        "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+        "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+        "WHERE parent.relname = :parent"
+    ), {"parent": PARENT}).scalars())
+
+
+# ---------------------------------------------------------
+# Partition creation
+# ---------------------------------------------------------
+def ensure_partitions(
+    engine: Engine, now: Optional[datetime] = None, ahead: int = settings.PARTITION_MONTHS_AHEAD
+) -> List[str]:
+    """
+    Create the partitions for the current month and `ahead` months after it
+    (and the DEFAULT partition) if missing. Returns the names created; a
+    no-op outside PostgreSQL.
+    """
+    if not uses_partitions(engine):
+        return []
+    current = month_start(now or datetime.utcnow())
+    created = []
+    with engine.begin() as conn:
+        existing = set(list_partitions(conn))
+        if DEFAULT_PARTITION not in existing:
+            conn.execute(text(f"CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION} PARTITION OF {PARENT} DEFAULT"))
+            created.append(DEFAULT_PARTITION)
+        for offset in range(ahead + 1):
+            month = add_months(current, offset)
+            if partition_name(month) not in existing:
+                conn.execute(text(partition_ddl(month)))
+                created.append(partition_name(month))
+    if created:
+        logger.info("Created calculation partitions: %s", ", ".join(created))
+    return created
+
+
+# ---------------------------------------------------------
+# Retention
+# ---------------------------------------------------------
+def _archive_path(archive_dir: str, month: datetime) -> str:
+    base = os.path.join(archive_dir, f"{partition_name(month)}.csv.gz")
+    path, n = base, 1
+    while os.path.exists(path):  # a later pass over the same month never overwrites
+        path = base.replace(".csv.gz", f".{n}.csv.gz")
+        n += 1
+    return path
+
+
+def _archive(conn: Connection, stmt, path: str) -> int:
+    """Stream stmt's rows into a gzipped CSV (written atomically); returns the row count."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.tmp"
+    rows = 0
+    result = conn.execution_options(stream_results=True, yield_per=ARCHIVE_BATCH_ROWS).execute(stmt)
+    with gzip.open(tmp, "wt", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(ARCHIVE_COLUMNS)
+        for batch in result.partitions():
+            writer.writerows([_copy_value(v) for v in row] for row in batch)
+            rows += len(batch)
+    os.replace(tmp, path)
+    return rows
+
+
+def _retain_partitions(engine: Engine, cutoff: datetime, archive_dir: str) -> List[ArchivedMonth]:
+    with engine.connect() as conn:
+        expired = sorted(
+            (month, name) for name in list_partitions(conn)
+            if (month := partition_month(name)) is not None and month < cutoff
+        )
+    archived = []
+    for month, name in expired:
+        # detach first so the live table stops seeing the month right away;
+        # if archiving fails the detached table is left in place, not lost
+        with engine.begin() as conn:
+            conn.execute(text(f"ALTER TABLE {PARENT} DETACH PARTITION {name}"))
+        path = _archive_path(archive_dir, month)
+        detached = table(name, *(column(c) for c in ARCHIVE_COLUMNS))
+        with engine.begin() as conn:
+            rows = _archive(conn, select(detached), path)
+            conn.execute(text(f"DROP TABLE {name}"))
+        archived.append(ArchivedMonth(month, rows, path))
+    return archived
+
+
+def _retain_rows(engine: Engine, cutoff: datetime, archive_dir: str) -> List[ArchivedMonth]:
+    calcs = Calculation.__table__
+    with engine.connect() as conn:
+        oldest = conn.execute(select(func.min(calcs.c.created_at))).scalar()
+    archived = []
+    month = month_start(oldest) if oldest else cutoff
+    while month < cutoff:
+        end = add_months(month, 1)
+        in_month = (calcs.c.created_at >= month) & (calcs.c.created_at < end)
+        with engine.begin() as conn:
+            if conn.execute(select(calcs.c.id).where(in_month).limit(1)).first() is not None:
+                path = _archive_path(archive_dir, month)
+                rows = _archive(conn, select(*calcs.columns).where(in_month), path)
+                conn.execute(calcs.delete().where(in_month))
+                archived.append(ArchivedMonth(month, rows, path))
+        month = end
+    return archived
+
+
+def apply_retention(
+    engine: Engine,
+    keep_months: int = settings.CALC_RETENTION_MONTHS,
+    archive_dir: str = settings.CALC_ARCHIVE_DIR,
+    now: Optional[datetime] = None,
+) -> List[ArchivedMonth]:
+    """
+    Archive and remove every month that started more than keep_months
+    months before the current one (keep_months <= 0 keeps everything).
+    """
+    if keep_months <= 0:
+        return []
+    cutoff = add_months(month_start(now or datetime.utcnow()), -keep_months)
+    if uses_partitions(engine):
+        archived = _retain_partitions(engine, cutoff, archive_dir)
+    else:
+        archived = _retain_rows(engine, cutoff, archive_dir)
+    for month in archived:
+        logger.info("Archived %d calculations from %s to %s", month.rows, month.month.strftime("%Y-%m"), month.path)
+    return archived
+
+
+# ---------------------------------------------------------
+# Background maintenance
+# ---------------------------------------------------------
+class PartitionMaintenance:
+    """Periodically creates upcoming partitions and applies retention."""
+
+    def __init__(
+        self,
+        engine_factory: Callable[[], Engine],
+        interval: float,
+        keep_months: int = settings.CALC_RETENTION_MONTHS,
+        archive_dir: str = settings.CALC_ARCHIVE_DIR,
+    ):
+        self.engine_factory = engine_factory
+        self.interval = interval
+        self.keep_months = keep_months
+        self.archive_dir = archive_dir
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self.partitions_created = 0
+        self.months_archived = 0
+        self.rows_archived = 0
+        self.last_run: Optional[datetime] = None
+
+    def run_once(self, now: Optional[datetime] = None) -> List[ArchivedMonth]:
+        engine = self.engine_factory()
+        created = ensure_partitions(engine, now)
+        archived = apply_retention(engine, self.keep_months, self.archive_dir, now)
+        with self._lock:
+            self.partitions_created += len(created)
+            self.months_archived += len(archived)
+            self.rows_archived += sum(month.rows for month in archived)
+            self.last_run = datetime.utcnow()
+        return archived
+
+    async def run_forever(self) -> None:
+        while True:
+            try:
+                await run_in_threadpool(self.run_once)
+            except Exception:  # pragma: no cover - retry on the next pass
+                logger.exception("Calculation partition maintenance failed")
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self.run_forever())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "running": self._task is not None and not self._task.done(),
+                "partitioned": uses_partitions(self.engine_factory()),
+                "partitions_created": self.partitions_created,
+                "months_archived": self.months_archived,
+                "rows_archived": self.rows_archived,
+                "last_run": self.last_run.isoformat() if self.last_run else None,
+            }
+
+
+partition_maintenance = PartitionMaintenance(
+    engine_factory=default_engine, interval=settings.PARTITION_MAINTENANCE_INTERVAL
+)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    logging.basicConfig(level=logging.INFO)
+    partition_maintenance.run_once()
@@ -0,0 +1,30 @@
+# app/operations/calculation_stats.py
+from typing import List
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.models.calculation_stats import CalculationStats
+from app.schemas.calculation import CalculationStatsRead
+
+def get_user_stats(db: Session, user_id: UUID) -> List[CalculationStatsRead]:
+    """Read a user's precomputed per-type stats (one row per operation type)."""
+    rows = db.execute(
+        select(CalculationStats)
+        .where(CalculationStats.user_id == user_id)
+        .order_by(CalculationStats.type)
+    ).scalars()
+    return [CalculationStatsRead.model_validate(row) for row in rows]
+
+def rebuild_stats(db: Session) -> int:
+    """Recompute calculation_stats from scratch. Returns the number of groups."""
+    CalculationStats.refresh(db.connection())
+    db.commit()
+    return db.query(CalculationStats).count()
+
+if __name__ == "__main__":  # pragma: no cover
+    # python -m app.operations.calculation_stats
+    from app.database import new_session
+
+    with new_session() as session:
+        print(f"Rebuilt calculation_stats: {rebuild_stats(session)} groups")
@@ -0,0 +1,134 @@
+# app/operations/registry.py
+"""
+Single registry of calculation operations.
+
+Built-in operations register themselves with the `@operation_registry.register`
+decorator. Third-party packages can add more without forking, either by
+calling the same decorator or by declaring an entry point:
+
+    [project.entry-points."calculation_service.operations"]
+    power = "my_package.ops:PowerOperation"
+
+Every dispatch site (CalculationFactory, schema validation, Calculation.compute_result)
+looks operations up here by name in O(1).
+"""
+import logging
+from importlib.metadata import entry_points
+from typing import Callable, Dict, Iterator, Mapping, Optional, Tuple, Type
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "calculation_service.operations"
+
+# Calculation.type is a String(20) column
+MAX_OPERATION_NAME_LENGTH = 20
+
+
+class Operation:
+    """
+    Base class for registered operations.
+    Subclasses implement `compute` (scalar) and may override `compute_batch`
+    (vectorized) and `check_domain`. Unary operations set arity = 1 and
+    ignore `b`.
+    """
+    arity: int = 2
+
+    @staticmethod
+    def check_domain(a, b) -> None:
+        """Raise ValueError if (a, b) is outside the operation's domain."""
+
+    @staticmethod
+    def compute(a, b):  # pragma: no cover - always overridden
+        raise NotImplementedError
+
+    @classmethod
+    def compute_batch(cls, a, b) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Fallback vectorized kernel: applies `compute` row by row and
+        masks rows that raise. Override with a NumPy kernel for speed.
+        """
+        results = np.empty(len(a), dtype=np.float64)
+        errors = np.zeros(len(a), dtype=bool)
+        for i, (x, y) in enumerate(zip(a, b)):
+            try:
+                results[i] = cls.compute(x, y)
+            except (ValueError, ArithmeticError):
+                results[i] = np.nan
+                errors[i] = True
+        return results, errors
+
+
+class OperationRegistry(Mapping):
+    """Name -> operation class. Behaves as a read-only mapping."""
+
+    def __init__(self, entry_point_group: Optional[str] = ENTRY_POINT_GROUP):
+        self._operations: Dict[str, Type[Operation]] = {}
+        self._entry_point_group = entry_point_group
+        self._entry_points_loaded = entry_point_group is None
+        # bumped on every change so caches built from the registry can invalidate
+        self.version = 0
+
+    def register(self, name: str, op_class: Optional[type] = None, *, replace: bool = False) -> Callable:
+        """Register an operation class under `name`. Usable as a decorator."""
+        key = name.strip().lower()
+        if not key or len(key) > MAX_OPERATION_NAME_LENGTH:
+            raise ValueError(f"Operation name must be 1-{MAX_OPERATION_NAME_LENGTH} characters")
+        if key == "expression":
+            raise ValueError("'expression' is reserved")
+
+        def decorator(cls: type) -> type:
+            if not callable(getattr(cls, "compute", None)):
+                raise TypeError(f"{cls.__name__} must define compute(a, b)")
+            if key in self._operations and self._operations[key] is not cls and not replace:
+                raise ValueError(f"Operation already registered: {key}")
+            self._operations[key] = cls
+            self.version += 1
+            return cls
+
+        return decorator(op_class) if op_class is not None else decorator
+
+    def unregister(self, name: str) -> None:
+        if self._operations.pop(name.lower(), None) is not None:
+            self.version += 1
+
+    def load_entry_points(self) -> None:
+        """Import operations advertised by installed packages (once)."""
+        if self._entry_points_loaded:
+            return
+        self._entry_points_loaded = True
+        for ep in entry_points(group=self._entry_point_group):
+            try:
+                loaded = ep.load()
+            except Exception:  # pragma: no cover - a broken plugin must not take the app down
+                logger.exception("Failed to load calculation operation %r", ep.name)
+                continue
+            # a class is registered under the entry point name; a module registers itself
+            if isinstance(loaded, type):
+                self.register(ep.name, loaded, replace=True)
+
+    def get(self, name: str, default=None):
+        if not self._entry_points_loaded:
+            self.load_entry_points()
+        return self._operations.get(name.lower(), default)
+
+    def __getitem__(self, name: str) -> Type[Operation]:
+        op_class = self.get(name)
+        if op_class is None:
+            raise KeyError(name)
+        return op_class
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self.get(name) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        self.load_entry_points()
+        return iter(self._operations)
+
+    def __len__(self) -> int:
+        self.load_entry_points()
+        return len(self._operations)
+
+
+operation_registry = OperationRegistry()
@@ -1,16 +1,233 @@
 # app/operations/user.py
-from sqlalchemy.orm import Session
-from typing import Optional
+import logging
+import time
+import uuid
+from datetime import datetime
+from sqlalchemy import insert, or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, aliased, raiseload, selectinload
+from typing import List, Optional, Sequence, Tuple
+from uuid import UUID
+from app.hashing import password_hasher
+from app.models.calculation import Calculation
 from app.models.user import User
-from app.schemas.user import UserRead
+from app.operations.calculation import encode_cursor, fill_missing_results
+from app.operations.user_cache import user_cache
+from app.schemas.calculation import CalculationRead
+from app.schemas.user import (
+    UserBulkResult,
+    UserBulkRowResult,
+    UserRead,
+    UserWithCalculations,
+    UserWithCalculationsPage,
+)
 from app.schemas.base import UserCreate
 
+logger = logging.getLogger(__name__)
+
 def create_user(db: Session, data: UserCreate) -> UserRead:
     new_user = User.register(db, data.model_dump())
     db.commit()
     db.refresh(new_user)
-    return UserRead.model_validate(new_user)
+    read = UserRead.model_validate(new_user)
+    user_cache.put(read)
+    return read
+
+def create_users_bulk(db: Session, users: Sequence[UserCreate]) -> UserBulkResult:
+    """
+    Register many users at once: one IN query finds usernames/emails that are
+    already taken, in-batch repeats are rejected (first occurrence wins), the
+    remaining passwords are hashed in parallel on the bcrypt pool and all new
+    rows go in with one executemany INSERT and one commit.
+    A conflicting concurrent registration makes the whole insert fail with
+    ValueError, like User.register.
+    """
+    start = time.perf_counter()
+    taken = db.execute(
+        select(User.email, User.username).where(or_(
+            User.email.in_({u.email for u in users}),
+            User.username.in_({u.username for u in users}),
+        ))
+    ).all()
+    taken_emails = {email for email, _ in taken}
+    taken_usernames = {username for _, username in taken}
+
+    results: List[UserBulkRowResult] = []
+    accepted: List[UserCreate] = []
+    seen_emails, seen_usernames = set(), set()
+    for index, user in enumerate(users):
+        if user.email in taken_emails or user.username in taken_usernames:
+            results.append(UserBulkRowResult(
+                index=index, status="conflict", error="Username or email already exists."
+            ))
+        elif user.email in seen_emails or user.username in seen_usernames:
+            results.append(UserBulkRowResult(
+                index=index, status="duplicate", error="Username or email repeated in this batch."
+            ))
+        else:
+            seen_emails.add(user.email)
+            seen_usernames.add(user.username)
+            accepted.append(user)
+            results.append(UserBulkRowResult(index=index, status="created", id=uuid.uuid4()))
+
+    if accepted:
+        now = datetime.utcnow()
+        ids = [r.id for r in results if r.status == "created"]
+        hashes = password_hasher.hash_many(u.password for u in accepted)
+        rows = [
+            {
+                "id": user_id, "first_name": u.first_name, "last_name": u.last_name,
+                "email": u.email, "username": u.username, "password_hash": password_hash,
+                "is_active": True, "created_at": now, "updated_at": now,
+            }
+            for user_id, u, password_hash in zip(ids, accepted, hashes)
+        ]
+        try:
+            db.execute(insert(User), rows)
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            raise ValueError("Username or email already exists.")
+        # Core inserts skip the session hooks; drop any cached 404s here
+        user_cache.invalidate({u.username for u in accepted}, set(ids))
+
+    seconds = time.perf_counter() - start
+    result = UserBulkResult(
+        created=len(accepted),
+        conflicts=len(users) - len(accepted),
+        results=results,
+        seconds=seconds,
+        rows_per_second=len(users) / seconds if seconds > 0 else 0.0,
+    )
+    logger.info(
+        "Registered %d of %d users in %.3fs (%.0f rows/s)",
+        result.created, len(users), result.seconds, result.rows_per_second,
+    )
+    return result
+
+def _load_user(db: Session, condition) -> Optional[UserRead]:
+    user = db.query(User).options(raiseload(User.calculations)).filter(condition).first()
+    return UserRead.model_validate(user) if user else None
 
 def get_user_by_username(db: Session, username: str) -> Optional[UserRead]:
-    user = db.query(User).filter(User.username == username).first()
+    """Read-through user_cache; concurrent misses share one query."""
+    return user_cache.get(
+        user_cache.username_key(username), lambda: _load_user(db, User.username == username)
+    )
+
+def get_user_by_id(db: Session, user_id: UUID) -> Optional[UserRead]:
+    return user_cache.get(user_cache.id_key(user_id), lambda: _load_user(db, User.id == user_id))
+
+# ---------------------------------------------------------
+# Users with their recent calculations embedded
+# ---------------------------------------------------------
+# Upper bound for calculations_limit on the embedding endpoints
+MAX_EMBEDDED_CALCULATIONS = 100
+
+def _recent_calculations(limit: int):
+    """
+    Loader option: selectinload User.calculations, but only each user's
+    `limit` + 1 newest rows (the extra row tells whether there are more).
+    The per-user cap is a correlated subquery served by the
+    (user_id, created_at, id) index; nothing below the calculations may
+    lazy-load.
+    """
+    recent = aliased(Calculation)
+    newest = (
+        select(recent.id)
+        .where(recent.user_id == Calculation.user_id)
+        .order_by(recent.created_at.desc(), recent.id.desc())
+        .limit(limit + 1)
+    )
+    return selectinload(User.calculations.and_(Calculation.id.in_(newest))).raiseload("*")
+
+def _with_calculations(
+    users: Sequence[User], limit: int
+) -> Tuple[List[UserWithCalculations], List[Calculation]]:
+    """
+    Build the embedded reads (newest first, capped) from loaded users; also
+    returns the rows whose deferred result was just filled in (not committed).
+    """
+    changed = fill_missing_results([c for u in users for c in u.calculations])
+    reads = []
+    for user in users:
+        calcs = sorted(user.calculations, key=lambda c: (c.created_at, c.id), reverse=True)
+        truncated = len(calcs) > limit
+        calcs = calcs[:limit]
+        reads.append(UserWithCalculations(
+            **UserRead.model_validate(user).model_dump(),
+            calculations=[CalculationRead.model_validate(c) for c in calcs],
+            calculations_truncated=truncated,
+            calculations_next_cursor=(
+                encode_cursor(calcs[-1].created_at, calcs[-1].id) if truncated and calcs else None
+            ),
+        ))
+    return reads, changed
+
+def get_user_with_calculations(
+    db: Session, username: str, calculations_limit: int = 20
+) -> Optional[UserWithCalculations]:
+    """
+    One user plus their newest calculations in two queries. When there are
+    more, calculations_next_cursor continues at GET /calculations/.
+    """
+    user = db.scalars(
+        select(User).options(_recent_calculations(calculations_limit)).where(User.username == username)
+    ).first()
+    if user is None:
+        return None
+    (read,), changed = _with_calculations([user], calculations_limit)
+    if changed:
+        db.commit()
+    return read
+
+def list_users_with_calculations(
+    db: Session,
+    limit: int = 50,
+    after: Optional[str] = None,
+    calculations_limit: int = 20,
+) -> UserWithCalculationsPage:
+    """
+    A page of users (ordered by username, keyset on username) with each
+    user's newest calculations: two queries however many users are on the
+    page, instead of one per user.
+    """
+    stmt = select(User).options(_recent_calculations(calculations_limit)).order_by(User.username)
+    if after is not None:
+        stmt = stmt.where(User.username > after)
+    users = db.scalars(stmt.limit(limit + 1)).all()
+    next_cursor = None
+    if len(users) > limit:
+        users = users[:limit]
+        next_cursor = users[-1].username
+    items, changed = _with_calculations(users, calculations_limit)
+    if changed:
+        db.commit()
+    return UserWithCalculationsPage(items=items, next_cursor=next_cursor)
+
+# ---------------------------------------------------------
+# Async variants (AsyncSession)
+# ---------------------------------------------------------
+async def create_user_async(db: AsyncSession, data: UserCreate) -> UserRead:
+    new_user = await User.register_async(db, data.model_dump())
+    await db.commit()
+    await db.refresh(new_user)
+    read = UserRead.model_validate(new_user)
+    user_cache.put(read)
+    return read
+
+async def _load_user_async(db: AsyncSession, condition) -> Optional[UserRead]:
+    result = await db.execute(select(User).options(raiseload(User.calculations)).where(condition))
+    user = result.scalars().first()
     return UserRead.model_validate(user) if user else None
+
+async def get_user_by_username_async(db: AsyncSession, username: str) -> Optional[UserRead]:
+    return await user_cache.get_async(
+        user_cache.username_key(username), lambda: _load_user_async(db, User.username == username)
+    )
+
+async def get_user_by_id_async(db: AsyncSession, user_id: UUID) -> Optional[UserRead]:
+    return await user_cache.get_async(
+        user_cache.id_key(user_id), lambda: _load_user_async(db, User.id == user_id)
+    )
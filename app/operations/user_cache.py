@@ -0,0 +1,218 @@
+# app/operations/user_cache.py
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set
+from uuid import UUID
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.user import User
+from app.operations.calculation_cache import LRUCache
+from app.schemas.user import UserRead
+
+UserKey = Hashable  # ("username", str) or ("id", UUID)
+
+
+class UserCache:
+    """
+    Read-through cache of UserRead keyed by username and by id.
+
+    - bounded LRU with TTL for found users
+    - negative caching (shorter TTL) for lookups that found nothing (404s)
+    - concurrent misses for one key share a single load (sync and async)
+    - invalidated from the session on any insert/update/delete of a User;
+      a load that raced with an invalidation is returned but not cached
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None, negative_ttl: Optional[float] = None):
+        self.found = LRUCache(maxsize=maxsize, ttl=ttl)
+        self.not_found = LRUCache(maxsize=maxsize, ttl=negative_ttl)
+        self._lock = threading.Lock()
+        self._inflight: Dict[UserKey, Future] = {}
+        self._inflight_async: Dict[UserKey, asyncio.Future] = {}
+        self._generation = 0
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    @staticmethod
+    def username_key(username: str) -> UserKey:
+        return ("username", username)
+
+    @staticmethod
+    def id_key(user_id: UUID) -> UserKey:
+        return ("id", user_id)
+
+    _MISSING = object()
+
+    def _lookup(self, key: UserKey) -> Any:
+        """Cached UserRead, None for a cached 404, or _MISSING."""
+        user = self.found.get(key)
+        if user is not None:
+            with self._lock:
+                self.hits += 1
+            return user
+        if self.not_found.get(key) is not None:
+            with self._lock:
+                self.negative_hits += 1
+            return None
+        with self._lock:
+            self.misses += 1
+        return self._MISSING
+
+    def _store(self, key: UserKey, user: Optional[UserRead], generation: int) -> None:
+        with self._lock:
+            if generation != self._generation:
+                return  # invalidated while loading; don't cache stale data
+        if user is None:
+            self.not_found.set(key, True)
+        else:
+            self.put(user)
+
+    # ---------------------------------------------------------
+    # Read-through
+    # ---------------------------------------------------------
+    def get(self, key: UserKey, load: Callable[[], Optional[UserRead]]) -> Optional[UserRead]:
+        cached = self._lookup(key)
+        if cached is not self._MISSING:
+            return cached
+
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+                generation = self._generation
+            else:
+                self.coalesced += 1
+        if not leader:
+            return future.result()
+
+        try:
+            user = load()
+            self._store(key, user, generation)
+            future.set_result(user)
+            return user
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    async def get_async(
+        self, key: UserKey, load: Callable[[], Awaitable[Optional[UserRead]]]
+    ) -> Optional[UserRead]:
+        cached = self._lookup(key)
+        if cached is not self._MISSING:
+            return cached
+
+        future = self._inflight_async.get(key)
+        if future is not None and future.get_loop() is asyncio.get_running_loop():
+            with self._lock:
+                self.coalesced += 1
+            return await asyncio.shield(future)
+
+        future = self._inflight_async[key] = asyncio.get_running_loop().create_future()
+        generation = self._generation
+        try:
+            user = await load()
+            self._store(key, user, generation)
+            future.set_result(user)
+            return user
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # mark retrieved when nobody was waiting
+            raise
+        finally:
+            if self._inflight_async.get(key) is future:
+                del self._inflight_async[key]
+
+    # ---------------------------------------------------------
+    # Writes / invalidation
+    # ---------------------------------------------------------
+    def put(self, user: UserRead) -> None:
+        """Cache a user under both keys (clearing any cached 404s for them)."""
+        for key in (self.username_key(user.username), self.id_key(user.id)):
+            self.not_found.delete(key)
+            self.found.set(key, user)
+
+    def invalidate(self, usernames: Set[str] = frozenset(), ids: Set[UUID] = frozenset()) -> None:
+        keys = [self.username_key(u) for u in usernames] + [self.id_key(i) for i in ids]
+        with self._lock:
+            self._generation += 1
+        for key in keys:
+            self.found.delete(key)
+            self.not_found.delete(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self.hits = self.negative_hits = self.misses = self.coalesced = 0
+        self.found.clear()
+        self.not_found.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.negative_hits + self.misses
+        return {
+            "size": len(self.found),
+            "negative_size": len(self.not_found),
+            "maxsize": self.found.maxsize,
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.found.evictions + self.not_found.evictions,
+            "hit_ratio": (self.hits + self.negative_hits) / lookups if lookups else 0.0,
+        }
+
+
+user_cache = UserCache(
+    maxsize=settings.USER_CACHE_SIZE,
+    ttl=settings.USER_CACHE_TTL or None,
+    negative_ttl=settings.USER_CACHE_NEGATIVE_TTL or None,
+)
+
+
+def _changed_keys(session: Session):
+    usernames: Set[str] = set()
+    ids: Set[UUID] = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if not isinstance(obj, User):
+            continue
+        history = inspect(obj).attrs.username.history
+        usernames.update(u for u in (obj.username, *history.deleted) if u)
+        if obj.id is not None:
+            ids.add(obj.id)
+    return usernames, ids
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_flushed_users(session: Session, flush_context) -> None:
+    """
+    Drop cached entries for users written in this flush, and remember them
+    so they are dropped again at commit (a reader may re-cache the old row
+    between the flush and the commit).
+    """
+    usernames, ids = _changed_keys(session)
+    if usernames or ids:
+        user_cache.invalidate(usernames, ids)
+        pending = session.info.setdefault("user_cache_invalidate", (set(), set()))
+        pending[0].update(usernames)
+        pending[1].update(ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session: Session) -> None:
+    pending = session.info.pop("user_cache_invalidate", None)
+    if pending:
+        user_cache.invalidate(*pending)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending_invalidations(session: Session, previous_transaction) -> None:
+    session.info.pop("user_cache_invalidate", None)
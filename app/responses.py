@@ -0,0 +1,14 @@
+# app/responses.py
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+
+class ModelJSONResponse(Response):
+    """
+    JSON response rendered by pydantic-core (model_dump_json) straight from a
+    model, skipping FastAPI's response_model re-validation and encoding.
+    """
+    media_type = "application/json"
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.model_dump_json().encode()
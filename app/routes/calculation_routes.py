@@ -0,0 +1,132 @@
+# app/routes/calculation_routes.py
+from typing import List, Literal, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.metrics import InstrumentedRoute
+from app.operations.calculation import (
+    compute_calculation,
+    create_calculation,
+    delete_calculation,
+    get_calculation,
+    list_calculation_rows,
+)
+from app.operations.calculation_executor import calculation_executor
+from app.operations.calculation_export import MEDIA_TYPES, export_calculations
+from app.operations.calculation_factory import CalculationFactory
+from app.operations.calculation_ingest import ingest_calculations
+from app.operations.calculation_stats import get_user_stats
+from app.responses import ModelJSONResponse
+from app.schemas.calculation import (
+    CalculationBatchRequest,
+    CalculationBatchResponse,
+    CalculationCreate,
+    CalculationPage,
+    CalculationRead,
+    CalculationResult,
+    CalculationStatsRead,
+    ExpressionRequest,
+    IngestSummary,
+)
+
+router = APIRouter(prefix="/calculations", tags=["Calculations"], route_class=InstrumentedRoute)
+
+def _batch_response(results, errors) -> CalculationBatchResponse:
+    """Columnar arrays -> response, with None for rows flagged in the error mask."""
+    errors = errors.tolist()
+    results = [None if err else value for value, err in zip(results.tolist(), errors)]
+    return CalculationBatchResponse(results=results, errors=errors)
+
+@router.post("/", response_model=CalculationRead)
+def create(calc: CalculationCreate, db: Session = Depends(get_db)):
+    try:
+        return create_calculation(db, calc)
+    except ValueError as e:  # e.g. divide by zero inside an expression
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/", response_model=CalculationPage)
+def list_history(
+    user_id: UUID,
+    limit: int = Query(50, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
+    # column-only query serialized by orjson; response_model only documents the shape
+    try:
+        return ORJSONResponse(list_calculation_rows(db, user_id, limit=limit, cursor=cursor))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/stats", response_model=List[CalculationStatsRead])
+def stats(user_id: UUID, db: Session = Depends(get_db)):
+    """Per-type counts and result aggregates, read from calculation_stats."""
+    return get_user_stats(db, user_id)
+
+@router.get("/export")
+def export(
+    user_id: UUID,
+    fmt: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    gzip: bool = False,
+    db: Session = Depends(get_db),
+):
+    """Stream a user's full history; memory use is constant in the row count."""
+    filename = f"calculations.{fmt}" + (".gz" if gzip else "")
+    return StreamingResponse(
+        export_calculations(db, user_id, fmt=fmt, compress=gzip),
+        media_type="application/gzip" if gzip else MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+@router.post("/ingest", response_model=IngestSummary)
+async def ingest(request: Request, db: Session = Depends(get_db)):
+    """
+    Bulk-load NDJSON (default) or CSV (Content-Type: text/csv) records of
+    (a, b, type, user_id). The body is parsed as it streams in.
+    """
+    fmt = "csv" if request.headers.get("content-type", "").startswith("text/csv") else "ndjson"
+    try:
+        return await ingest_calculations(db, request.stream(), fmt=fmt)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/compute", response_model=CalculationResult)
+def compute(calc: CalculationCreate):
+    """Compute (through the result cache) without storing a row."""
+    try:
+        result = compute_calculation(calc)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return CalculationResult(
+        a=calc.a, b=calc.b, type=calc.type, expression=calc.expression, result=result
+    )
+
+@router.post("/expression", response_model=CalculationBatchResponse)
+def evaluate_expression(req: ExpressionRequest):
+    """Evaluate one compiled expression over many variable bindings in one request."""
+    expression = CalculationFactory.create("expression", req.expression)
+    results, errors = expression.evaluate_batch(req.variables)
+    return _batch_response(results, errors)
+
+@router.post("/batch", response_model=CalculationBatchResponse)
+def compute_batch(batch: CalculationBatchRequest):
+    try:
+        computed = calculation_executor.compute_batch(batch.a, batch.b, batch.type, batch.expression)
+    except ValueError as e:  # e.g. an operation unregistered after validation
+        raise HTTPException(status_code=400, detail=str(e))
+    return _batch_response(computed.results, computed.errors)
+
+@router.get("/{calc_id}", response_model=CalculationRead)
+def read(calc_id: UUID, db: Session = Depends(get_db)):
+    calc = get_calculation(db, calc_id)
+    if not calc:
+        raise HTTPException(status_code=404, detail="Calculation not found")
+    return ModelJSONResponse(calc)
+
+@router.delete("/{calc_id}", status_code=204)
+def delete(calc_id: UUID, db: Session = Depends(get_db)):
+    if not delete_calculation(db, calc_id):
+        raise HTTPException(status_code=404, detail="Calculation not found")
+    return Response(status_code=204)
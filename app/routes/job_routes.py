@@ -0,0 +1,23 @@
+# app/routes/job_routes.py
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.metrics import InstrumentedRoute
+from app.operations.calculation_jobs import get_job, submit_job
+from app.schemas.job import JobCreate, JobRead
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"], route_class=InstrumentedRoute)
+
+@router.post("/", response_model=JobRead, status_code=202)
+def submit(job: JobCreate, db: Session = Depends(get_db)):
+    """Queue a large batch; poll GET /jobs/{id} for progress."""
+    return submit_job(db, job)
+
+@router.get("/{job_id}", response_model=JobRead)
+def read(job_id: UUID, db: Session = Depends(get_db)):
+    job = get_job(db, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
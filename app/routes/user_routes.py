@@ -1,12 +1,32 @@
 # app/routes/user_routes.py
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.database import get_db
-from app.operations.user import create_user, get_user_by_username
+from app.database import get_db, get_async_db
+from app.metrics import InstrumentedRoute
+from app.operations.user import (
+    MAX_EMBEDDED_CALCULATIONS,
+    create_user,
+    create_users_bulk,
+    get_user_by_username,
+    get_user_with_calculations,
+    list_users_with_calculations,
+    create_user_async,
+    get_user_by_username_async,
+)
+from app.responses import ModelJSONResponse
 from app.schemas.base import UserCreate
-from app.schemas.user import UserRead
+from app.schemas.user import (
+    UserBulkCreate,
+    UserBulkResult,
+    UserRead,
+    UserWithCalculations,
+    UserWithCalculationsPage,
+)
 
-router = APIRouter(prefix="/users", tags=["Users"])
+router = APIRouter(prefix="/users", tags=["Users"], route_class=InstrumentedRoute)
 
 @router.post("/", response_model=UserRead)
 def register_user(user: UserCreate, db: Session = Depends(get_db)):
@@ -15,9 +35,57 @@ def register_user(user: UserCreate, db: Session = Depends(get_db)):
     except ValueError as e: # pragma: no cover
         raise HTTPException(status_code=400, detail=str(e)) 
 
+@router.post("/bulk", response_model=UserBulkResult)
+def register_users_bulk(batch: UserBulkCreate, db: Session = Depends(get_db)):
+    """Register many users in one request; every row gets its own status."""
+    try:
+        return create_users_bulk(db, batch.users)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/", response_model=UserWithCalculationsPage)
+def read_users(
+    limit: int = Query(50, ge=1, le=100),
+    after: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    calculations_limit: int = Query(20, ge=0, le=MAX_EMBEDDED_CALCULATIONS),
+    db: Session = Depends(get_db),
+):
+    """Users by username, each with their newest calculations (two queries per page)."""
+    return list_users_with_calculations(db, limit, after, calculations_limit)
+
+@router.get("/{username}/with-calculations", response_model=UserWithCalculations)
+def read_user_with_calculations(
+    username: str,
+    calculations_limit: int = Query(20, ge=0, le=MAX_EMBEDDED_CALCULATIONS),
+    db: Session = Depends(get_db),
+):
+    user = get_user_with_calculations(db, username, calculations_limit)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    return user
+
 @router.get("/{username}", response_model=UserRead)
 def read_user(username: str, db: Session = Depends(get_db)):
     user = get_user_by_username(db, username)
     if not user:
         raise HTTPException(status_code=404, detail="User not found") # pragma: no cover
-    return user # pragma: no cover
+    return ModelJSONResponse(user) # pragma: no cover
+
+# ---------------------------------------------------------
+# Async routes (same behaviour, AsyncSession) for A/B testing
+# ---------------------------------------------------------
+async_router = APIRouter(prefix="/async/users", tags=["Users (async)"], route_class=InstrumentedRoute)
+
+@async_router.post("/", response_model=UserRead)
+async def register_user_async(user: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    try:
+        return await create_user_async(db, user)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@async_router.get("/{username}", response_model=UserRead)
+async def read_user_async(username: str, db: AsyncSession = Depends(get_async_db)):
+    user = await get_user_by_username_async(db, username)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    return ModelJSONResponse(user)
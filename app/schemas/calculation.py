@@ -1,12 +1,42 @@
 # app/schemas/calculation.py
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Dict, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, ConfigDict, model_validator
+from pydantic import BaseModel, Field, ConfigDict, StringConstraints, TypeAdapter, model_validator
 
-# Supported operation types
-VALID_TYPES = {"add", "sub", "multiply", "divide"}
+from app.operations.calculation_factory import CalculationFactory
+from app.operations.expression import MAX_EXPRESSION_LENGTH
+from app.operations.registry import operation_registry
+
+
+def is_valid_type(calc_type: str) -> bool:
+    """O(1) check against the operation registry (plus "expression")."""
+    return calc_type == "expression" or calc_type in operation_registry
+
+
+def _invalid_type_error() -> ValueError:
+    allowed = ", ".join(sorted([*operation_registry, "expression"]))
+    return ValueError(f"type must be one of: {allowed}")
+
+
+# Operation name, stripped and lower-cased by pydantic-core before any Python validator runs.
+# Not a Literal: the set of names comes from the (pluggable) operation registry.
+CalculationType = Annotated[str, StringConstraints(strip_whitespace=True, to_lower=True)]
+
+
+# Stored calculations bind only their two operands
+CALCULATION_VARIABLES = frozenset({"a", "b"})
+
+
+def _check_expression(expression: Optional[str]) -> None:
+    """Ensure an "expression" calculation carries an expression over a and b that compiles."""
+    if not expression:
+        raise ValueError("expression is required when type is 'expression'")
+    compiled = CalculationFactory.create("expression", expression)
+    unknown = set(compiled.variables) - CALCULATION_VARIABLES
+    if unknown:
+        raise ValueError(f"Unknown variable(s) in expression: {', '.join(sorted(unknown))} (only a and b are available)")
 
 
 class CalculationBase(BaseModel):
@@ -15,9 +45,14 @@ class CalculationBase(BaseModel):
     """
     a: float = Field(..., description="First operand")
     b: float = Field(..., description="Second operand")
-    type: str = Field(
+    type: CalculationType = Field(
         ...,
-        description='Type of operation: "add", "sub", "multiply", or "divide".',
+        description='Type of operation: "add", "sub", "multiply", "divide" or "expression".',
+    )
+    expression: Optional[str] = Field(
+        default=None,
+        max_length=MAX_EXPRESSION_LENGTH,
+        description='Formula over a and b, e.g. "a * (b + 2)". Required when type is "expression".',
     )
     user_id: Optional[UUID] = Field(
         default=None,
@@ -31,21 +66,20 @@ class CalculationBase(BaseModel):
     def normalize_and_validate(self):
         """
         Pydantic v2 style validator that:
-        - normalizes type to lowercase
-        - ensures it's one of the allowed operations
-        - prevents division by zero when type == 'divide'
+        - ensures type (already normalized to lowercase) is one of the allowed operations
+        - runs the operation's domain check (e.g. no division by zero)
+        - requires a valid expression when type == 'expression'
+        Kept to one registry lookup and no attribute assignment: it runs on
+        every request.
         """
-        t = (self.type or "").strip().lower()
-
-        if t not in VALID_TYPES:
-            allowed = ", ".join(sorted(VALID_TYPES))
-            raise ValueError(f"type must be one of: {allowed}")
-
-        if t == "divide" and self.b == 0:
-            raise ValueError("Cannot divide by zero")
+        if self.type == "expression":
+            _check_expression(self.expression)
+            return self
 
-        # normalize back onto the object
-        self.type = t
+        op_class = operation_registry.get(self.type)
+        if op_class is None:
+            raise _invalid_type_error()
+        op_class.check_domain(self.a, self.b)
         return self
 
 
@@ -58,6 +92,10 @@ class CalculationCreate(CalculationBase):
     pass
 
 
+# Validates a whole list of creates in one pydantic-core call (bulk ingest)
+calculation_create_list = TypeAdapter(List[CalculationCreate])
+
+
 class CalculationRead(CalculationBase):
     """
     Schema returned to the client when reading a calculation.
@@ -71,3 +109,112 @@ class CalculationRead(CalculationBase):
     created_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class CalculationBatchRequest(BaseModel):
+    """
+    Columnar batch of calculations: row i is (a[i], b[i], type[i]).
+    Division by zero is allowed here; it is reported per row in the response.
+    """
+    a: List[float] = Field(..., description="First operands")
+    b: List[float] = Field(..., description="Second operands")
+    type: List[CalculationType] = Field(..., description="Operation type for each row")
+    expression: Optional[List[Optional[str]]] = Field(
+        default=None, description='Expression for each row whose type is "expression"'
+    )
+
+    @model_validator(mode="after")
+    def validate_columns(self):
+        """Ensure all columns line up and every type is supported."""
+        if not (len(self.a) == len(self.b) == len(self.type)):
+            raise ValueError("a, b and type must have the same length")
+
+        if self.expression is not None and len(self.expression) != len(self.type):
+            raise ValueError("expression must have the same length as type")
+
+        types = set(self.type)
+        if not all(is_valid_type(t) for t in types):
+            raise _invalid_type_error()
+
+        if "expression" in types:
+            expressions = self.expression or [None] * len(self.type)
+            for expression in {e for t, e in zip(self.type, expressions) if t == "expression"}:
+                _check_expression(expression)
+
+        return self
+
+
+class CalculationBatchResponse(BaseModel):
+    """
+    Batch results in the same order as the request.
+    `results[i]` is None whenever `errors[i]` is True.
+    """
+    results: List[Optional[float]]
+    errors: List[bool]
+
+
+class CalculationResult(BaseModel):
+    """Value-only response for calculations that are not persisted."""
+    a: float
+    b: float
+    type: str
+    expression: Optional[str] = None
+    result: float
+
+
+class ExpressionRequest(BaseModel):
+    """
+    Evaluate one expression against many variable bindings at once:
+    row i binds every variable to variables[name][i].
+    """
+    expression: str = Field(..., max_length=MAX_EXPRESSION_LENGTH)
+    variables: Dict[str, List[float]] = Field(default_factory=dict)
+
+    @model_validator(mode="after")
+    def validate_expression(self):
+        compiled = CalculationFactory.create("expression", self.expression)
+        missing = set(compiled.variables) - set(self.variables)
+        if missing:
+            raise ValueError(f"Missing value for variable(s): {', '.join(sorted(missing))}")
+        if len({len(values) for values in self.variables.values()}) > 1:
+            raise ValueError("All variable columns must have the same length")
+        return self
+
+
+class CalculationPage(BaseModel):
+    """
+    One page of a user's calculation history, newest first.
+    Pass `next_cursor` back as `cursor` to fetch the following page.
+    """
+    items: List[CalculationRead]
+    next_cursor: Optional[str] = None
+
+
+class IngestError(BaseModel):
+    """A rejected input line from a bulk ingest."""
+    line: int
+    error: str
+
+
+class IngestSummary(BaseModel):
+    """Outcome of a streaming bulk ingest."""
+    received: int
+    inserted: int
+    failed: int
+    errors: List[IngestError]
+    seconds: float
+    rows_per_second: float
+
+
+class CalculationStatsRead(BaseModel):
+    """Precomputed per-(user, type) statistics."""
+    user_id: UUID
+    type: str
+    count: int
+    sum_result: Optional[float] = None
+    min_result: Optional[float] = None
+    max_result: Optional[float] = None
+    mean_result: Optional[float] = None
+    last_activity: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
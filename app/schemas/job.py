@@ -0,0 +1,39 @@
+# app/schemas/job.py
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.calculation import CalculationBatchRequest
+
+
+class JobCreate(CalculationBatchRequest):
+    """A calculation batch to process in the background and persist."""
+    user_id: Optional[UUID] = Field(
+        default=None, description="Owner of every calculation in the batch."
+    )
+
+
+class JobRowError(BaseModel):
+    index: int
+    error: str
+
+
+class JobRead(BaseModel):
+    """Progress report for a background job."""
+    id: UUID
+    status: str
+    total: int
+    processed: int
+    inserted: int
+    failed: int
+    progress: float = Field(description="Fraction of rows processed, 0..1")
+    rows_per_second: float
+    errors: List[JobRowError] = Field(default_factory=list)
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
@@ -1,7 +1,10 @@
 # app/schemas/user.py
 from datetime import datetime
+from typing import List, Literal, Optional
 from uuid import UUID
-from pydantic import BaseModel, EmailStr, ConfigDict
+from pydantic import BaseModel, EmailStr, ConfigDict, Field
+from app.schemas.base import UserCreate
+from app.schemas.calculation import CalculationRead
 
 class UserRead(BaseModel):
     id: UUID
@@ -13,3 +16,43 @@ class UserRead(BaseModel):
     created_at: datetime
     updated_at: datetime
     model_config = ConfigDict(from_attributes=True)
+
+
+class UserWithCalculations(UserRead):
+    """
+    A user with their newest calculations (at most the requested cap).
+    calculations_truncated says whether older ones exist; pass
+    calculations_next_cursor to GET /calculations/ to page through them.
+    """
+    calculations: List[CalculationRead]
+    calculations_truncated: bool = False
+    calculations_next_cursor: Optional[str] = None
+
+
+class UserWithCalculationsPage(BaseModel):
+    items: List[UserWithCalculations]
+    next_cursor: Optional[str] = None  # username to pass as `after`
+
+
+class UserBulkCreate(BaseModel):
+    """Many registrations in one request (e.g. an onboarding import)."""
+    users: List[UserCreate] = Field(..., min_length=1, max_length=5000)
+
+
+class UserBulkRowResult(BaseModel):
+    """
+    Outcome for users[index]: "created", "conflict" (username or email
+    already registered) or "duplicate" (repeats an earlier row of the batch).
+    """
+    index: int
+    status: Literal["created", "conflict", "duplicate"]
+    id: Optional[UUID] = None
+    error: Optional[str] = None
+
+
+class UserBulkResult(BaseModel):
+    created: int
+    conflicts: int
+    results: List[UserBulkRowResult]
+    seconds: float
+    rows_per_second: float
@@ -0,0 +1,74 @@
+# benchmarks/bench_calculation_batch.py
+"""
+Memory footprint of the columnar CalculationBatch vs the per-object path.
+
+For N rows, measure memory still allocated (tracemalloc) after building:
+  * objects - one CalculationCreate plus one Calculation ORM object per row
+  * batch   - CalculationBatch.from_columns + compute + assign_ids
+and report bytes per row and build time for each.
+
+    python -m benchmarks.bench_calculation_batch
+"""
+import gc
+import random
+import time
+import tracemalloc
+import uuid
+
+from app.models.calculation import Calculation
+from app.operations.calculation_batch import CalculationBatch
+from app.schemas.calculation import CalculationCreate
+
+SIZES = [10_000, 100_000]
+TYPES = ["add", "sub", "multiply", "divide"]
+
+
+def make_columns(rows: int, seed: int = 42):
+    rng = random.Random(seed)
+    a = [rng.uniform(1, 1000) for _ in range(rows)]
+    b = [rng.uniform(1, 1000) for _ in range(rows)]
+    types = [rng.choice(TYPES) for _ in range(rows)]
+    return a, b, types
+
+
+def build_objects(a, b, types, user_id):
+    objects = []
+    for x, y, t in zip(a, b, types):
+        create = CalculationCreate(a=x, b=y, type=t, user_id=user_id)
+        calc = Calculation(id=uuid.uuid4(), a=create.a, b=create.b, type=create.type, user_id=user_id)
+        calc.result = calc.compute_result()
+        objects.append((create, calc))
+    return objects
+
+
+def build_batch(a, b, types, user_id):
+    batch = CalculationBatch.from_columns(a, b, types, user_id=user_id)
+    batch.compute()
+    batch.assign_ids()
+    return batch
+
+
+def measure(fn, *args):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    kept = fn(*args)
+    seconds = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return current, seconds
+
+
+def main() -> None:
+    user_id = uuid.uuid4()
+    print(f"{'rows':>8} {'path':>8} {'MiB':>9} {'bytes/row':>10} {'seconds':>8}")
+    for rows in SIZES:
+        columns = make_columns(rows)
+        for name, fn in (("objects", build_objects), ("batch", build_batch)):
+            retained, seconds = measure(fn, *columns, user_id)
+            print(f"{rows:>8} {name:>8} {retained / 2**20:9.1f} {retained / rows:10.0f} {seconds:8.3f}")
+
+
+if __name__ == "__main__":
+    main()
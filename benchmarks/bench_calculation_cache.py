@@ -0,0 +1,59 @@
+# benchmarks/bench_calculation_cache.py
+"""
+Hit-rate / latency tradeoff of the calculation result cache.
+
+For a fixed workload of random (type, a, b) lookups drawn from key spaces
+of different sizes, compare cached vs uncached latency as the cache size
+varies. For the four built-in binary ops a plain compute is cheaper than
+a cache lookup, so the cache pays off for expensive operations and for
+callers that skip the DB insert, not for raw arithmetic.
+
+    python -m benchmarks.bench_calculation_cache
+"""
+import random
+import time
+
+from app.operations.calculation_cache import CalculationCache
+from app.operations.calculation_factory import CalculationFactory
+
+TYPES = ["add", "sub", "multiply", "divide"]
+LOOKUPS = 200_000
+
+
+def make_workload(key_space: int, lookups: int, seed: int = 42):
+    rng = random.Random(seed)
+    keys = [(rng.choice(TYPES), float(rng.randint(1, 1000)), float(rng.randint(1, 1000)))
+            for _ in range(key_space)]
+    return [rng.choice(keys) for _ in range(lookups)]
+
+
+def run_uncached(workload) -> float:
+    start = time.perf_counter()
+    for calc_type, a, b in workload:
+        CalculationFactory.create(calc_type).compute(a, b)
+    return time.perf_counter() - start
+
+
+def run_cached(workload, maxsize: int):
+    cache = CalculationCache(maxsize=maxsize)
+    start = time.perf_counter()
+    for calc_type, a, b in workload:
+        cache.compute(calc_type, a, b)
+    return time.perf_counter() - start, cache.stats()
+
+
+def main():
+    print(f"{'keys':>8} {'cache':>8} {'hit%':>7} {'evict':>8} {'ns/op':>8} {'uncached ns/op':>15}")
+    for key_space in (100, 10_000, 100_000):
+        workload = make_workload(key_space, LOOKUPS)
+        uncached = run_uncached(workload) / LOOKUPS * 1e9
+        for maxsize in (100, 1_000, 10_000, 100_000):
+            elapsed, stats = run_cached(workload, maxsize)
+            print(
+                f"{key_space:>8} {maxsize:>8} {stats['hit_ratio'] * 100:>6.1f}% "
+                f"{stats['evictions']:>8} {elapsed / LOOKUPS * 1e9:>8.0f} {uncached:>15.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
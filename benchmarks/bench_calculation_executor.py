@@ -0,0 +1,62 @@
+# benchmarks/bench_calculation_executor.py
+"""
+Speedup of the process-pool executor over in-process compute_batch.
+
+Runs a mixed batch (half divide, half a compiled expression) on 1..N worker
+processes and reports wall time and speedup against the in-process path.
+The pool is warmed first so worker start-up is not counted. The built-in
+ops are memory-bound numpy kernels, so expect the speedup to flatten well
+below the core count; expression-heavy batches scale best.
+
+    python -m benchmarks.bench_calculation_executor
+"""
+import os
+import time
+
+import numpy as np
+
+from app.operations.calculation_executor import CalculationExecutor
+from app.operations.calculation_factory import CalculationFactory
+
+ROWS = 2_000_000
+EXPRESSION = "a * b + a / b - (a + b) * (a - b)"
+
+
+def make_batch(rows: int, seed: int = 42):
+    rng = np.random.default_rng(seed)
+    a = rng.random(rows) * 1000
+    b = rng.random(rows) * 1000 + 1
+    types = np.where(np.arange(rows) % 2 == 0, "divide", "expression")
+    expressions = [None if t == "divide" else EXPRESSION for t in types.tolist()]
+    return a, b, types, expressions
+
+
+def timed(fn, *args, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    a, b, types, expressions = make_batch(ROWS)
+    baseline = timed(CalculationFactory.compute_batch, a, b, types, expressions)
+    print(f"{ROWS:,} rows, {os.cpu_count()} CPUs")
+    print(f"{'workers':>8} {'seconds':>9} {'speedup':>8}")
+    print(f"{'inline':>8} {baseline:9.3f} {1.0:8.2f}")
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        executor = CalculationExecutor(workers=workers, min_rows=0)
+        if workers > 1:
+            executor.compute_batch(a[:1000], b[:1000], types[:1000], expressions[:1000])  # warm the pool
+        seconds = timed(executor.compute_batch, a, b, types, expressions)
+        executor.shutdown()
+        print(f"{workers:>8} {seconds:9.3f} {baseline / seconds:8.2f}")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
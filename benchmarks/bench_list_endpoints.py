@@ -0,0 +1,85 @@
+# benchmarks/bench_list_endpoints.py
+"""
+End-to-end latency of the calculation list endpoint.
+
+Seeds a throwaway SQLite database with 1k / 10k / 100k calculations for one
+user and pages through GET /calculations/ (limit=1000, the maximum) with
+the FastAPI TestClient, so routing, the query, serialization and the
+response body are all included. Reports total seconds and rows/s.
+
+    python -m benchmarks.bench_list_endpoints
+"""
+import os
+import tempfile
+import time
+import uuid
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base, get_db
+from app.main import app
+from app.models.user import User
+from app.operations.calculation_bulk import bulk_insert_calculations
+
+SIZES = [1_000, 10_000, 100_000]
+PAGE = 1000
+
+
+def seed(session_factory, rows: int) -> uuid.UUID:
+    with session_factory() as db:
+        user = User(first_name="Bench", last_name="User", username=f"bench_{rows}",
+                    email=f"bench_{rows}@example.com", password_hash="not-a-real-hash")
+        db.add(user)
+        db.commit()
+        bulk_insert_calculations(db, (
+            {"a": float(i), "b": 2.0, "type": "multiply", "result": i * 2.0, "user_id": user.id}
+            for i in range(rows)
+        ))
+        return user.id
+
+
+def page_through(client: TestClient, user_id: uuid.UUID) -> int:
+    fetched, cursor = 0, None
+    while True:
+        params = {"user_id": str(user_id), "limit": PAGE}
+        if cursor:
+            params["cursor"] = cursor
+        body = client.get("/calculations/", params=params).json()
+        fetched += len(body["items"])
+        cursor = body["next_cursor"]
+        if not cursor:
+            return fetched
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(engine)
+        session_factory = sessionmaker(bind=engine)
+
+        def override_get_db():
+            db = session_factory()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app.dependency_overrides[get_db] = override_get_db
+        client = TestClient(app)
+        print(f"{'rows':>8} {'seconds':>9} {'rows/s':>10}")
+        for rows in SIZES:
+            user_id = seed(session_factory, rows)
+            page_through(client, user_id)  # warm up
+            start = time.perf_counter()
+            fetched = page_through(client, user_id)
+            seconds = time.perf_counter() - start
+            assert fetched == rows
+            print(f"{rows:>8} {seconds:9.3f} {rows / seconds:10,.0f}")
+        app.dependency_overrides.clear()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+# benchmarks/bench_metrics_overhead.py
+"""
+Overhead of request instrumentation (MetricsMiddleware, cursor events,
+InstrumentedRoute timing).
+
+Drives a few representative endpoints in-process through httpx.AsyncClient
+(ASGI transport, one event loop, no lifespan, so no background workers) on a
+throwaway SQLite file. Metrics are switched on and off on alternate requests
+(off also detaches the cursor listeners), so machine noise hits both states
+equally, and the trimmed mean latencies are compared. Exits non-zero if the
+overhead on any endpoint exceeds MAX_OVERHEAD.
+
+    python -m benchmarks.bench_metrics_overhead
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+import httpx
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.config import settings
+from app.database import Base, get_db
+from app.main import app
+from app.metrics import metrics, set_enabled
+from app.operations.calculation_jobs import job_runner
+from app.models.user import User
+from app.operations.calculation_bulk import bulk_insert_calculations
+
+REQUESTS = 3000  # per state
+WARMUP = 200
+MAX_OVERHEAD = 0.05
+
+
+def seed(session_factory):
+    with session_factory() as db:
+        user = User(first_name="Bench", last_name="User", username="bench", email="bench@example.com",
+                    password_hash="not-a-real-hash")
+        db.add(user)
+        db.commit()
+        bulk_insert_calculations(db, (
+            {"a": float(i), "b": 2.0, "type": "multiply", "result": i * 2.0, "user_id": user.id}
+            for i in range(1000)
+        ))
+        calc_id = db.execute(Base.metadata.tables["calculations"].select().limit(1)).first().id
+        return user.id, calc_id
+
+
+def trimmed_mean(samples: List[float], trim: float = 0.1) -> float:
+    """Mean without the slowest `trim` fraction (scheduler hiccups, GC)."""
+    kept = sorted(samples)[: max(1, int(len(samples) * (1 - trim)))]
+    return sum(kept) / len(kept)
+
+
+async def measure(endpoints) -> bool:
+    """Print off/on timings per endpoint; True if any is over budget."""
+    failed = False
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        print(f"{'endpoint':<28} {'off us':>9} {'on us':>9} {'overhead':>9}")
+        for name, (method, url, kwargs) in endpoints.items():
+            samples: Dict[bool, List[float]] = {False: [], True: []}
+            for i in range(WARMUP + 2 * REQUESTS):
+                state = bool(i % 2)
+                set_enabled(state)
+                start = time.perf_counter()
+                response = await client.request(method, url, **kwargs)
+                elapsed = time.perf_counter() - start
+                assert response.status_code == 200, response.text
+                if i >= WARMUP:
+                    samples[state].append(elapsed)
+            off, on = trimmed_mean(samples[False]), trimmed_mean(samples[True])
+            overhead = on / off - 1
+            failed |= overhead > MAX_OVERHEAD
+            print(f"{name:<28} {off * 1e6:9.0f} {on * 1e6:9.0f} {overhead:9.1%}")
+    return failed
+
+
+def main() -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        # ASGITransport doesn't run the lifespan; also make sure nothing in it
+        # would start workers or touch the default database if it did
+        settings.DATABASE_URL = url
+        settings.LAZY_RESULTS = False
+        settings.DB_CREATE_TABLES = False
+        job_runner.workers = 0
+        engine = create_engine(url)
+        Base.metadata.create_all(engine)
+        session_factory = sessionmaker(bind=engine)
+
+        def override_get_db():
+            db = session_factory()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app.dependency_overrides[get_db] = override_get_db
+        user_id, calc_id = seed(session_factory)
+        endpoints = {
+            "POST /calculations/compute": ("POST", "/calculations/compute", {"json": {"a": 9, "b": 3, "type": "divide"}}),
+            "GET /calculations/{id}": ("GET", f"/calculations/{calc_id}", {}),
+            "GET /calculations/ (100)": ("GET", "/calculations/", {"params": {"user_id": str(user_id), "limit": 100}}),
+        }
+        enabled = metrics.enabled
+        try:
+            failed = asyncio.run(measure(endpoints))
+        finally:
+            set_enabled(enabled)
+        app.dependency_overrides.clear()
+        engine.dispose()
+    if failed:
+        print(f"FAIL: overhead above {MAX_OVERHEAD:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
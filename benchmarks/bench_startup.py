@@ -0,0 +1,106 @@
+# benchmarks/bench_startup.py
+"""
+Cold-import time of app.main, with a regression budget.
+
+Runs `python -X importtime -c "import app.main"` in fresh interpreters,
+reports the median and fastest cumulative import time and the slowest
+app.* modules (self time). The gate uses the fastest run, which filters out
+scheduler noise: it fails when that exceeds the budget, or exceeds a saved
+baseline by more than --threshold, so it can gate CI. Importing the app must
+not build engines or load DB drivers; the run fails if
+psycopg2/asyncpg/passlib show up in the import log.
+
+    python -m benchmarks.bench_startup [--runs 7] [--budget-ms 1900]
+    python -m benchmarks.bench_startup --json .benchmarks/startup.json
+    python -m benchmarks.bench_startup --baseline .benchmarks/startup.json --threshold 0.10
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# Fastest-run ceiling; measured ~1550-1750 ms on a 1-vCPU runner
+STARTUP_BUDGET_MS = 1900.0
+DEFAULT_THRESHOLD = 0.10
+TARGET = "app.main"
+# Modules that belong to first use (lifespan / first request), not import
+DEFERRED_MODULES = ("psycopg2", "asyncpg", "aiosqlite", "passlib")
+
+LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def import_profile() -> List[Tuple[str, int, int]]:
+    """(module, self_us, cumulative_us) for one cold import of TARGET."""
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {TARGET}"],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            rows.append((match.group(4), int(match.group(1)), int(match.group(2))))
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--budget-ms", type=float, default=STARTUP_BUDGET_MS)
+    parser.add_argument("--json", help="write the timings to this file")
+    parser.add_argument("--baseline", help="compare against this timings file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed relative regression (0.10 = 10%%)")
+    args = parser.parse_args()
+
+    totals: List[float] = []
+    self_times: Dict[str, List[int]] = {}
+    loaded = set()
+    for _ in range(args.runs):
+        profile = import_profile()
+        loaded.update(name.split(".")[0] for name, _, _ in profile)
+        totals.append(next(cum for name, _, cum in profile if name == TARGET) / 1000)
+        for name, self_us, _ in profile:
+            if name.startswith("app."):
+                self_times.setdefault(name, []).append(self_us)
+
+    median, fastest = statistics.median(totals), min(totals)
+    print(f"import {TARGET}: median {median:.0f} ms, min {fastest:.0f} ms over {args.runs} runs "
+          f"(budget {args.budget_ms:.0f} ms)")
+    print("slowest app modules (self time, median):")
+    slowest = sorted(((statistics.median(v) / 1000, k) for k, v in self_times.items()), reverse=True)
+    for ms, name in slowest[:10]:
+        print(f"  {ms:7.1f} ms  {name}")
+
+    if args.json:
+        os.makedirs(os.path.dirname(os.path.abspath(args.json)), exist_ok=True)
+        with open(args.json, "w") as f:
+            json.dump({"runs": args.runs, "median_ms": median, "min_ms": fastest}, f, indent=2)
+
+    failed = False
+    eager = sorted(set(DEFERRED_MODULES) & loaded)
+    if eager:
+        print(f"FAIL: imported at startup but should load on first use: {', '.join(eager)}")
+        failed = True
+    if fastest > args.budget_ms:
+        print(f"FAIL: fastest import time {fastest:.0f} ms exceeds budget {args.budget_ms:.0f} ms")
+        failed = True
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["min_ms"]
+        change = fastest / baseline - 1
+        if change > args.threshold:
+            print(f"FAIL: fastest import time {baseline:.0f} -> {fastest:.0f} ms ({change:+.1%} worse)")
+            failed = True
+        else:
+            print(f"no regression beyond {args.threshold:.0%} against {args.baseline}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
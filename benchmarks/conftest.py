@@ -0,0 +1,37 @@
+# benchmarks/conftest.py
+"""
+Fixtures for the pytest-benchmark suite (benchmarks/test_benchmarks.py):
+a throwaway SQLite database per session and a clean one per test.
+"""
+import os
+import tempfile
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.operations.user_cache import user_cache
+
+
+@pytest.fixture(scope="session")
+def bench_engine():
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(
+            f"sqlite:///{os.path.join(tmp, 'bench.db')}", connect_args={"check_same_thread": False}
+        )
+        yield engine
+        engine.dispose()
+
+
+@pytest.fixture
+def bench_db(bench_engine):
+    """Session on an empty schema."""
+    Base.metadata.drop_all(bind=bench_engine)
+    Base.metadata.create_all(bind=bench_engine)
+    user_cache.clear()
+    session = sessionmaker(bind=bench_engine, autoflush=False)()
+    try:
+        yield session
+    finally:
+        session.close()
@@ -0,0 +1,240 @@
+# benchmarks/load.py
+"""
+Local load driver: concurrent requests through the full ASGI stack.
+
+Runs the app in-process behind httpx.AsyncClient (ASGI transport, no
+network, no lifespan workers) on a throwaway SQLite file and drives each
+scenario with CONCURRENCY clients: scalar compute, user registration
+(bcrypt), user lookup by username, single calculation insert, and listing a
+user's history at several data sizes. Reports requests/s and p50/p95/p99
+latency per scenario, optionally writes them as JSON, and compares against a
+baseline JSON: a scenario regresses when its p50 latency grows, or its
+throughput drops, by more than --threshold. Any regression exits non-zero.
+
+    python -m benchmarks.load --json .benchmarks/load.json
+    python -m benchmarks.load --baseline .benchmarks/load.json --threshold 0.15
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional
+
+import httpx
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.config import settings
+from app.database import Base, get_db
+from app.main import app
+from app.operations.calculation_bulk import bulk_insert_calculations
+from app.operations.calculation_jobs import job_runner
+from app.operations.user_cache import user_cache
+
+CONCURRENCY = 8
+SIZES = [100, 1_000, 10_000]
+DEFAULT_THRESHOLD = 0.15
+
+Request = Callable[[httpx.AsyncClient, int], Awaitable[httpx.Response]]
+
+
+class ScenarioResult(NamedTuple):
+    """Throughput and latency of one scenario."""
+    requests: int
+    seconds: float
+    rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    errors: int
+
+
+class Regression(NamedTuple):
+    scenario: str
+    metric: str
+    baseline: float
+    current: float
+    change: float  # relative, positive = worse
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    index = min(len(sorted_values) - 1, max(0, round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def run_scenario(client: httpx.AsyncClient, request: Request, total: int, concurrency: int) -> ScenarioResult:
+    """Issue `total` requests (request(client, i) for i in range(total)) over `concurrency` workers."""
+    latencies: List[float] = []
+    errors = 0
+    counter = iter(range(total))
+
+    async def worker():
+        nonlocal errors
+        for i in counter:
+            start = time.perf_counter()
+            response = await request(client, i)
+            latencies.append(time.perf_counter() - start)
+            errors += response.status_code >= 400
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    seconds = time.perf_counter() - start
+    latencies.sort()
+    return ScenarioResult(
+        requests=total,
+        seconds=seconds,
+        rps=total / seconds if seconds > 0 else 0.0,
+        p50_ms=_percentile(latencies, 0.50) * 1000,
+        p95_ms=_percentile(latencies, 0.95) * 1000,
+        p99_ms=_percentile(latencies, 0.99) * 1000,
+        errors=errors,
+    )
+
+
+def compare(current: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            threshold: float) -> List[Regression]:
+    """Scenarios present in both runs whose p50 or throughput got worse by more than threshold."""
+    regressions = []
+    for name, result in current.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        if base["p50_ms"] > 0:
+            change = result["p50_ms"] / base["p50_ms"] - 1
+            if change > threshold:
+                regressions.append(Regression(name, "p50_ms", base["p50_ms"], result["p50_ms"], change))
+        if base["rps"] > 0:
+            change = 1 - result["rps"] / base["rps"]
+            if change > threshold:
+                regressions.append(Regression(name, "rps", base["rps"], result["rps"], change))
+    return regressions
+
+
+def _seed_history(session_factory, rows: int) -> uuid.UUID:
+    from app.models.user import User
+
+    with session_factory() as db:
+        user = User(first_name="Load", last_name="User", username=f"history_{rows}",
+                    email=f"history_{rows}@example.com", password_hash="not-a-real-hash")
+        db.add(user)
+        db.commit()
+        bulk_insert_calculations(db, (
+            {"a": float(i), "b": 2.0, "type": "multiply", "result": i * 2.0, "user_id": user.id}
+            for i in range(rows)
+        ))
+        return user.id
+
+
+async def run_all(session_factory, requests: int, concurrency: int, sizes: List[int]) -> Dict[str, ScenarioResult]:
+    results: Dict[str, ScenarioResult] = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://load") as client:
+
+        async def scenario(name: str, request: Request, total: int = requests) -> None:
+            await run_scenario(client, request, min(total, 20), 1)  # warm up
+            results[name] = await run_scenario(client, request, total, concurrency)
+
+        def user_payload(prefix: str, i: int) -> Dict[str, str]:
+            return {"username": f"{prefix}{i}", "email": f"{prefix}{i}@example.com", "password": "Secure123",
+                    "first_name": "Load", "last_name": "User"}
+
+        await scenario("compute", lambda c, i: c.post(
+            "/calculations/compute", json={"a": i, "b": 7, "type": "divide"}))
+
+        # bcrypt-bound: far fewer requests
+        bcrypt_requests = max(concurrency, requests // 20)
+        await run_scenario(client, lambda c, i: c.post("/users/", json=user_payload("warm", i)), 1, 1)
+        results["register_user"] = await run_scenario(
+            client, lambda c, i: c.post("/users/", json=user_payload("load", i)), bcrypt_requests, concurrency)
+
+        user_cache.clear()
+        await scenario("get_user_by_username", lambda c, i: c.get(f"/users/load{i % bcrypt_requests}"))
+
+        owner = (await client.get("/users/load0")).json()["id"]
+        await scenario("create_calculation", lambda c, i: c.post(
+            "/calculations/", json={"a": i, "b": 3, "type": "multiply", "user_id": owner}))
+
+        for rows in sizes:
+            user_id = str(await asyncio.to_thread(_seed_history, session_factory, rows))
+            await scenario(f"list_calculations[{rows}]", lambda c, i: c.get(
+                "/calculations/", params={"user_id": user_id, "limit": 100}))
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=500, help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=CONCURRENCY)
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)), help="history sizes for list scenarios")
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--baseline", help="compare against this results file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed relative regression (0.15 = 15%%)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{os.path.join(tmp, 'load.db')}"
+        # the ASGI transport doesn't run the lifespan; keep it inert regardless
+        settings.DATABASE_URL = url
+        settings.LAZY_RESULTS = False
+        settings.DB_CREATE_TABLES = False
+        job_runner.workers = 0
+        engine = create_engine(url, connect_args={"check_same_thread": False, "timeout": 30})
+        Base.metadata.create_all(engine)
+        session_factory = sessionmaker(bind=engine, autoflush=False)
+
+        def override_get_db():
+            db = session_factory()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app.dependency_overrides[get_db] = override_get_db
+        user_cache.clear()
+        try:
+            sizes = [int(s) for s in args.sizes.split(",") if s]
+            results = asyncio.run(run_all(session_factory, args.requests, args.concurrency, sizes))
+        finally:
+            app.dependency_overrides.clear()
+            engine.dispose()
+
+    print(f"{'scenario':<28} {'req':>6} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>6}")
+    for name, r in results.items():
+        print(f"{name:<28} {r.requests:>6} {r.rps:9.1f} {r.p50_ms:8.2f} {r.p95_ms:8.2f} {r.p99_ms:8.2f} {r.errors:>6}")
+
+    current = {name: r._asdict() for name, r in results.items()}
+    if args.json:
+        os.makedirs(os.path.dirname(os.path.abspath(args.json)), exist_ok=True)
+        with open(args.json, "w") as f:
+            json.dump({
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "machine": {"python": platform.python_version(), "platform": platform.platform(),
+                            "cpus": os.cpu_count()},
+                "config": {"requests": args.requests, "concurrency": args.concurrency,
+                           "bcrypt_rounds": settings.BCRYPT_ROUNDS},
+                "results": current,
+            }, f, indent=2)
+
+    failed = any(r.errors for r in results.values())
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(current, baseline, args.threshold)
+        for reg in regressions:
+            print(f"REGRESSION {reg.scenario} {reg.metric}: {reg.baseline:.2f} -> {reg.current:.2f} "
+                  f"({reg.change:+.1%} worse)")
+        failed |= bool(regressions)
+        if not regressions:
+            print(f"no regressions beyond {args.threshold:.0%} against {args.baseline}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
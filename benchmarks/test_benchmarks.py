@@ -0,0 +1,136 @@
+# benchmarks/test_benchmarks.py
+"""
+Micro-benchmark suite (pytest-benchmark) for the hot paths of the API.
+
+Not collected by the normal test run (pytest.ini only looks in tests/).
+Run, save a baseline, and later fail on a >10% regression of the median:
+
+    python -m pytest benchmarks --benchmark-only --benchmark-save=baseline
+    python -m pytest benchmarks --benchmark-only --benchmark-json=.benchmarks/latest.json \
+        --benchmark-compare --benchmark-compare-fail=median:10%
+
+End-to-end throughput through the HTTP stack is covered by benchmarks/load.py.
+"""
+import uuid
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from app.hashing import password_hasher
+from app.models.user import User
+from app.operations.calculation import create_calculation, list_calculation_rows
+from app.operations.calculation_bulk import bulk_insert_calculations
+from app.operations.calculation_factory import CalculationFactory
+from app.operations.user import create_user, get_user_by_username
+from app.operations.user_cache import user_cache
+from app.schemas.base import UserCreate
+from app.schemas.calculation import CalculationCreate, calculation_create_list
+
+SIZES = [100, 1_000, 10_000]
+PAYLOAD = {"a": 10.5, "b": 2.0, "type": "Divide", "user_id": "2f1c2c3e-6d0c-4d8a-9a53-0c1b6a9a1f10"}
+
+
+def make_user(db, name: str = "bench") -> User:
+    user = User(first_name="Bench", last_name="User", username=name, email=f"{name}@example.com",
+                password_hash="not-a-real-hash")
+    db.add(user)
+    db.commit()
+    return user
+
+
+def seed_calculations(db, user_id: uuid.UUID, rows: int) -> int:
+    return bulk_insert_calculations(db, (
+        {"a": float(i), "b": 2.0, "type": "multiply", "result": i * 2.0, "user_id": user_id}
+        for i in range(rows)
+    )).rows
+
+
+# ---------------------------------------------------------
+# Calculation engine and validation
+# ---------------------------------------------------------
+@pytest.mark.parametrize("calc_type", ["add", "divide", "expression"])
+def test_factory_compute_scalar(benchmark, calc_type):
+    op = CalculationFactory.create(calc_type, "a * b + a" if calc_type == "expression" else None)
+    assert benchmark(op.compute, 10.0, 4.0) is not None
+
+
+def test_calculation_create_validation(benchmark):
+    calc = benchmark(CalculationCreate.model_validate, PAYLOAD)
+    assert calc.type == "divide"
+
+
+def test_calculation_create_list_validation(benchmark):
+    payloads = [PAYLOAD] * 1000
+    assert len(benchmark(calculation_create_list.validate_python, payloads)) == 1000
+
+
+# ---------------------------------------------------------
+# Users
+# ---------------------------------------------------------
+def test_user_registration_with_bcrypt(benchmark, bench_db):
+    counter = iter(range(10**9))
+
+    def register():
+        n = next(counter)
+        return create_user(bench_db, UserCreate(
+            first_name="Bench", last_name="User", username=f"reg{n}", email=f"reg{n}@example.com",
+            password="Secure123",
+        ))
+
+    # bcrypt dominates (BCRYPT_ROUNDS); a handful of rounds is enough
+    user = benchmark.pedantic(register, rounds=5, iterations=1, warmup_rounds=1)
+    assert password_hasher.stats()["completed"] > 0
+    assert user.username.startswith("reg")
+
+
+@pytest.mark.parametrize("cached", [False, True], ids=["db", "cached"])
+def test_get_user_by_username(benchmark, bench_db, cached):
+    make_user(bench_db)
+
+    def lookup():
+        if not cached:
+            user_cache.clear()
+        return get_user_by_username(bench_db, "bench")
+
+    assert benchmark(lookup).username == "bench"
+
+
+# ---------------------------------------------------------
+# Calculation insert / list at several data sizes
+# ---------------------------------------------------------
+def test_create_calculation(benchmark, bench_db):
+    user = make_user(bench_db)
+    data = CalculationCreate(a=3, b=4, type="multiply", user_id=user.id)
+    assert benchmark(create_calculation, bench_db, data).result == 12
+
+
+@pytest.mark.parametrize("rows", SIZES)
+def test_bulk_insert_calculations(benchmark, bench_db, rows):
+    user = make_user(bench_db)
+    assert benchmark.pedantic(seed_calculations, args=(bench_db, user.id, rows), rounds=5, iterations=1) == rows
+
+
+@pytest.mark.parametrize("rows", SIZES)
+def test_list_calculations_page(benchmark, bench_db, rows):
+    user = make_user(bench_db)
+    seed_calculations(bench_db, user.id, rows)
+    page = benchmark(list_calculation_rows, bench_db, user.id, 100)
+    assert len(page["items"]) == min(rows, 100)
+
+
+@pytest.mark.parametrize("rows", SIZES)
+def test_list_calculations_full_history(benchmark, bench_db, rows):
+    user = make_user(bench_db)
+    seed_calculations(bench_db, user.id, rows)
+
+    def page_through():
+        fetched, cursor = 0, None
+        while True:
+            page = list_calculation_rows(bench_db, user.id, 1000, cursor)
+            fetched += len(page["items"])
+            cursor = page["next_cursor"]
+            if not cursor:
+                return fetched
+
+    assert benchmark.pedantic(page_through, rounds=3, iterations=1) == rows
@@ -1,13 +1,17 @@
 # tests/conftest.py
+from contextlib import contextmanager
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from app.models.user import User
 from app.schemas.base import UserCreate
-from app.database import Base, get_db
+from app.database import Base, get_db, get_async_db
 from app.main import app
+from app.operations.user_cache import user_cache
 
 # --- Test SQLite DB ---
 TEST_DATABASE_URL = "sqlite:///./test.db"
@@ -20,6 +24,16 @@ TestingSessionLocal = sessionmaker(
     autocommit=False, autoflush=False, bind=engine
 )
 
+# Async engine on the same file; NullPool so connections never outlive
+# the event loop that opened them (each test/TestClient has its own loop)
+TEST_ASYNC_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
+
+async_engine = create_async_engine(TEST_ASYNC_DATABASE_URL, poolclass=NullPool)
+
+TestingAsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
 # ------------------------------------------------------
 # SHARED DB FIXTURE (unit + integration)
 # ------------------------------------------------------
@@ -28,6 +42,7 @@ def db():
     """Create a clean database before each test."""
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
+    user_cache.clear()  # drop_all bypasses the session-level invalidation
 
     session = TestingSessionLocal()
     try:
@@ -47,7 +62,12 @@ def client():
         finally:
             session.close()
 
+    async def override_get_async_db():
+        async with TestingAsyncSessionLocal() as session:
+            yield session
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     return TestClient(app)
 
 @pytest.fixture(scope="function")
@@ -55,6 +75,7 @@ def db_session():
     """Secondary DB fixture used by some unit tests."""
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
+    user_cache.clear()
 
     session = TestingSessionLocal()
     try:
@@ -78,3 +99,34 @@ def test_user(db_session):
     db_session.commit()
     db_session.refresh(user)
     return user
+
+# ------------------------------------------------------
+# Query counting (catches N+1 regressions)
+# ------------------------------------------------------
+@contextmanager
+def count_queries(bind=None):
+    """Collect the SQL statements executed on `bind` (default: the test engine)."""
+    bind = bind or engine
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(bind, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(bind, "before_cursor_execute", record)
+
+@contextmanager
+def _assert_num_queries(expected: int, bind=None):
+    with count_queries(bind) as statements:
+        yield statements
+    assert len(statements) == expected, (
+        f"expected {expected} queries, got {len(statements)}:\n" + "\n".join(statements)
+    )
+
+@pytest.fixture
+def assert_num_queries():
+    """`with assert_num_queries(2): client.get(...)` fails on any other count."""
+    return _assert_num_queries
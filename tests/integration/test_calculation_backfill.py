@@ -0,0 +1,123 @@
+# tests/integration/test_calculation_backfill.py
+import asyncio
+import json
+
+import pytest
+
+from app.config import settings
+from app.models.calculation import Calculation
+from app.operations.calculation import create_calculation, get_calculation
+from app.operations.calculation_backfill import BackfillWorker, backfill_worker
+from app.operations.calculation_bulk import bulk_insert_calculations
+from app.operations.calculation_stats import get_user_stats, rebuild_stats
+from app.schemas.calculation import CalculationCreate
+from tests.conftest import TestingSessionLocal
+
+
+@pytest.fixture
+def lazy_results(monkeypatch):
+    monkeypatch.setattr(settings, "LAZY_RESULTS", True)
+
+
+def _pending(db):
+    return db.query(Calculation).filter(Calculation.result.is_(None)).count()
+
+
+def test_lazy_create_defers_result_until_read(db_session, test_user, lazy_results):
+    created = create_calculation(db_session, CalculationCreate(a=6, b=7, type="multiply", user_id=test_user.id))
+    assert created.result is None
+    assert _pending(db_session) == 1
+    assert get_user_stats(db_session, test_user.id)[0].sum_result is None
+
+    fetched = get_calculation(db_session, created.id)
+    assert fetched.result == 42
+    assert _pending(db_session) == 0
+
+    stats = get_user_stats(db_session, test_user.id)[0]
+    assert stats.count == 1
+    assert stats.sum_result == 42
+
+
+def test_backfill_worker_fills_in_batches(db_session, test_user, lazy_results):
+    rows = [{"a": i, "b": 2, "type": "add", "user_id": test_user.id} for i in range(25)]
+    rows.append({"a": 1, "b": 0, "type": "expression", "expression": "a / b", "user_id": test_user.id})
+    bulk_insert_calculations(db_session, rows)
+
+    worker = BackfillWorker(TestingSessionLocal, batch_size=10, interval=0.01)
+    assert worker.lag()["pending_rows"] == 26
+
+    assert worker.drain() == 26
+    stats = worker.stats()
+    assert stats["rows_filled"] == 26
+    assert stats["batches"] == 3
+    assert stats["pending_rows"] == 0
+    assert stats["rows_per_second"] > 0
+
+    db_session.expire_all()
+    failed = db_session.query(Calculation).filter_by(type="expression").one()
+    assert failed.result is None
+    assert failed.result_error == "Cannot divide by zero"
+    assert db_session.query(Calculation).filter_by(a=3).one().result == 5
+
+    # incremental stats after backfill match a full rebuild
+    incremental = [s.model_dump() for s in get_user_stats(db_session, test_user.id)]
+    rebuild_stats(db_session)
+    assert [s.model_dump() for s in get_user_stats(db_session, test_user.id)] == incremental
+    assert incremental[0]["sum_result"] == sum(range(25)) + 50
+
+
+def test_backfill_marks_rows_it_cannot_compute_instead_of_retrying(db_session, test_user, lazy_results):
+    # e.g. a plugin operation that was unregistered after these rows were stored
+    bulk_insert_calculations(db_session, [
+        {"a": 2, "b": 3, "type": "power", "user_id": test_user.id},
+        {"a": 2, "b": 3, "type": "add", "user_id": test_user.id},
+    ])
+    worker = BackfillWorker(TestingSessionLocal, batch_size=10, interval=0.01)
+
+    assert worker.drain() == 2
+    assert worker.lag()["pending_rows"] == 0
+    db_session.expire_all()
+    poisoned = db_session.query(Calculation).filter_by(type="power").one()
+    assert poisoned.result is None
+    assert poisoned.result_error == "Invalid calculation type: power"
+    assert db_session.query(Calculation).filter_by(type="add").one().result == 5
+
+
+def test_backfill_worker_background_task(db_session, test_user, lazy_results):
+    bulk_insert_calculations(db_session, [{"a": 1, "b": 1, "type": "sub", "user_id": test_user.id}])
+    worker = BackfillWorker(TestingSessionLocal, batch_size=10, interval=0.01)
+
+    async def scenario():
+        worker.start()
+        for _ in range(100):
+            if worker.rows_filled:
+                break
+            await asyncio.sleep(0.01)
+        running = worker.stats()["running"]
+        await worker.stop()
+        return running
+
+    assert asyncio.run(scenario())
+    assert worker.rows_filled == 1
+    assert worker.stats()["running"] is False
+
+
+def test_lazy_ingest_and_export(client, db_session, test_user, lazy_results):
+    body = "\n".join(
+        json.dumps({"a": i, "b": 4, "type": "divide", "user_id": str(test_user.id)}) for i in range(3)
+    )
+    assert client.post("/calculations/ingest", content=body).json()["inserted"] == 3
+    assert _pending(db_session) == 3
+
+    exported = client.get("/calculations/export", params={"user_id": str(test_user.id)})
+    results = sorted(json.loads(line)["result"] for line in exported.text.splitlines())
+    assert results == [0, 0.25, 0.5]
+    # export computes on the fly but leaves persistence to the backfill worker
+    assert _pending(db_session) == 3
+
+
+def test_health_backfill(client, monkeypatch, db_session):
+    monkeypatch.setattr(backfill_worker, "session_factory", TestingSessionLocal)
+    body = client.get("/health/backfill").json()
+    assert body["pending_rows"] == 0
+    assert "rows_per_second" in body
@@ -0,0 +1,82 @@
+# tests/integration/test_calculation_bulk.py
+import uuid
+
+from app.models.calculation import Calculation
+from app.models.user import User
+from app.operations.calculation_batch import CalculationBatch
+from app.operations.calculation_bulk import (
+    bulk_insert_batch,
+    bulk_insert_calculations,
+    _copy_buffer,
+    _prepare_rows,
+)
+
+
+def test_bulk_insert_calculations(db):
+    user = User(
+        first_name="Bulk",
+        last_name="User",
+        username="bulk_user",
+        email="bulk@example.com",
+        password_hash="not-a-real-hash",
+    )
+    db.add(user)
+    db.commit()
+
+    rows = [
+        {"a": i, "b": 2, "type": "multiply", "result": i * 2, "user_id": user.id}
+        for i in range(500)
+    ]
+    summary = bulk_insert_calculations(db, rows)
+
+    assert summary.rows == 500
+    assert summary.rows_per_second > 0
+    assert db.query(Calculation).count() == 500
+
+    saved = db.query(Calculation).filter_by(a=7).one()
+    assert saved.result == 14
+    assert saved.user_id == user.id
+    assert saved.created_at is not None
+
+
+def test_bulk_insert_empty(db):
+    summary = bulk_insert_calculations(db, [])
+    assert summary.rows == 0
+    assert summary.rows_per_second == 0.0
+
+
+def test_copy_buffer_renders_nulls_as_empty_fields():
+    calc_id = uuid.uuid4()
+    rows = _prepare_rows([{"id": calc_id, "a": 1.5, "b": 0, "type": "divide"}])
+    line = _copy_buffer(rows).getvalue().strip()
+    fields = line.split(",")
+
+    assert fields[0] == str(calc_id)
+    assert fields[1:4] == ["1.5", "0", "divide"]
+    assert fields[4] == ""   # result NULL
+    assert fields[5] == ""   # user_id NULL
+
+
+def test_bulk_insert_batch(db):
+    user = User(
+        first_name="Batch",
+        last_name="User",
+        username="batch_user",
+        email="batch@example.com",
+        password_hash="not-a-real-hash",
+    )
+    db.add(user)
+    db.commit()
+
+    batch = CalculationBatch.from_columns(
+        list(range(100)), [i % 10 for i in range(100)], ["divide"] * 100, user_id=user.id
+    )
+    errors = batch.compute()
+    summary = bulk_insert_batch(db, batch[~errors])
+
+    assert summary.rows == 90
+    assert db.query(Calculation).count() == 90
+    saved = db.query(Calculation).filter_by(a=42).one()
+    assert saved.result == 21
+    assert saved.user_id == user.id
+    assert saved.created_at is not None
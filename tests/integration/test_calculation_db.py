@@ -6,6 +6,7 @@ from uuid import uuid4
 from app.models.calculation import Calculation
 from app.models.user import User
 from app.schemas.calculation import CalculationCreate
+from app.operations.calculation import create_calculation
 from app.operations.calculation_factory import CalculationFactory
 
 
@@ -98,3 +99,12 @@ def test_calculation_relationship(db):
     assert len(user.calculations) == 1
     assert user.calculations[0].result == 4
     assert user.calculations[0].type == "divide"
+
+
+def test_create_calculation_operation(db):
+    """create_calculation computes through the cache and persists the row."""
+    created = create_calculation(db, CalculationCreate(a=6, b=4, type="sub"))
+
+    assert created.result == 2
+    saved = db.query(Calculation).filter_by(id=created.id).one()
+    assert saved.result == 2
@@ -0,0 +1,61 @@
+# tests/integration/test_calculation_export.py
+import csv
+import gzip
+import io
+import json
+
+from app.operations.calculation_bulk import bulk_insert_calculations
+from app.operations import calculation_export
+
+
+def _seed(db_session, user, count):
+    rows = [
+        {"a": i, "b": 2, "type": "multiply", "result": i * 2, "user_id": user.id}
+        for i in range(count)
+    ]
+    bulk_insert_calculations(db_session, rows)
+
+
+def test_export_ndjson(client, db_session, test_user, monkeypatch):
+    # small chunks so the response is produced over several iterations
+    monkeypatch.setattr(calculation_export, "EXPORT_CHUNK_ROWS", 7)
+    _seed(db_session, test_user, 30)
+
+    res = client.get("/calculations/export", params={"user_id": str(test_user.id)})
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("application/x-ndjson")
+
+    lines = [json.loads(line) for line in res.text.splitlines()]
+    assert len(lines) == 30
+    assert {line["a"] for line in lines} == set(range(30))
+    assert all(line["result"] == line["a"] * 2 for line in lines)
+
+
+def test_export_csv_gzip(client, db_session, test_user):
+    _seed(db_session, test_user, 12)
+
+    res = client.get(
+        "/calculations/export",
+        params={"user_id": str(test_user.id), "format": "csv", "gzip": "true"},
+    )
+    assert res.status_code == 200
+    assert res.headers["content-type"] == "application/gzip"
+    assert "calculations.csv.gz" in res.headers["content-disposition"]
+
+    rows = list(csv.DictReader(io.StringIO(gzip.decompress(res.content).decode())))
+    assert len(rows) == 12
+    assert rows[0].keys() == set(calculation_export.EXPORT_COLUMNS)
+
+
+def test_export_empty_history_csv_has_header(client, db_session, test_user):
+    res = client.get(
+        "/calculations/export", params={"user_id": str(test_user.id), "format": "csv"}
+    )
+    assert res.text.strip() == ",".join(calculation_export.EXPORT_COLUMNS)
+
+
+def test_export_rejects_unknown_format(client, test_user):
+    res = client.get(
+        "/calculations/export", params={"user_id": str(test_user.id), "format": "xml"}
+    )
+    assert res.status_code == 422
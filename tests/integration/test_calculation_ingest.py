@@ -0,0 +1,95 @@
+# tests/integration/test_calculation_ingest.py
+import asyncio
+import json
+
+from app.models.calculation import Calculation
+from app.operations import calculation_ingest
+from app.operations.calculation_factory import CalculationFactory
+from app.operations.calculation_ingest import iter_lines, ingest_calculations, ingest_chunk
+
+
+async def _stream(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+def test_iter_lines_handles_split_chunks():
+    async def collect():
+        return [item async for item in iter_lines(_stream(b'{"a"', b": 1}\n{\"a\": 2}\r\n", b"tail"))]
+
+    assert asyncio.run(collect()) == [(1, '{"a": 1}'), (2, '{"a": 2}'), (3, "tail")]
+
+
+def test_ingest_ndjson_reports_per_line_errors(client, db_session, test_user):
+    lines = [
+        {"a": 1, "b": 2, "type": "add", "user_id": str(test_user.id)},
+        {"a": 4, "b": 0, "type": "divide"},
+        {"a": 3, "b": 3, "type": "multiply"},
+        {"a": 1, "b": 1, "type": "pow"},
+    ]
+    body = "\n".join(json.dumps(line) for line in lines) + "\nnot json\n\n"
+
+    res = client.post(
+        "/calculations/ingest", content=body, headers={"Content-Type": "application/x-ndjson"}
+    )
+    assert res.status_code == 200, res.text
+    summary = res.json()
+    assert summary["received"] == 5
+    assert summary["inserted"] == 2
+    assert summary["failed"] == 3
+    assert [err["line"] for err in summary["errors"]] == [2, 4, 5]
+    assert "divide by zero" in summary["errors"][0]["error"]
+
+    results = sorted(calc.result for calc in db_session.query(Calculation).all())
+    assert results == [3, 9]
+
+
+def test_ingest_csv_in_chunks(db_session, test_user):
+    rows = "\n".join(f"{i},2,sub,{test_user.id}" for i in range(25))
+    body = ("a,b,type,user_id\n" + rows + "\n1,2\n").encode()
+
+    summary = asyncio.run(
+        ingest_calculations(db_session, _stream(body[:50], body[50:]), fmt="csv", chunk_size=10)
+    )
+
+    assert summary.received == 26
+    assert summary.inserted == 25
+    assert summary.failed == 1
+    assert summary.errors[0].line == 27
+    assert db_session.query(Calculation).filter_by(user_id=test_user.id).count() == 25
+
+
+def test_ingest_csv_requires_header_columns(client):
+    res = client.post(
+        "/calculations/ingest", content="x,y\n1,2\n", headers={"Content-Type": "text/csv"}
+    )
+    assert res.status_code == 400
+
+
+def test_ingest_chunk_fails_only_the_group_that_cannot_be_computed(db_session, monkeypatch):
+    class StaleFactory(CalculationFactory):
+        """As if "a * b - 1" used an operation unregistered after validation."""
+        @classmethod
+        def create(cls, calc_type, expression=None):
+            if expression == "a * b - 1":
+                raise ValueError("Unsupported operation in expression: gone")
+            return super().create(calc_type, expression)
+
+    monkeypatch.setattr(calculation_ingest, "CalculationFactory", StaleFactory)
+    records = [
+        (1, {"a": 1, "b": 2, "type": "add"}),
+        (2, {"a": 2, "b": 3, "type": "expression", "expression": "a * b - 1"}),
+        (3, {"a": 1, "b": 0, "type": "expression", "expression": "a / b"}),
+        (4, {"a": 4, "b": 2, "type": "expression", "expression": "a * b - 1"}),
+        (5, {"a": 6, "b": 3, "type": "divide"}),
+    ]
+
+    inserted, errors = ingest_chunk(db_session, records)
+
+    assert inserted == 2
+    assert [(err.line, err.error) for err in errors] == [
+        (2, "Unsupported operation in expression: gone"),
+        (3, "Cannot divide by zero"),
+        (4, "Unsupported operation in expression: gone"),
+    ]
+    assert sorted(calc.result for calc in db_session.query(Calculation).all()) == [2, 3]
@@ -0,0 +1,141 @@
+# tests/integration/test_calculation_jobs.py
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+from app.models.calculation import Calculation
+from app.models.calculation_job import CalculationJob
+from app.operations.calculation_jobs import JobRunner, claim_job, run_job, submit_job
+from app.schemas.job import JobCreate
+from tests.conftest import TestingSessionLocal
+
+
+def _runner(**kwargs):
+    options = {"workers": 1, "poll_interval": 0.01, "lease_seconds": 60}
+    options.update(kwargs)
+    return JobRunner(TestingSessionLocal, **options)
+
+
+def _job(db, count, chunk_size=10, **extra):
+    data = JobCreate(a=list(range(count)), b=[2] * count, type=["multiply"] * count, **extra)
+    job = submit_job(db, data)
+    db.query(CalculationJob).filter_by(id=job.id).update({"chunk_size": chunk_size})
+    db.commit()
+    return job
+
+
+def test_submit_and_poll_job(client, db_session, test_user):
+    payload = {
+        "a": [1, 2, 3],
+        "b": [1, 0, 3],
+        "type": ["add", "divide", "multiply"],
+        "user_id": str(test_user.id),
+    }
+    submitted = client.post("/jobs/", json=payload)
+    assert submitted.status_code == 202, submitted.text
+    job = submitted.json()
+    assert job["status"] == "queued"
+    assert job["progress"] == 0
+
+    assert _runner().run_pending() == 1
+
+    done = client.get(f"/jobs/{job['id']}").json()
+    assert done["status"] == "completed"
+    assert done["progress"] == 1
+    assert done["inserted"] == 2
+    assert done["failed"] == 1
+    assert done["errors"] == [{"index": 1, "error": "Cannot divide by zero"}]
+    assert done["finished_at"] is not None
+
+    results = sorted(c.result for c in db_session.query(Calculation).filter_by(user_id=test_user.id))
+    assert results == [2, 9]
+
+    assert client.get(f"/jobs/{test_user.id}").status_code == 404
+
+
+def test_job_resumes_after_worker_restart(db_session):
+    job = _job(db_session, 25, chunk_size=10)
+
+    # simulate a worker that committed one chunk and then died holding the lease
+    owner = "dead-worker"
+    assert claim_job(db_session, owner, lease_seconds=60) == job.id
+    db_session.query(CalculationJob).filter_by(id=job.id).update({"total": 10})
+    db_session.commit()
+    assert run_job(db_session, job.id, owner, lease_seconds=60)
+    db_session.query(CalculationJob).filter_by(id=job.id).update({
+        "total": 25, "status": "running",
+        "lease_expires_at": datetime.utcnow() - timedelta(seconds=1),
+    })
+    db_session.commit()
+
+    assert _runner().run_pending() == 1
+
+    db_session.expire_all()
+    saved = db_session.get(CalculationJob, job.id)
+    assert saved.status == "completed"
+    assert saved.processed == 25
+    assert db_session.query(Calculation).count() == 25  # nothing inserted twice
+
+
+def test_live_lease_is_not_stolen(db_session):
+    job = _job(db_session, 5)
+    assert claim_job(db_session, "worker-a", lease_seconds=60) == job.id
+    assert claim_job(db_session, "worker-b", lease_seconds=60) is None
+
+
+def test_stale_worker_cannot_complete_a_job_it_lost(db_session):
+    job = _job(db_session, 5)
+    assert claim_job(db_session, "worker-a", lease_seconds=60) == job.id
+    # worker-a finished the last chunk, then its lease expired and worker-b took over
+    db_session.query(CalculationJob).filter_by(id=job.id).update({"processed": 5, "lease_owner": "worker-b"})
+    db_session.commit()
+
+    assert run_job(db_session, job.id, "worker-a", lease_seconds=60) is False
+    db_session.expire_all()
+    saved = db_session.get(CalculationJob, job.id)
+    assert saved.status == "running"
+    assert saved.lease_owner == "worker-b"
+    assert saved.finished_at is None
+
+
+def test_job_errors_carry_the_row_reason(db_session):
+    data = JobCreate(a=[1, 4], b=[1, 2], type=["expression"] * 2, expression=["a / (b - 1)"] * 2)
+    job = submit_job(db_session, data)
+    assert _runner().run_pending() == 1
+    db_session.expire_all()
+    saved = db_session.get(CalculationJob, job.id)
+    assert json.loads(saved.errors) == [{"index": 0, "error": "Cannot divide by zero"}]
+    assert saved.inserted == 1
+
+
+def test_failed_job_reports_error(db_session):
+    job = _job(db_session, 3)
+    db_session.query(CalculationJob).filter_by(id=job.id).update({"payload": json.dumps({"a": [1]})})
+    db_session.commit()
+
+    runner = _runner()
+    assert runner.run_next() == job.id
+    db_session.expire_all()
+    saved = db_session.get(CalculationJob, job.id)
+    assert saved.status == "failed"
+    assert saved.error
+    assert runner.stats()["jobs_failed"] == 1
+
+
+def test_async_workers_process_jobs(db_session):
+    job = _job(db_session, 30)
+    runner = _runner(workers=2)
+
+    async def scenario():
+        runner.start()
+        for _ in range(200):
+            if runner.jobs_completed:
+                break
+            await asyncio.sleep(0.01)
+        workers = runner.stats()["workers"]
+        await runner.stop()
+        return workers
+
+    assert asyncio.run(scenario()) == 2
+    db_session.expire_all()
+    assert db_session.get(CalculationJob, job.id).status == "completed"
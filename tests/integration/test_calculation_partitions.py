@@ -0,0 +1,65 @@
+# tests/integration/test_calculation_partitions.py
+import csv
+import gzip
+from datetime import datetime
+
+from app.models.calculation import Calculation
+from app.operations.calculation_bulk import bulk_insert_calculations
+from app.operations.calculation_partitions import PartitionMaintenance, apply_retention
+from tests.conftest import engine
+
+
+def _insert(db, user, created_at, count):
+    bulk_insert_calculations(db, [
+        {"a": i, "b": 1, "type": "add", "user_id": user.id, "created_at": created_at} for i in range(count)
+    ])
+
+
+def test_sqlite_retention_archives_and_deletes_old_months(db_session, test_user, tmp_path):
+    _insert(db_session, test_user, datetime(2026, 6, 15), 3)
+    _insert(db_session, test_user, datetime(2026, 7, 31, 23, 59), 2)
+    _insert(db_session, test_user, datetime(2026, 8, 1), 4)
+
+    archived = apply_retention(engine, keep_months=2, archive_dir=str(tmp_path), now=datetime(2026, 10, 18))
+
+    assert [(m.month, m.rows) for m in archived] == [(datetime(2026, 6, 1), 3), (datetime(2026, 7, 1), 2)]
+    with gzip.open(archived[0].path, "rt", newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == [c.name for c in Calculation.__table__.columns]
+    assert len(rows) == 4
+
+    db_session.expire_all()
+    assert db_session.query(Calculation).count() == 4
+    assert db_session.query(Calculation).filter(Calculation.created_at < datetime(2026, 8, 1)).count() == 0
+
+
+def test_retention_never_overwrites_an_earlier_archive(db_session, test_user, tmp_path):
+    now = datetime(2026, 10, 18)
+    _insert(db_session, test_user, datetime(2026, 1, 10), 1)
+    first = apply_retention(engine, keep_months=1, archive_dir=str(tmp_path), now=now)
+    _insert(db_session, test_user, datetime(2026, 1, 20), 1)  # late arrival for an archived month
+    second = apply_retention(engine, keep_months=1, archive_dir=str(tmp_path), now=now)
+
+    assert first[0].path != second[0].path
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "calculations_y2026m01.1.csv.gz", "calculations_y2026m01.csv.gz",
+    ]
+
+
+def test_maintenance_pass_reports_stats(db_session, test_user, tmp_path):
+    _insert(db_session, test_user, datetime(2025, 1, 1), 2)
+
+    worker = PartitionMaintenance(lambda: engine, interval=60, keep_months=3, archive_dir=str(tmp_path))
+    worker.run_once(datetime(2026, 10, 18))
+
+    stats = worker.stats()
+    assert stats["partitioned"] is False
+    assert stats["months_archived"] == 1
+    assert stats["rows_archived"] == 2
+    assert stats["last_run"] is not None
+
+
+def test_health_partitions(client):
+    body = client.get("/health/partitions").json()
+    assert body["partitioned"] is False
+    assert {"running", "partitions_created", "months_archived", "rows_archived", "last_run"} <= body.keys()
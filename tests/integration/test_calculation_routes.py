@@ -0,0 +1,89 @@
+# tests/integration/test_calculation_routes.py
+from datetime import datetime, timedelta
+
+from sqlalchemy import inspect
+
+from app.operations.calculation import list_calculations
+from app.operations.calculation_bulk import bulk_insert_calculations
+from tests.conftest import engine
+
+
+def test_calculation_crud(client, test_user):
+    payload = {"a": 7, "b": 3, "type": "Multiply", "user_id": str(test_user.id)}
+    created = client.post("/calculations/", json=payload)
+    assert created.status_code == 200, created.text
+    body = created.json()
+    assert body["result"] == 21
+    assert body["type"] == "multiply"
+
+    fetched = client.get(f"/calculations/{body['id']}")
+    assert fetched.status_code == 200
+    assert fetched.json()["result"] == 21
+
+    assert client.delete(f"/calculations/{body['id']}").status_code == 204
+    assert client.get(f"/calculations/{body['id']}").status_code == 404
+    assert client.delete(f"/calculations/{body['id']}").status_code == 404
+
+
+def test_list_calculations_keyset_pagination(client, db_session, test_user):
+    base = datetime(2024, 1, 1)
+    # two rows share each timestamp so the id tiebreaker is exercised
+    rows = [
+        {"a": i, "b": 1, "type": "add", "result": i + 1,
+         "user_id": test_user.id, "created_at": base + timedelta(minutes=i // 2)}
+        for i in range(25)
+    ]
+    bulk_insert_calculations(db_session, rows)
+
+    seen, cursor = [], None
+    while True:
+        params = {"user_id": str(test_user.id), "limit": 10}
+        if cursor:
+            params["cursor"] = cursor
+        res = client.get("/calculations/", params=params)
+        assert res.status_code == 200, res.text
+        page = res.json()
+        seen.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(seen) == 25
+    assert len(set(seen)) == 25
+
+    # newest first, matching a single unpaginated read
+    full = list_calculations(db_session, test_user.id, limit=100)
+    assert [str(item.id) for item in full.items] == seen
+    assert full.next_cursor is None
+
+
+def test_list_calculations_rejects_bad_cursor(client, test_user):
+    res = client.get("/calculations/", params={"user_id": str(test_user.id), "cursor": "bogus"})
+    assert res.status_code == 400
+
+
+def test_calculations_keyset_index_exists(db):
+    indexes = inspect(engine).get_indexes("calculations")
+    assert any(
+        idx["column_names"] == ["user_id", "created_at", "id"] for idx in indexes
+    )
+
+
+def test_list_endpoint_matches_model_serialization(client, db_session, test_user):
+    rows = [
+        {"a": 1, "b": 2, "type": "add", "result": 3, "user_id": test_user.id},
+        # deferred results are filled (and persisted) by the column-only path too
+        {"a": 6, "b": 3, "type": "divide", "result": None, "user_id": test_user.id},
+        {"a": 2, "b": 5, "type": "expression", "expression": "a * b", "result": None,
+         "user_id": test_user.id},
+    ]
+    bulk_insert_calculations(db_session, rows)
+
+    res = client.get("/calculations/", params={"user_id": str(test_user.id)})
+    assert res.status_code == 200
+    assert res.headers["content-type"] == "application/json"
+
+    db_session.expire_all()
+    expected = list_calculations(db_session, test_user.id)
+    assert res.json() == expected.model_dump(mode="json")
+    assert sorted(item["result"] for item in res.json()["items"]) == [2, 3, 10]
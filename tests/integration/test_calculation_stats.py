@@ -0,0 +1,101 @@
+# tests/integration/test_calculation_stats.py
+from datetime import datetime
+
+import pytest
+
+from app.models.calculation import Calculation
+from app.models.calculation_stats import CalculationStats
+from app.operations.calculation import create_calculation, delete_calculation
+from app.operations.calculation_bulk import bulk_insert_calculations
+from app.operations.calculation_stats import get_user_stats, rebuild_stats
+from app.schemas.calculation import CalculationCreate
+
+
+def _stats_by_type(db, user_id):
+    return {row.type: row for row in get_user_stats(db, user_id)}
+
+
+def _snapshot(db):
+    return sorted(
+        (str(s.user_id), s.type, s.count, s.result_count, s.sum_result,
+         s.min_result, s.max_result, s.last_activity)
+        for s in db.query(CalculationStats).all()
+    )
+
+
+def test_stats_follow_orm_and_bulk_inserts(db_session, test_user):
+    create_calculation(db_session, CalculationCreate(a=1, b=2, type="add", user_id=test_user.id))
+    bulk_insert_calculations(
+        db_session,
+        [{"a": i, "b": 1, "type": "add", "result": i + 1, "user_id": test_user.id} for i in range(5)]
+        + [{"a": 6, "b": 3, "type": "divide", "result": 2.0, "user_id": test_user.id}],
+    )
+
+    stats = _stats_by_type(db_session, test_user.id)
+    assert stats["add"].count == 6
+    assert stats["add"].sum_result == 3 + 15
+    assert stats["add"].min_result == 1
+    assert stats["add"].max_result == 5
+    assert stats["add"].mean_result == pytest.approx(3.0)
+    assert stats["divide"].count == 1
+    assert stats["add"].last_activity is not None
+
+
+def test_stats_recomputed_on_delete_and_update(db_session, test_user):
+    low = create_calculation(db_session, CalculationCreate(a=1, b=1, type="sub", user_id=test_user.id))
+    create_calculation(db_session, CalculationCreate(a=9, b=1, type="sub", user_id=test_user.id))
+
+    assert delete_calculation(db_session, low.id)
+    stats = _stats_by_type(db_session, test_user.id)
+    assert stats["sub"].count == 1
+    assert stats["sub"].min_result == 8
+
+    # moving the last row to another type empties the old group
+    calc = db_session.query(Calculation).one()
+    calc.type, calc.result = "add", 10
+    db_session.commit()
+    stats = _stats_by_type(db_session, test_user.id)
+    assert "sub" not in stats
+    assert stats["add"].max_result == 10
+
+
+def test_stats_removed_with_user(db_session, test_user):
+    create_calculation(db_session, CalculationCreate(a=1, b=1, type="add", user_id=test_user.id))
+    db_session.delete(test_user)
+    db_session.commit()
+    assert db_session.query(CalculationStats).count() == 0
+
+
+def test_rebuild_matches_incremental(db_session, test_user):
+    rows = [
+        {"a": i, "b": 2, "type": t, "result": r, "user_id": test_user.id,
+         "created_at": datetime(2024, 1, 1 + i)}
+        for i, (t, r) in enumerate([("add", 3), ("add", None), ("multiply", -4), ("divide", 0.5)])
+    ]
+    bulk_insert_calculations(db_session, rows)
+    incremental = _snapshot(db_session)
+
+    db_session.query(CalculationStats).delete()
+    db_session.commit()
+    assert rebuild_stats(db_session) == 3
+    assert _snapshot(db_session) == incremental
+
+
+def test_stats_endpoint(client, db_session, test_user):
+    bulk_insert_calculations(
+        db_session, [{"a": 2, "b": 2, "type": "multiply", "result": 4, "user_id": test_user.id}]
+    )
+    res = client.get("/calculations/stats", params={"user_id": str(test_user.id)})
+    assert res.status_code == 200
+    assert res.json() == [
+        {
+            "user_id": str(test_user.id),
+            "type": "multiply",
+            "count": 1,
+            "sum_result": 4.0,
+            "min_result": 4.0,
+            "max_result": 4.0,
+            "mean_result": 4.0,
+            "last_activity": res.json()[0]["last_activity"],
+        }
+    ]
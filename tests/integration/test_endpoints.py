@@ -1,6 +1,9 @@
 # tests/integration/test_endpoints.py
 from uuid import UUID
 
+from app.operations.calculation_cache import calculation_cache
+from app.operations.calculation_executor import calculation_executor
+
 """
 # tests/integration/test_endpoints.py
 def test_create_and_get_user_via_api(client):
@@ -29,3 +32,186 @@ def test_root_or_docs(client):
     response = client.get("/docs")
     assert response.status_code == 200
 
+
+
+def test_calculation_batch_endpoint(client):
+    payload = {
+        "a": [1, 10, 6, 8],
+        "b": [2, 0, 3, 2],
+        "type": ["add", "divide", "Multiply", "divide"],
+    }
+    response = client.post("/calculations/batch", json=payload)
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["results"] == [3, None, 18, 4]
+    assert body["errors"] == [False, True, False, False]
+
+
+def test_calculation_batch_endpoint_rejects_bad_input(client):
+    response = client.post(
+        "/calculations/batch", json={"a": [1, 2], "b": [1], "type": ["add", "add"]}
+    )
+    assert response.status_code == 422
+
+    response = client.post(
+        "/calculations/batch", json={"a": [1], "b": [1], "type": ["pow"]}
+    )
+    assert response.status_code == 422
+
+
+def test_calculation_batch_endpoint_reports_compute_errors(client, monkeypatch):
+    def unregistered(*args):
+        raise ValueError("Invalid calculation type: scale")
+
+    monkeypatch.setattr(calculation_executor, "compute_batch", unregistered)
+    response = client.post("/calculations/batch", json={"a": [1], "b": [1], "type": ["add"]})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid calculation type: scale"
+
+
+def test_health_db_reports_pool_status(client):
+    response = client.get("/health/db")
+    assert response.status_code == 200
+    body = response.json()
+    assert "checkedin" in body
+    assert "checkedout" in body
+
+
+def test_async_user_routes(client, db):
+    data = {
+        "username": "asyncraj",
+        "email": "asyncraj@example.com",
+        "password": "Secure123",
+        "first_name": "Rajat",
+        "last_name": "Async",
+    }
+    res = client.post("/async/users/", json=data)
+    assert res.status_code == 200, res.text
+    assert res.json()["username"] == "asyncraj"
+
+    duplicate = client.post("/async/users/", json=data)
+    assert duplicate.status_code == 400
+
+    get_res = client.get("/async/users/asyncraj")
+    assert get_res.status_code == 200
+    assert get_res.json()["email"] == "asyncraj@example.com"
+
+    assert client.get("/async/users/nobody").status_code == 404
+
+
+def test_health_hashing_reports_worker_stats(client):
+    response = client.get("/health/hashing")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["workers"] > 0
+    assert "queue_depth" in body
+    assert "mean_seconds" in body
+
+
+def test_calculation_compute_endpoint_uses_cache(client):
+    calculation_cache.clear()
+    payload = {"a": 9, "b": 3, "type": "divide"}
+    for _ in range(2):
+        response = client.post("/calculations/compute", json=payload)
+        assert response.status_code == 200, response.text
+        assert response.json()["result"] == 3
+
+    stats = client.get("/health/cache").json()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_expression_endpoint_evaluates_many_bindings(client):
+    payload = {"expression": "x * (y + 1)", "variables": {"x": [1, 2, 3], "y": [0, 1, -1]}}
+    response = client.post("/calculations/expression", json=payload)
+    assert response.status_code == 200, response.text
+    assert response.json()["results"] == [1, 4, 0]
+
+    missing = client.post("/calculations/expression", json={"expression": "x + z", "variables": {"x": [1]}})
+    assert missing.status_code == 422
+
+
+def test_expression_with_oversized_literal_is_a_client_error(client):
+    huge = "9" * 400
+    response = client.post("/calculations/expression", json={"expression": f"x + {huge}", "variables": {"x": [1]}})
+    assert response.status_code == 422
+    assert "number too large" in response.text
+
+    response = client.post("/calculations/compute", json={"a": 1, "b": 2, "type": "expression", "expression": f"a + {huge}"})
+    assert response.status_code == 422
+    assert "number too large" in response.text
+
+
+def test_expression_calculation_create_and_batch(client):
+    created = client.post(
+        "/calculations/", json={"a": 3, "b": 4, "type": "expression", "expression": "a * b - a"}
+    )
+    assert created.status_code == 200, created.text
+    assert created.json()["result"] == 9
+    assert created.json()["expression"] == "a * b - a"
+
+    bad = client.post(
+        "/calculations/", json={"a": 3, "b": 0, "type": "expression", "expression": "a / b"}
+    )
+    assert bad.status_code == 400
+
+    batch = client.post(
+        "/calculations/batch",
+        json={"a": [1, 2], "b": [2, 0], "type": ["add", "expression"], "expression": [None, "a / b"]},
+    )
+    assert batch.status_code == 200, batch.text
+    assert batch.json() == {"results": [3, None], "errors": [False, True]}
+
+
+def test_health_users_reports_cache_hit_ratio(client, db):
+    for _ in range(2):
+        assert client.get("/async/users/nobody_here").status_code == 404
+
+    stats = client.get("/health/users").json()
+    assert stats["misses"] == 1
+    assert stats["negative_hits"] == 1
+    assert stats["hit_ratio"] == 0.5
+
+
+def test_bulk_user_registration_endpoint(client, db):
+    users = [
+        {"username": f"bulk{i}", "email": f"bulk{i}@example.com", "password": "Secure123",
+         "first_name": "Bulk", "last_name": "User"}
+        for i in range(3)
+    ]
+    response = client.post("/users/bulk", json={"users": users + users[:1]})
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["created"] == 3
+    assert [row["status"] for row in body["results"]] == ["created"] * 3 + ["duplicate"]
+
+    again = client.post("/users/bulk", json={"users": users[:1]}).json()
+    assert again["results"][0]["status"] == "conflict"
+    assert client.get("/users/bulk1").json()["email"] == "bulk1@example.com"
+
+
+def test_metrics_endpoint_reports_per_route_instrumentation(client, db):
+    user = {"username": "metered", "email": "metered@example.com", "password": "Secure123",
+            "first_name": "Met", "last_name": "Ered"}
+    assert client.post("/users/", json=user).status_code == 200
+    assert client.get("/users/metered").status_code == 200
+    assert client.get("/no/such/path").status_code == 404
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    samples = {}
+    for line in response.text.splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            samples[name] = float(value)
+
+    # route templates, not raw paths, label the series
+    assert samples['app_request_duration_seconds_count{method="POST",route="/users/",status="200"}'] >= 1
+    assert samples['app_request_duration_seconds_count{method="GET",route="/users/{username}",status="200"}'] >= 1
+    assert samples['app_request_duration_seconds_count{method="GET",route="unmatched",status="404"}'] >= 1
+    assert samples['app_request_db_queries_sum{method="POST",route="/users/"}'] > 0
+    assert samples['app_request_db_seconds_total{method="POST",route="/users/"}'] > 0
+    assert samples['app_request_framework_seconds_total{method="POST",route="/users/"}'] > 0
+    assert samples['app_request_hashing_seconds_total{method="POST",route="/users/"}'] > 0
+    assert samples["app_bcrypt_duration_seconds_count"] >= 1
@@ -0,0 +1,79 @@
+# tests/integration/test_query_counts.py
+"""
+Query budget per endpoint: any N+1 (e.g. a lazy load per user) changes the
+count and fails here.
+"""
+import pytest
+
+from app.models.user import User
+from app.operations.calculation_bulk import bulk_insert_calculations
+from app.operations.user_cache import user_cache
+from tests.conftest import async_engine
+
+
+def seed_users(db, users: int, calculations: int):
+    for i in range(users):
+        user = User(first_name="Q", last_name="User", username=f"q{i:02d}", email=f"q{i:02d}@example.com",
+                    password_hash="not-a-real-hash")
+        db.add(user)
+        db.commit()
+        bulk_insert_calculations(db, (
+            {"a": float(n), "b": 2.0, "type": "add", "result": n + 2.0, "user_id": user.id}
+            for n in range(calculations)
+        ))
+    user_cache.clear()
+    return db.query(User).filter(User.username == "q00").one()
+
+
+@pytest.mark.parametrize("users", [1, 10])
+def test_user_list_with_calculations_is_two_queries_for_any_page_size(client, db, assert_num_queries, users):
+    seed_users(db, users, calculations=30)
+    with assert_num_queries(2):
+        response = client.get("/users/", params={"calculations_limit": 5})
+    assert response.status_code == 200, response.text
+    items = response.json()["items"]
+    assert len(items) == users
+    assert all(len(item["calculations"]) == 5 and item["calculations_truncated"] for item in items)
+
+
+def test_user_with_calculations_endpoint(client, db, assert_num_queries):
+    user = seed_users(db, 1, calculations=3)
+    with assert_num_queries(2):
+        body = client.get("/users/q00/with-calculations").json()
+    assert len(body["calculations"]) == 3
+    assert body["calculations_truncated"] is False
+
+    # capped: the rest continues through the calculation list endpoint
+    capped = client.get("/users/q00/with-calculations", params={"calculations_limit": 2}).json()
+    assert capped["calculations_truncated"] is True
+    rest = client.get("/calculations/", params={
+        "user_id": str(user.id), "cursor": capped["calculations_next_cursor"],
+    }).json()["items"]
+    seen = [c["id"] for c in capped["calculations"] + rest]
+    assert sorted(seen) == sorted(c["id"] for c in body["calculations"])
+
+    assert client.get("/users/q00/with-calculations", params={"calculations_limit": 1000}).status_code == 422
+    assert client.get("/users/nobody/with-calculations").status_code == 404
+
+
+def test_read_user_hits_the_database_once_then_the_cache(client, db, assert_num_queries):
+    seed_users(db, 1, calculations=3)
+    with assert_num_queries(1):
+        assert client.get("/users/q00").status_code == 200
+    with assert_num_queries(0):
+        assert client.get("/users/q00").status_code == 200
+
+
+def test_async_read_user_query_count(client, db, assert_num_queries):
+    seed_users(db, 1, calculations=3)
+    with assert_num_queries(1, bind=async_engine.sync_engine):
+        assert client.get("/async/users/q00").status_code == 200
+
+
+def test_calculation_list_and_read_query_counts(client, db, assert_num_queries):
+    user = seed_users(db, 1, calculations=30)
+    with assert_num_queries(1):
+        page = client.get("/calculations/", params={"user_id": str(user.id), "limit": 10}).json()
+    assert len(page["items"]) == 10
+    with assert_num_queries(1):
+        assert client.get(f"/calculations/{page['items'][0]['id']}").status_code == 200
@@ -1,6 +1,18 @@
 # tests/integration/test_user_ops.py
+import asyncio
+
 from app.schemas.base import UserCreate
-from app.operations.user import create_user, get_user_by_username
+from app.models.user import User
+from app.operations.user import (
+    create_user,
+    create_users_bulk,
+    get_user_by_id,
+    get_user_by_username,
+    create_user_async,
+    get_user_by_username_async,
+)
+from app.operations.user_cache import user_cache
+from tests.conftest import TestingAsyncSessionLocal
 
 def test_create_and_retrieve_user(db):
     data = UserCreate(
@@ -22,3 +34,74 @@ def test_create_and_retrieve_user(db):
 
 def test_user_not_found_returns_none(db):
     assert get_user_by_username(db, "ghost_user") is None
+
+
+def test_create_and_retrieve_user_async(db):
+    data = UserCreate(
+        first_name="Bob",
+        last_name="Async",
+        email="bob@example.com",
+        username="bobasync",
+        password="Secure123"
+    )
+
+    async def scenario():
+        async with TestingAsyncSessionLocal() as session:
+            created = await create_user_async(session, data)
+            fetched = await get_user_by_username_async(session, "bobasync")
+            missing = await get_user_by_username_async(session, "ghost_user")
+        return created, fetched, missing
+
+    created, fetched, missing = asyncio.run(scenario())
+
+    assert fetched is not None
+    assert fetched.id == created.id
+    assert missing is None
+    # visible to the sync session too
+    assert get_user_by_username(db, "bobasync").email == "bob@example.com"
+
+
+def test_user_lookups_are_cached_and_invalidated_on_update(db):
+    data = UserCreate(
+        first_name="Cache",
+        last_name="User",
+        email="cache@example.com",
+        username="cacheuser",
+        password="StrongPass123",
+    )
+    assert get_user_by_username(db, "cacheuser") is None  # cached 404...
+    created = create_user(db, data)  # ...cleared by the insert
+    assert get_user_by_username(db, "cacheuser").id == created.id
+    assert get_user_by_id(db, created.id).username == "cacheuser"
+    assert user_cache.stats()["hits"] >= 2
+
+    user = db.get(User, created.id)
+    user.username = "renamed"
+    db.commit()
+
+    assert get_user_by_username(db, "cacheuser") is None
+    assert get_user_by_id(db, created.id).username == "renamed"
+
+
+def test_create_users_bulk_reports_per_row_status(db):
+    def make(name, email=None):
+        return UserCreate(first_name="Bulk", last_name="User", username=name,
+                          email=email or f"{name}@example.com", password="Secure123")
+
+    create_user(db, make("existing"))
+    assert get_user_by_username(db, "newbie") is None  # cached 404
+
+    result = create_users_bulk(db, [
+        make("newbie"),
+        make("existing"),                           # taken in the database
+        make("other", email="newbie@example.com"),  # repeats row 0's email
+        make("second"),
+    ])
+
+    assert [r.status for r in result.results] == ["created", "conflict", "duplicate", "created"]
+    assert (result.created, result.conflicts) == (2, 2)
+    assert result.rows_per_second > 0
+
+    fetched = get_user_by_username(db, "newbie")
+    assert fetched.id == result.results[0].id
+    assert db.get(User, fetched.id).verify_password("Secure123")
@@ -0,0 +1,66 @@
+import uuid
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from app.operations.calculation_batch import CalculationBatch
+from app.schemas.calculation import CalculationRead
+
+
+def test_from_columns_encodes_types_and_expressions():
+    batch = CalculationBatch.from_columns(
+        [1, 2, 3, 4], [2, 0, 3, 5], ["Add", "divide", "expression", "add"],
+        [None, None, "a * b", None],
+    )
+
+    assert batch.type_code.dtype == np.uint8
+    assert batch.type_names == ["add", "divide", "expression"]
+    assert batch.types.tolist() == ["add", "divide", "expression", "add"]
+    assert batch.expressions == [None, None, "a * b", None]
+    assert batch.nbytes == 4 * 70  # bytes per row across all columns
+
+
+def test_compute_fills_results_and_reports_errors():
+    batch = CalculationBatch.from_columns([6, 1, 2], [3, 0, 5], ["divide", "divide", "expression"],
+                                          [None, None, "a + b * 2"])
+    errors = batch.compute()
+
+    assert errors.tolist() == [False, True, False]
+    assert batch.has_result.tolist() == [True, False, True]
+    assert batch.columns()["result"] == [2.0, None, 12.0]
+
+
+def test_from_columns_rejects_invalid_input():
+    with pytest.raises(ValueError, match="type must be one of"):
+        CalculationBatch.from_columns([1], [2], ["pow2"])
+    with pytest.raises(ValueError, match="same length"):
+        CalculationBatch.from_columns([1, 2], [2], ["add", "add"])
+    with pytest.raises(ValueError, match="expression is required"):
+        CalculationBatch.from_columns([1], [2], ["expression"])
+
+
+def test_assign_ids_and_mask():
+    user_id = uuid.uuid4()
+    batch = CalculationBatch.from_columns([1, 2, 3], [1, 1, 1], ["add"] * 3, user_id=user_id)
+    batch.assign_ids()
+
+    ids = batch.columns()["id"]
+    assert len(set(ids)) == 3 and all(i.version == 4 for i in ids)
+    subset = batch[np.array([True, False, True])]
+    assert subset.a.tolist() == [1.0, 3.0]
+    assert subset.columns()["user_id"] == [user_id, user_id]
+    assert not np.isnat(subset.created_at).any()
+
+
+def test_round_trip_calculation_read():
+    reads = [
+        CalculationRead(id=uuid.uuid4(), a=1, b=2, type="add", result=3.0, user_id=None,
+                        created_at=datetime(2024, 1, 1, 12, 0)),
+        CalculationRead(id=uuid.uuid4(), a=4, b=2, type="expression", expression="a - b",
+                        result=None, user_id=uuid.uuid4(), created_at=datetime(2024, 1, 2)),
+    ]
+
+    batch = CalculationBatch.from_reads(reads)
+
+    assert batch.to_reads() == reads
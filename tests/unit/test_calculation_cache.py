@@ -0,0 +1,91 @@
+import time
+
+import pytest
+
+from app.operations.calculation_cache import (
+    CalculationCache,
+    LocalSharedBackend,
+    LRUCache,
+)
+from app.operations.registry import Operation, operation_registry
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "a" is now most recent
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_lru_ttl_expiry():
+    cache = LRUCache(maxsize=10, ttl=0.01)
+    cache.set("a", 1)
+    time.sleep(0.02)
+    assert cache.get("a") is None
+    assert cache.stats()["misses"] == 1
+
+
+def test_calculation_cache_counts_hits_and_misses():
+    cache = CalculationCache(maxsize=100)
+    assert cache.compute("add", 2, 3) == 5
+    assert cache.compute("ADD", 2.0, 3.0) == 5
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+
+
+def test_calculation_cache_does_not_cache_errors():
+    cache = CalculationCache(maxsize=100)
+    with pytest.raises(ValueError):
+        cache.compute("divide", 1, 0)
+    assert len(cache.local) == 0
+
+
+def test_calculation_cache_uses_shared_backend():
+    backend = LocalSharedBackend()
+    first = CalculationCache(maxsize=100, ttl=60, backend=backend)
+    second = CalculationCache(maxsize=100, ttl=60, backend=backend)
+
+    assert first.compute("multiply", 3, 4) == 12
+    # second process-local cache misses locally but hits the shared backend
+    assert second.compute("multiply", 3, 4) == 12
+    assert second.stats()["shared_hits"] == 1
+    assert second.compute("multiply", 3, 4) == 12
+    assert second.stats()["hits"] == 1
+
+
+def test_calculation_cache_keys_follow_registry_version():
+    class Twice(Operation):
+        @staticmethod
+        def compute(a, b):
+            return 2 * a
+
+    class Thrice(Operation):
+        @staticmethod
+        def compute(a, b):
+            return 3 * a
+
+    backend = LocalSharedBackend()
+    cache = CalculationCache(maxsize=100, backend=backend)
+    operation_registry.register("scale", Twice)
+    try:
+        assert cache.compute("scale", 5, 0) == 10
+        assert cache.compute("expression", 5, 0, "scale(a, b) + 1") == 11
+        operation_registry.unregister("scale")
+        with pytest.raises(ValueError):
+            cache.compute("scale", 5, 0)
+        operation_registry.register("scale", Thrice)
+        # neither the local LRU nor the shared backend serve the old plugin's result
+        assert cache.compute("scale", 5, 0) == 15
+        assert cache.compute("expression", 5, 0, "scale(a, b) + 1") == 16
+        assert cache.stats()["shared_hits"] == 0
+    finally:
+        operation_registry.unregister("scale")
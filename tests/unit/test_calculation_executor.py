@@ -0,0 +1,41 @@
+import pytest
+
+from app.operations.calculation_executor import CalculationExecutor
+from app.operations.calculation_factory import CalculationFactory
+
+
+@pytest.fixture(scope="module")
+def executor():
+    executor = CalculationExecutor(workers=2, min_rows=10, shard_rows=7)
+    yield executor
+    executor.shutdown()
+
+
+def test_parallel_matches_in_process(executor):
+    a = [float(i) for i in range(50)]
+    b = [float(i % 3) for i in range(50)]
+    types = ["add", "sub", "multiply", "divide", "expression"] * 10
+    expressions = [None, None, None, None, "a * b + 1"] * 10
+
+    parallel = executor.compute_batch(a, b, types, expressions)
+    inline = CalculationFactory.compute_batch(a, b, types, expressions)
+
+    assert parallel.errors.tolist() == inline.errors.tolist()
+    ok = ~inline.errors
+    assert parallel.results[ok].tolist() == inline.results[ok].tolist()
+    assert parallel.errors.any()  # some divide rows have b == 0
+
+
+def test_small_batches_stay_in_process():
+    result = CalculationExecutor(workers=4, min_rows=100).compute_batch([1.0], [2.0], ["add"])
+    assert result.results.tolist() == [3.0]
+
+
+def test_invalid_type_raises_before_dispatch(executor):
+    with pytest.raises(ValueError, match="Invalid calculation type"):
+        executor.compute_batch([1.0] * 20, [2.0] * 20, ["bogus"] * 20)
+
+
+def test_length_mismatch_raises(executor):
+    with pytest.raises(ValueError, match="same length"):
+        executor.compute_batch([1.0] * 20, [2.0] * 19, ["add"] * 20)
@@ -25,3 +25,46 @@ def test_factory_divide():
 def test_factory_invalid_type():
     with pytest.raises(ValueError):
         CalculationFactory.create("invalid")
+
+
+def test_factory_compute_batch_mixed_types():
+    batch = CalculationFactory.compute_batch(
+        [3, 5, 3, 10, 7],
+        [2, 2, 4, 2, 1],
+        ["add", "sub", "multiply", "divide", "ADD"],
+    )
+    assert batch.results.tolist() == [5, 3, 12, 5, 8]
+    assert not batch.errors.any()
+
+
+def test_factory_compute_batch_divide_by_zero_is_masked():
+    batch = CalculationFactory.compute_batch([10, 1, 4], [2, 0, 2], ["divide"] * 3)
+    assert batch.errors.tolist() == [False, True, False]
+    assert batch.results[0] == 5
+    assert batch.results[2] == 2
+
+
+def test_factory_compute_batch_empty():
+    batch = CalculationFactory.compute_batch([], [], [])
+    assert len(batch.results) == 0
+    assert len(batch.errors) == 0
+
+
+def test_factory_compute_batch_invalid_type():
+    with pytest.raises(ValueError):
+        CalculationFactory.compute_batch([1], [2], ["invalid"])
+
+
+def test_factory_compute_batch_length_mismatch():
+    with pytest.raises(ValueError):
+        CalculationFactory.compute_batch([1, 2], [2], ["add", "add"])
+
+
+def test_factory_compute_rows_carries_each_failure_reason():
+    rows = CalculationFactory.compute_rows(
+        [1, 6, 2, 5], [0, 3, 0, 1], ["divide", "divide", "invalid", "expression"], [None, None, None, "a / (b - 1)"]
+    )
+    assert rows.results == [None, 2.0, None, None]
+    assert rows.errors == [
+        "Cannot divide by zero", None, "Invalid calculation type: invalid", "Cannot divide by zero",
+    ]
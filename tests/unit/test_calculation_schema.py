@@ -1,9 +1,13 @@
 import pytest
 from uuid import uuid4
+from pydantic import ValidationError
 from app.schemas.calculation import (
+    CalculationBatchRequest,
     CalculationCreate,
-    CalculationRead
+    CalculationRead,
+    calculation_create_list,
 )
+from app.schemas.job import JobCreate
 
 
 def test_valid_calculation_schema():
@@ -27,3 +31,50 @@ def test_optional_user_id():
     user_id = uuid4()
     calc = CalculationCreate(a=5, b=2, type="multiply", user_id=user_id)
     assert calc.user_id == user_id
+
+
+def test_expression_schema_requires_valid_expression():
+    calc = CalculationCreate(a=2, b=3, type="Expression", expression="a * b + 1")
+    assert calc.type == "expression"
+
+    with pytest.raises(ValueError):
+        CalculationCreate(a=2, b=3, type="expression")
+
+    with pytest.raises(ValueError):
+        CalculationCreate(a=2, b=3, type="expression", expression="a ** b")
+
+
+def test_expression_may_only_use_a_and_b():
+    with pytest.raises(ValidationError, match="Unknown variable\\(s\\) in expression: c, x"):
+        CalculationCreate(a=2, b=3, type="expression", expression="a * x + c")
+
+    batch = dict(a=[1, 2], b=[3, 4], type=["add", "expression"], expression=[None, "a + z"])
+    with pytest.raises(ValidationError, match="Unknown variable\\(s\\) in expression: z"):
+        CalculationBatchRequest(**batch)
+    with pytest.raises(ValidationError, match="Unknown variable\\(s\\) in expression: z"):
+        JobCreate(**batch)
+
+
+def test_type_normalized_and_error_messages_unchanged():
+    assert CalculationCreate(a=1, b=2, type="  MULTIPLY ").type == "multiply"
+
+    with pytest.raises(ValidationError) as exc:
+        CalculationCreate(a=1, b=2, type="pow")
+    (err,) = exc.value.errors()
+    assert err["loc"] == ()
+    assert err["msg"] == "Value error, type must be one of: add, divide, expression, multiply, sub"
+
+    with pytest.raises(ValidationError) as exc:
+        CalculationCreate(a=1, b=0, type="Divide")
+    assert exc.value.errors()[0]["msg"] == "Value error, Cannot divide by zero"
+
+
+def test_create_list_adapter_validates_in_one_call():
+    validated = calculation_create_list.validate_python(
+        [{"a": 1, "b": 2, "type": "ADD"}, {"a": 3, "b": 4, "type": "sub"}]
+    )
+    assert [calc.type for calc in validated] == ["add", "sub"]
+
+    with pytest.raises(ValidationError) as exc:
+        calculation_create_list.validate_python([{"a": 1, "b": 2, "type": "add"}, {"a": 1, "b": 0, "type": "divide"}])
+    assert exc.value.errors()[0]["loc"] == (1,)
@@ -1,6 +1,14 @@
 from app.dependencies import get_db
 from sqlalchemy.orm import Session
-from app.database import get_engine, SessionLocal
+from app.config import settings
+from app.database import (
+    get_engine,
+    get_async_engine,
+    get_async_url,
+    engine_options,
+    pool_status,
+    SessionLocal,
+)
 
 def test_get_db_returns_session():
     gen = get_db()
@@ -16,3 +24,36 @@ def test_session_local_creates_session():
     session = SessionLocal()
     assert session is not None
     session.close()
+
+def test_engine_options_include_pool_settings_for_postgres():
+    options = engine_options("postgresql://user:pw@localhost:5432/db")
+    assert options["pool_size"] == settings.DB_POOL_SIZE
+    assert options["max_overflow"] == settings.DB_MAX_OVERFLOW
+    assert options["pool_timeout"] == settings.DB_POOL_TIMEOUT
+    assert options["pool_pre_ping"] == settings.DB_POOL_PRE_PING
+    assert options["echo"] == settings.DB_ECHO
+
+def test_engine_options_skip_pool_sizing_for_sqlite():
+    options = engine_options("sqlite:///./test.db")
+    assert "pool_size" not in options
+    assert "max_overflow" not in options
+
+def test_pool_status_reports_checked_out_connections():
+    sqlite_engine = get_engine("sqlite:///./test.db")
+    conn = sqlite_engine.connect()
+    try:
+        status = pool_status(sqlite_engine)
+        assert status["checkedout"] == 1
+    finally:
+        conn.close()
+    assert pool_status(sqlite_engine)["checkedout"] == 0
+    sqlite_engine.dispose()
+
+def test_get_async_url_maps_drivers():
+    assert get_async_url("postgresql://u:p@localhost:5432/db") == "postgresql+asyncpg://u:p@localhost:5432/db"
+    assert get_async_url("postgresql+psycopg2://u:p@h/db") == "postgresql+asyncpg://u:p@h/db"
+    assert get_async_url("sqlite:///./test.db") == "sqlite+aiosqlite:///./test.db"
+
+def test_get_async_engine_returns_async_engine():
+    async_engine = get_async_engine("sqlite:///./test.db")
+    assert "AsyncEngine" in str(type(async_engine))
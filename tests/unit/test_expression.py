@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from app.models.calculation import Calculation
+from app.operations.calculation_factory import CalculationFactory
+
+
+def test_expression_scalar_evaluation():
+    expr = CalculationFactory.create("expression", "a * (b + 2) - -a / 2")
+    assert expr.variables == ("a", "b")
+    assert expr.compute(4, 1) == 4 * 3 + 2
+    assert expr.evaluate(a=4, b=1) == 14
+
+
+def test_expression_calls_registered_operations_by_name():
+    expr = CalculationFactory.create("expression", "multiply(add(x, 1), y)")
+    assert expr.evaluate(x=2, y=5) == 15
+
+
+def test_expression_is_compiled_once_and_cached():
+    first = CalculationFactory.create("expression", "a + b * 3")
+    second = CalculationFactory.create("expression", "a + b * 3")
+    assert first is second
+
+
+def test_expression_batch_evaluation_masks_errors():
+    expr = CalculationFactory.create("expression", "x / (y - 1) + 1")
+    results, errors = expr.evaluate_batch({"x": [2, 5, 9], "y": [3, 1, 4]})
+    assert errors.tolist() == [False, True, False]
+    assert results[0] == 2
+    assert np.isnan(results[1])
+    assert results[2] == 4
+
+
+def test_expression_constant_only_batch():
+    results, errors = CalculationFactory.create("expression", "2 * 3").evaluate_batch({})
+    assert results.tolist() == [6]
+    assert not errors.any()
+
+
+def test_expression_scalar_divide_by_zero_raises():
+    with pytest.raises(ValueError):
+        CalculationFactory.create("expression", "a / b").compute(1, 0)
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "",
+        "a ** b",
+        "__import__('os').system('ls')",
+        "a.real",
+        "power(a, b)",
+        "add(a)",
+        "'text' + a",
+        "a +",
+        "+".join(["a"] * 300),
+        "a + " + "9" * 400,
+    ],
+)
+def test_expression_rejects_unsafe_or_invalid_input(source):
+    with pytest.raises(ValueError):
+        CalculationFactory.create("expression", source)
+
+
+def test_expression_missing_variable():
+    with pytest.raises(ValueError):
+        CalculationFactory.create("expression", "a + c").compute(1, 2)
+
+
+def test_expression_requires_source():
+    with pytest.raises(ValueError):
+        CalculationFactory.create("expression")
+
+
+def test_compute_batch_groups_by_expression():
+    batch = CalculationFactory.compute_batch(
+        [1, 2, 3, 4],
+        [1, 2, 0, 4],
+        ["add", "expression", "expression", "expression"],
+        [None, "a * b", "a / b", "a * b"],
+    )
+    assert batch.errors.tolist() == [False, False, True, False]
+    assert batch.results[[0, 1, 3]].tolist() == [2, 4, 16]
+
+
+def test_model_compute_result_for_expression():
+    calc = Calculation(a=3, b=4, type="expression", expression="a * a + b * b")
+    assert calc.compute_result() == 25
@@ -0,0 +1,61 @@
+import asyncio
+
+from app.hashing import PasswordHasher, bcrypt_safe, password_hasher
+from app.models.user import User
+
+
+def test_bcrypt_safe_truncates_to_72_bytes():
+    assert len(bcrypt_safe("x" * 100).encode("utf-8")) == 72
+    # multi-byte char split at the boundary is dropped, not mangled
+    assert bcrypt_safe("a" * 71 + "é") == "a" * 71
+
+
+def test_hasher_hash_and_verify_blocking():
+    hasher = PasswordHasher(max_workers=2, rounds=4)
+    try:
+        hashed = hasher.hash("Secure123")
+        assert hasher.verify("Secure123", hashed)
+        assert not hasher.verify("Wrong123", hashed)
+        assert hasher.context.identify(hashed) == "bcrypt"
+    finally:
+        hasher.shutdown()
+
+
+def test_hasher_hash_many_keeps_order():
+    hasher = PasswordHasher(max_workers=3, rounds=4)
+    passwords = [f"Secret{i}" for i in range(6)]
+    try:
+        hashes = hasher.hash_many(passwords)
+        assert all(hasher.verify(p, h) for p, h in zip(passwords, hashes))
+        assert hasher.stats()["completed"] == 12
+    finally:
+        hasher.shutdown()
+
+
+def test_hasher_async_api_and_stats():
+    hasher = PasswordHasher(max_workers=2, rounds=4)
+
+    async def scenario():
+        hashes = await asyncio.gather(*(hasher.hash_async(f"Secure{i}A") for i in range(4)))
+        ok = await hasher.verify_async("Secure0A", hashes[0])
+        return hashes, ok
+
+    try:
+        hashes, ok = asyncio.run(scenario())
+        assert ok
+        assert len(set(hashes)) == 4
+
+        stats = hasher.stats()
+        assert stats["completed"] == 5
+        assert stats["queue_depth"] == 0
+        assert stats["running"] == 0
+        assert stats["max_seconds"] >= stats["mean_seconds"] > 0
+    finally:
+        hasher.shutdown()
+
+
+def test_user_verify_password_async():
+    user = User(password_hash=User.hash_password("Secure123"))
+    assert asyncio.run(user.verify_password_async("Secure123"))
+    assert not asyncio.run(user.verify_password_async("Nope1234"))
+    assert password_hasher.stats()["completed"] > 0
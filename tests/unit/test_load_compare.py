@@ -0,0 +1,20 @@
+# tests/unit/test_load_compare.py
+from benchmarks.load import compare
+
+
+def result(p50_ms, rps):
+    return {"p50_ms": p50_ms, "rps": rps}
+
+
+def test_compare_flags_latency_and_throughput_regressions():
+    baseline = {"compute": result(10.0, 100.0), "list": result(20.0, 50.0), "gone": result(1.0, 1.0)}
+    current = {"compute": result(12.0, 100.0), "list": result(20.0, 40.0), "new": result(5.0, 5.0)}
+
+    regressions = compare(current, baseline, threshold=0.15)
+    assert [(r.scenario, r.metric) for r in regressions] == [("compute", "p50_ms"), ("list", "rps")]
+    assert round(regressions[0].change, 2) == 0.2
+
+
+def test_compare_tolerates_changes_within_threshold():
+    baseline = {"compute": result(10.0, 100.0)}
+    assert compare({"compute": result(11.0, 91.0)}, baseline, threshold=0.15) == []
@@ -0,0 +1,85 @@
+# tests/unit/test_metrics.py
+import logging
+
+from sqlalchemy import create_engine, text
+
+from app.metrics import Counter, Histogram, RequestStats, _current, metrics, set_enabled
+
+
+def test_histogram_renders_cumulative_buckets():
+    hist = Histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 5.0):
+        hist.observe(value, "/a")
+
+    lines = list(hist.render())
+    assert "# TYPE latency_seconds histogram" in lines
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{route="/a",le="1.0"} 3' in lines
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 4' in lines
+    assert 'latency_seconds_sum{route="/a"} 6.05' in lines
+    assert 'latency_seconds_count{route="/a"} 4' in lines
+
+
+def test_counter_accumulates_per_label_set():
+    counter = Counter("db_seconds_total", "DB time.", ("route",))
+    counter.inc(0.25, "/a")
+    counter.inc(0.25, "/a")
+    counter.inc(1, "/b")
+
+    lines = list(counter.render())
+    assert 'db_seconds_total{route="/a"} 0.5' in lines
+    assert 'db_seconds_total{route="/b"} 1' in lines
+
+
+def test_cursor_events_feed_the_current_request():
+    engine = create_engine("sqlite://")
+    stats = RequestStats()
+    token = _current.set(stats)
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+    finally:
+        _current.reset(token)
+
+    assert stats.db_queries == 2
+    assert stats.db_seconds > 0
+
+
+def test_slow_query_log_is_opt_in(monkeypatch, caplog):
+    engine = create_engine("sqlite://")
+    caplog.set_level(logging.WARNING, logger="app.slow_query")
+
+    monkeypatch.setattr(metrics, "slow_query_ms", None)
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    assert not caplog.records
+
+    monkeypatch.setattr(metrics, "slow_query_ms", 0.0)
+    with engine.connect() as conn:
+        conn.execute(text("SELECT  42"))
+    assert any("slow query" in r.getMessage() and "SELECT 42" in r.getMessage() for r in caplog.records)
+
+
+def test_failed_statement_leaves_no_state_on_the_connection():
+    engine = create_engine("sqlite://")
+    with engine.connect() as conn:
+        try:
+            conn.execute(text("SELECT * FROM no_such_table"))
+        except Exception:
+            pass
+        assert not any(key.startswith("query") for key in conn.info)
+
+
+def test_disabling_detaches_cursor_listeners():
+    engine = create_engine("sqlite://")
+    stats = RequestStats()
+    token = _current.set(stats)
+    try:
+        set_enabled(False)
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    finally:
+        set_enabled(True)
+        _current.reset(token)
+    assert stats.db_queries == 0
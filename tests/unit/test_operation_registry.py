@@ -0,0 +1,113 @@
+import math
+from importlib.metadata import EntryPoint
+
+import numpy as np
+import pytest
+
+from app.models.calculation import Calculation
+from app.operations import registry as registry_module
+from app.operations.calculation_factory import CalculationFactory
+from app.operations.calculation_ops import AddOperation
+from app.operations.registry import Operation, OperationRegistry, operation_registry
+from app.schemas.calculation import CalculationCreate
+
+
+class PowerOperation(Operation):
+    @staticmethod
+    def compute(a, b):
+        return a ** b
+
+    @staticmethod
+    def compute_batch(a, b):
+        return np.power(a, b), np.zeros(len(a), dtype=bool)
+
+
+class SqrtOperation(Operation):
+    """Unary, scalar-only: relies on the fallback batch kernel."""
+    arity = 1
+
+    @staticmethod
+    def check_domain(a, b):
+        if a < 0:
+            raise ValueError("Cannot take the square root of a negative number")
+
+    @staticmethod
+    def compute(a, b=None):
+        SqrtOperation.check_domain(a, b)
+        return math.sqrt(a)
+
+
+@pytest.fixture
+def plugin_ops():
+    operation_registry.register("power", PowerOperation)
+    operation_registry.register("sqrt", SqrtOperation)
+    yield
+    operation_registry.unregister("power")
+    operation_registry.unregister("sqrt")
+
+
+def test_builtins_are_registered():
+    assert set(operation_registry) >= {"add", "sub", "multiply", "divide"}
+    assert CalculationFactory.operation_map["add"] is AddOperation
+    assert "ADD" in operation_registry
+
+
+def test_plugin_operation_reaches_all_dispatch_sites(plugin_ops):
+    assert CalculationFactory.create("power").compute(2, 10) == 1024
+    assert CalculationCreate(a=2, b=3, type="Power").type == "power"
+    assert Calculation(a=16, b=0, type="sqrt").compute_result() == 4
+    assert CalculationFactory.create("expression", "sqrt(a) + a ** 2").compute(4, 0) == 18
+
+
+def test_plugin_domain_check_in_schema_and_fallback_kernel(plugin_ops):
+    with pytest.raises(ValueError):
+        CalculationCreate(a=-1, b=0, type="sqrt")
+
+    batch = CalculationFactory.compute_batch([9, -1, 4], [0, 0, 0], ["sqrt"] * 3)
+    assert batch.errors.tolist() == [False, True, False]
+    assert batch.results[[0, 2]].tolist() == [3, 2]
+
+
+def test_unregistered_operation_is_rejected_everywhere():
+    with pytest.raises(ValueError):
+        CalculationFactory.create("power")
+    with pytest.raises(ValueError):
+        CalculationCreate(a=2, b=3, type="power")
+    with pytest.raises(ValueError):
+        CalculationFactory.create("expression", "a ** b")
+
+
+def test_expression_cache_invalidated_on_registry_change(plugin_ops):
+    assert CalculationFactory.create("expression", "a ** b").compute(2, 3) == 8
+    operation_registry.unregister("power")
+    with pytest.raises(ValueError):
+        CalculationFactory.create("expression", "a ** b")
+
+
+def test_register_validation():
+    registry = OperationRegistry(entry_point_group=None)
+    registry.register("add", AddOperation)
+    with pytest.raises(ValueError):
+        registry.register("add", PowerOperation)
+    registry.register("add", PowerOperation, replace=True)
+    assert registry["add"] is PowerOperation
+
+    with pytest.raises(ValueError):
+        registry.register("expression", PowerOperation)
+    with pytest.raises(ValueError):
+        registry.register("x" * 21, PowerOperation)
+    with pytest.raises(TypeError):
+        registry.register("broken", object)
+
+
+def test_entry_points_are_loaded_lazily(monkeypatch):
+    ep = EntryPoint(
+        name="power", value=f"{__name__}:PowerOperation", group="test.operations"
+    )
+    monkeypatch.setattr(
+        registry_module, "entry_points", lambda group: [ep] if group == "test.operations" else []
+    )
+    registry = OperationRegistry(entry_point_group="test.operations")
+
+    assert registry.get("power") is PowerOperation
+    assert list(registry) == ["power"]
@@ -0,0 +1,48 @@
+# tests/unit/test_partition_helpers.py
+from datetime import datetime
+
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
+
+from app.models.calculation import Calculation
+from app.operations.calculation_partitions import (
+    add_months,
+    apply_retention,
+    ensure_partitions,
+    month_start,
+    partition_ddl,
+    partition_month,
+    partition_name,
+)
+
+
+def test_month_arithmetic_crosses_years():
+    assert month_start(datetime(2026, 10, 18, 13, 5)) == datetime(2026, 10, 1)
+    assert add_months(datetime(2026, 11, 1), 3) == datetime(2027, 2, 1)
+    assert add_months(datetime(2026, 1, 1), -1) == datetime(2025, 12, 1)
+
+
+def test_partition_names_round_trip():
+    assert partition_name(datetime(2026, 3, 1)) == "calculations_y2026m03"
+    assert partition_month("calculations_y2026m03") == datetime(2026, 3, 1)
+    assert partition_month("calculations_default") is None
+
+
+def test_partition_ddl_covers_one_month():
+    assert partition_ddl(datetime(2026, 12, 1)) == (
+        "CREATE TABLE IF NOT EXISTS calculations_y2026m12 PARTITION OF calculations "
+        "FOR VALUES FROM ('2026-12-01 00:00:00') TO ('2027-01-01 00:00:00')"
+    )
+
+
+def test_postgresql_table_is_range_partitioned_by_created_at():
+    ddl = str(CreateTable(Calculation.__table__).compile(dialect=postgresql.dialect()))
+    assert "PARTITION BY RANGE (created_at)" in ddl
+    assert "PRIMARY KEY (id, created_at)" in ddl
+
+
+def test_sqlite_skips_partitions_and_retention_by_default():
+    engine = create_engine("sqlite://")
+    assert ensure_partitions(engine) == []
+    assert apply_retention(engine, keep_months=0) == []
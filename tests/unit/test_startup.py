@@ -0,0 +1,37 @@
+import os
+import subprocess
+import sys
+
+# Import the app in a fresh interpreter with a DATABASE_URL no driver can
+# handle: the import only succeeds if no engine is built at import time.
+SCRIPT = """
+import sys
+import app.main
+import app.database as database
+assert database._shared == {}, database._shared
+eager = {"psycopg2", "asyncpg", "aiosqlite", "passlib"} & set(sys.modules)
+assert not eager, eager
+"""
+
+
+def test_importing_app_builds_no_engines_or_drivers():
+    env = {**os.environ, "DATABASE_URL": "nosuchdriver://nowhere/db"}
+    proc = subprocess.run([sys.executable, "-c", SCRIPT], capture_output=True, text=True, env=env)
+    assert proc.returncode == 0, proc.stderr
+
+
+def test_engines_are_built_on_first_use():
+    import app.database as database
+
+    assert database.get_sessionmaker() is database.SessionLocal
+    assert database.default_engine() is database.engine
+    assert database.get_sessionmaker().kw["bind"] is database.engine
+
+
+def test_init_engines_builds_everything_from_scratch():
+    # sessionmakers build their engine while holding the build lock
+    env = {**os.environ, "DATABASE_URL": "sqlite:///./test.db"}
+    script = "import app.database as d; d.init_engines(); assert set(d._shared) == " \
+             "{'engine', 'SessionLocal', 'async_engine', 'AsyncSessionLocal'}"
+    proc = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, env=env, timeout=60)
+    assert proc.returncode == 0, proc.stderr
@@ -0,0 +1,108 @@
+import asyncio
+import threading
+import time
+import uuid
+from datetime import datetime
+
+import pytest
+
+from app.operations.user_cache import UserCache
+from app.schemas.user import UserRead
+
+
+def make_user(username="alice") -> UserRead:
+    now = datetime(2024, 1, 1)
+    return UserRead(id=uuid.uuid4(), username=username, email=f"{username}@example.com",
+                    first_name="A", last_name="B", is_active=True, created_at=now, updated_at=now)
+
+
+def test_read_through_hits_and_stats():
+    cache, user, loads = UserCache(maxsize=10), make_user(), []
+    key = cache.username_key("alice")
+
+    def load():
+        loads.append(1)
+        return user
+
+    assert cache.get(key, load) == user
+    assert cache.get(key, load) == user
+    assert cache.get(cache.id_key(user.id), load) == user  # cached under both keys
+
+    assert len(loads) == 1
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (2, 1)
+    assert stats["hit_ratio"] == pytest.approx(2 / 3)
+
+
+def test_negative_caching_and_put_clears_it():
+    cache, loads = UserCache(maxsize=10, negative_ttl=60), []
+    key = cache.username_key("ghost")
+
+    assert cache.get(key, lambda: loads.append(1)) is None
+    assert cache.get(key, lambda: loads.append(1)) is None
+    assert len(loads) == 1
+    assert cache.stats()["negative_hits"] == 1
+
+    user = make_user("ghost")
+    cache.put(user)
+    assert cache.get(key, lambda: None) == user
+
+
+def test_ttl_expiry():
+    cache, user = UserCache(maxsize=10, ttl=0.01), make_user()
+    key = cache.username_key("alice")
+    cache.put(user)
+    time.sleep(0.02)
+    assert cache.get(key, lambda: None) is None
+
+
+def test_concurrent_misses_share_one_load():
+    cache, user, loads = UserCache(maxsize=10), make_user(), []
+    key = cache.username_key("alice")
+    release = threading.Event()
+
+    def slow_load():
+        loads.append(1)
+        release.wait(1)
+        return user
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get(key, slow_load))) for _ in range(8)]
+    for t in threads:
+        t.start()
+    time.sleep(0.05)
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert len(loads) == 1
+    assert results == [user] * 8
+    assert cache.stats()["coalesced"] == 7
+
+
+def test_async_concurrent_misses_share_one_load():
+    cache, user, loads = UserCache(maxsize=10), make_user(), []
+    key = cache.username_key("alice")
+
+    async def load():
+        loads.append(1)
+        await asyncio.sleep(0.01)
+        return user
+
+    async def main():
+        return await asyncio.gather(*(cache.get_async(key, load) for _ in range(5)))
+
+    assert asyncio.run(main()) == [user] * 5
+    assert len(loads) == 1
+
+
+def test_invalidation_during_load_is_not_cached():
+    cache, user = UserCache(maxsize=10), make_user()
+    key = cache.username_key("alice")
+
+    def load():
+        cache.invalidate(usernames={"alice"})  # e.g. an update committed meanwhile
+        return user
+
+    assert cache.get(key, load) == user
+    assert cache.get(key, lambda: None) is None